@@ -364,8 +364,8 @@ class ApplePhotosDownloader:
         try:
             result = subprocess.run(
                 ['ping', '-c', '1', '-t', '2', 'www.icloud.com'],
-                capture_output=True,
-                text=True,
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL,
                 timeout=5
             )
             if result.returncode != 0:
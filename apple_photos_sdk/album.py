@@ -21,7 +21,7 @@ class AlbumManager:
         # Strip "Subject: " prefix if present
         if keyword.startswith("Subject: "):
             keyword = keyword[9:]
-        return any(keyword.startswith(prefix) for prefix in TARGETED_ALBUM_PREFIXES)
+        return keyword.startswith(TARGETED_ALBUM_PREFIXES)
         
     def _wait_for_changes(self) -> bool:
         """Wait for Photos library changes to complete."""
@@ -10,7 +10,7 @@ VIDEO_EXTENSIONS = {".mov", ".mp4", ".m4v", ".avi", ".mpg", ".mpeg", ".3gp", ".3
 DELETE_ORIGINAL = True
 
 # Keywords that indicate targeted albums (hierarchical keywords starting with top-level folder numbers)
-TARGETED_ALBUM_PREFIXES = ["01/", "02/", "03/", "04/"]
+TARGETED_ALBUM_PREFIXES = ("01/", "02/", "03/", "04/")
 
 # Maximum time to wait for Photos library changes to complete (in seconds)
 PHOTOS_CHANGE_TIMEOUT = 10
@@ -7,7 +7,12 @@ from pathlib import Path
 import subprocess
 from objc import autorelease_pool
 import threading
-import json
+
+try:
+    # Faster decoding of exiftool's JSON, as in utils.exiftool
+    from orjson import loads as json_loads
+except ImportError:
+    from json import loads as json_loads
 
 from Photos import (
     PHAsset,
@@ -45,6 +50,7 @@ from .config import (
     TARGETED_ALBUM_PREFIXES,
 )
 from .album import AlbumManager
+from utils.exiftool import get_session
 
 class ImportManager:
     """Manages photo import operations for Apple Photos."""
@@ -135,27 +141,25 @@ class ImportManager:
         # Strip "Subject: " prefix if present
         if keyword.startswith("Subject: "):
             keyword = keyword[9:]
-        return any(keyword.startswith(prefix) for prefix in TARGETED_ALBUM_PREFIXES)
+        return keyword.startswith(TARGETED_ALBUM_PREFIXES)
 
     def _get_original_keywords(self, photo_path: Path) -> list[str]:
         """Get keywords from original photo before import."""
         try:
-            import subprocess
-            
             # For videos, check the Apple Photos compatible fields our video processor writes to
             ext = photo_path.suffix.lower()
             if ext in ['.mp4', '.mov', '.m4v', '.mpg', '.mpeg']:
                 # Check the primary Apple Photos video keyword fields
-                cmd = ["exiftool", "-QuickTime:Keywords", "-XMP:Subject", "-IPTC:Keywords", "-s", "-s", "-sep", "||", str(photo_path)]
+                cmd = ["-QuickTime:Keywords", "-XMP:Subject", "-IPTC:Keywords", "-s", "-s", "-sep", "||", str(photo_path)]
             else:
                 # For images, use the original XMP Subject approach
-                cmd = ["exiftool", "-XMP:Subject", "-s", "-s", "-sep", "||", str(photo_path)]
+                cmd = ["-XMP:Subject", "-s", "-s", "-sep", "||", str(photo_path)]
                 
-            self.logger.debug(f"Running keyword extraction command: {' '.join(cmd)}")
-            result = subprocess.run(cmd, capture_output=True, text=True)
+            self.logger.debug("Running keyword extraction command: exiftool %s", cmd)
+            result = get_session().execute(cmd)
             
             if result.returncode == 0 and result.stdout.strip():
-                self.logger.debug(f"ExifTool keyword output: {result.stdout}")
+                self.logger.debug("ExifTool keyword output: %s", result.stdout)
                 
                 # Parse the output to extract keywords from any field that has them
                 keywords = []
@@ -173,16 +177,11 @@ class ImportManager:
                     keywords = [k.strip() for k in result.stdout.strip().split("||")]
                 
                 # Remove duplicates while preserving order
-                seen = set()
-                unique_keywords = []
-                for k in keywords:
-                    if k not in seen:
-                        unique_keywords.append(k)
-                        seen.add(k)
+                unique_keywords = list(dict.fromkeys(keywords))
                 
                 # Always strip 'Subject: ' prefix if present
                 normalized_keywords = [k[9:] if k.startswith("Subject: ") else k for k in unique_keywords]
-                self.logger.debug(f"Found original keywords: {normalized_keywords}")
+                self.logger.debug("Found original keywords: %s", normalized_keywords)
                 
                 # Check for targeted album keywords
                 targeted_keywords = [k for k in normalized_keywords if self._is_targeted_keyword(k)]
@@ -198,16 +197,14 @@ class ImportManager:
     def _get_original_location(self, photo_path: Path) -> CLLocation | None:
         """Get GPS coordinates from original photo before import."""
         try:
-            import subprocess
             import re
             
-            # Extract GPS coordinates using exiftool
-            cmd = ["exiftool", "-GPSLatitude", "-GPSLongitude", "-GPSLatitudeRef", "-GPSLongitudeRef", "-s", "-s", "-j", str(photo_path)]
-            result = subprocess.run(cmd, capture_output=True, text=True)
+            # Extract GPS coordinates using the shared exiftool session
+            cmd = ["-GPSLatitude", "-GPSLongitude", "-GPSLatitudeRef", "-GPSLongitudeRef", "-s", "-s", "-j", str(photo_path)]
+            result = get_session().execute(cmd)
             
             if result.returncode == 0 and result.stdout.strip():
-                import json
-                data = json.loads(result.stdout)
+                data = json_loads(result.stdout)
                 if not data or not isinstance(data, list) or len(data) == 0:
                     return None
                     
@@ -261,14 +258,12 @@ class ImportManager:
     def _get_original_title(self, photo_path: Path) -> str | None:
         """Get title from original photo before import."""
         try:
-            # Run exiftool to get title from the specific fields Apple Photos uses
-            import subprocess
-            cmd = ["exiftool", "-IPTC:ObjectName", "-XMP:Title", "-s", "-s", "-j", str(photo_path)]
-            result = subprocess.run(cmd, capture_output=True, text=True)
+            # Ask the shared exiftool session for the specific fields Apple Photos uses
+            cmd = ["-IPTC:ObjectName", "-XMP:Title", "-s", "-s", "-j", str(photo_path)]
+            result = get_session().execute(cmd)
             
             if result.returncode == 0 and result.stdout.strip():
-                import json
-                data = json.loads(result.stdout)
+                data = json_loads(result.stdout)
                 if not data or not isinstance(data, list) or len(data) == 0:
                     return None
                     
@@ -449,7 +444,8 @@ class ImportManager:
             self.logger.debug(f"Setting keywords on asset {asset_id} using AppleScript: {keywords}")
             result = subprocess.run(
                 ['osascript', '-e', applescript], 
-                capture_output=True, 
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.PIPE,
                 text=True,
                 timeout=30
             )
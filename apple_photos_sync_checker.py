@@ -83,8 +83,8 @@ def check_photos_sync_status():
     try:
         result = subprocess.run(
             ['ping', '-c', '1', '-t', '2', 'www.icloud.com'],
-            capture_output=True,
-            text=True
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL
         )
         if result.returncode != 0:
             status['potential_issues'].append("Cannot reach iCloud servers")
@@ -140,8 +140,8 @@ def check_photos_app_status():
     try:
         result = subprocess.run(
             ['pgrep', '-x', 'Photos'],
-            capture_output=True,
-            text=True
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL
         )
         indicators['photos_is_running'] = result.returncode == 0
     except:
@@ -354,7 +354,8 @@ class ApplePhotosUploader:
             # Run the AppleScript
             process = subprocess.run(
                 ['osascript', '-e', script],
-                capture_output=True,
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.PIPE,
                 text=True,
                 timeout=15
             )
@@ -384,17 +385,17 @@ class ApplePhotosUploader:
         try:
             # Method 1: Kill and restart photoanalysisd (triggers sync)
             logger.info("Restarting photo analysis daemon to trigger sync...")
-            subprocess.run(['killall', 'photoanalysisd'], capture_output=True)
+            subprocess.run(['killall', 'photoanalysisd'], stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
             time.sleep(2)
             
             # Method 2: Kill and restart cloudd (iCloud daemon)
             logger.info("Restarting iCloud daemon...")
-            subprocess.run(['killall', 'cloudd'], capture_output=True)
+            subprocess.run(['killall', 'cloudd'], stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
             time.sleep(2)
             
             # Method 3: Trigger Photos app to open (often triggers sync)
             logger.info("Opening Photos app to trigger sync...")
-            subprocess.run(['open', '-a', 'Photos'], capture_output=True)
+            subprocess.run(['open', '-a', 'Photos'], stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
             time.sleep(5)
             
             return True
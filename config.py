@@ -1,5 +1,6 @@
 #!/usr/bin/env python3
 
+import os
 from pathlib import Path
 
 # Directory paths
@@ -21,6 +22,9 @@ SLEEP_TIME = 10
 # All watchers will process up to this many items per cycle before yielding to the next watcher
 WATCHER_QUEUE_SIZE = 50
 
+# Worker processes used by watchers to process the files found in one scan
+WATCHER_MAX_WORKERS = os.cpu_count() or 1
+
 # Transfer batch size - number of files to collect before processing as a batch
 # Higher values improve Apple Photos import performance but use more memory
 TRANSFER_BATCH_SIZE = 10
@@ -7,10 +7,10 @@ Continuously monitors and reports file counts for:
 - Incoming directories: Ron_Incoming, Claudia_Incoming, Both_Incoming
 - Destination directories: Ron_Apple_Photos, Claudia_Transfer, iCloud_OldPhotographs
 
-Updates every few seconds to provide real-time visibility into the system.
+Updates as soon as files arrive (every few seconds at most) to provide real-time
+visibility into the system.
 """
 
-import time
 import logging
 from pathlib import Path
 from datetime import datetime
@@ -25,6 +25,7 @@ from config import (
     APPLE_PHOTOS_PATHS,
     ICLOUD_OLDPHOTOGRAPHS
 )
+from utils.file_events import FileEventMonitor
 
 
 class DirectoryMonitor:
@@ -155,10 +156,14 @@ class DirectoryMonitor:
         
     def run(self):
         """Run the monitor continuously."""
+        # Redraw when files arrive; sleep_time remains the refresh interval for
+        # deletions and for systems without watchdog
+        monitor = FileEventMonitor(self.directories.values())
+        monitor.start()
         try:
             while True:
                 self._print_status()
-                time.sleep(self.sleep_time)
+                monitor.wait(self.sleep_time)
                 
         except KeyboardInterrupt:
             print(f"\n🛑 Directory Monitor stopped by user")
@@ -166,6 +171,8 @@ class DirectoryMonitor:
         except Exception as e:
             self.logger.error(f"Monitor error: {e}")
             sys.exit(1)
+        finally:
+            monitor.stop()
 
 
 def main():
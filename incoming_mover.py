@@ -16,7 +16,6 @@ Only moves files that are not locked and have __LRE suffix.
 
 from pathlib import Path
 import logging
-import time
 import shutil
 import sys
 from typing import Optional, Dict
@@ -29,6 +28,7 @@ from config import (
     ICLOUD_TARGET_FILE_COUNT
 )
 from datetime import datetime, timedelta
+from utils.file_events import FileEventMonitor
 
 # Get Claudia's transfer directory from config
 CLAUDIA_TRANSFER = TRANSFER_PATHS[CLAUDIA_INCOMING]
@@ -342,14 +342,24 @@ class IncomingMover:
         print(f"\n🎬 INCOMING MOVER: Starting continuous monitoring...")
         print(f"Press Ctrl+C to stop")
         
+        # Wake when __LRE files land in a source directory; sleep_time remains the
+        # retry interval for files still too new or locked, and for the iCloud backfill
+        monitor = FileEventMonitor(self.transfer_paths.keys())
+        if monitor.start():
+            print(f"   👀 Event-driven: waking on new files (retry every {self.sleep_time} seconds)")
+        
         try:
             while True:
                 self.run_cycle()
-                time.sleep(self.sleep_time)
+                arrived = monitor.wait(self.sleep_time)
+                if arrived:
+                    self.logger.debug(f"Woken by {len(arrived)} file event(s)")
                 
         except KeyboardInterrupt:
             print(f"\n🛑 INCOMING MOVER: Stopping...")
             self.logger.info("Incoming mover stopped by user")
+        finally:
+            monitor.stop()
 
 
 def setup_logging(log_level: str = "INFO") -> None:
@@ -14,17 +14,123 @@ Outputs __LRE files ready for transfer to Apple Photos or other destinations.
 from pathlib import Path
 import logging
 import time
-import shutil
+import stat
 import sys
+import os
 from typing import Optional
 
 # Import processors
 from processors.jpeg_processor import JPEGExifProcessor
 from processors.video_processor import VideoProcessor
+from utils.file_events import FileEventMonitor
+from utils.watcher_mixins import BothIncomingMixin, DirectorySweepMixin, WorkerPoolMixin
 import config
 
+logger = logging.getLogger(__name__)
 
-class IncomingWatcher:
+# Lower-case file suffixes picked up by the directory scan
+JPEG_SUFFIXES = ('.jpg', '.jpeg')
+VIDEO_SUFFIXES = ('.mp4', '.mov', '.m4v', '.mpg', '.mpeg')
+
+
+def _process_jpeg(file_path: Path, sequence: str, exif_data: Optional[dict] = None) -> bool:
+    """Process a JPEG file with metadata extraction and renaming."""
+    try:
+        processor = JPEGExifProcessor(str(file_path), sequence=sequence, exif_data=exif_data)
+        new_path = processor.process_image()
+        
+        logger.info("JPEG processed successfully: %s", new_path)
+        print(f"      ✓ Processed to: {Path(new_path).name}")
+        return True
+        
+    except ValueError as e:
+        if "not ready for processing" in str(e):
+            logger.warning(f"JPEG file not ready, skipping: {file_path} - {e}")
+            print(f"      ⏳ File not ready - will retry later: {file_path.name}")
+            return False
+        else:
+            raise
+    except Exception as e:
+        logger.error(f"Error processing JPEG {file_path}: {e}")
+        print(f"      ❌ JPEG processing failed: {e}")
+        return False
+
+
+def _process_video(file_path: Path, sequence: str) -> bool:
+    """Process a video file with metadata extraction and renaming."""
+    try:
+        processor = VideoProcessor(str(file_path), sequence=sequence)
+        success = processor.process_video()
+        
+        if success:
+            # Get the new filename (processor renames the file)
+            new_name = processor.generate_filename()
+            new_path = file_path.parent / new_name
+            logger.info("Video processed successfully: %s", new_path)
+            print(f"      ✓ Processed to: {new_path.name}")
+            return True
+        else:
+            logger.warning(f"Video processing failed: {file_path}")
+            print(f"      ❌ Video processing failed: {file_path.name}")
+            return False
+            
+    except Exception as e:
+        logger.error(f"Error processing video {file_path}: {e}")
+        print(f"      ❌ Video processing failed: {e}")
+        return False
+
+
+def _process_file(file_path: Path, sequence: str, exif_data: Optional[dict] = None) -> bool:
+    """
+    Process a single file (JPEG or video).
+    
+    Args:
+        file_path: Path to the file to process
+        sequence: Sequence number for the filename
+        exif_data: JPEG metadata already read by the watcher's batched read, if any
+        
+    Returns:
+        bool: True if processing succeeded, False otherwise
+    """
+    if not file_path.is_file():
+        return False
+        
+    # Check for zero-byte files
+    if file_path.stat().st_size == 0:
+        logger.warning(f"Skipping zero-byte file: {str(file_path)}")
+        print(f"   ⚠️  Skipping zero-byte file: {file_path.name}")
+        return False
+        
+    try:
+        # Skip files that are already processed
+        if "__LRE" in file_path.name:
+            logger.debug("Skipping already processed file: %s", file_path)
+            return True
+            
+        print(f"   🎨 PROCESSING: {file_path.name}")
+        
+        # Process based on file type
+        suffix = file_path.suffix.lower()
+        if suffix in JPEG_SUFFIXES:
+            return _process_jpeg(file_path, sequence, exif_data)
+        elif suffix in VIDEO_SUFFIXES:
+            return _process_video(file_path, sequence)
+        else:
+            logger.debug("Unsupported file type: %s", file_path)
+            return False
+            
+    except Exception as e:
+        logger.error(f"Error processing file {file_path}: {e}")
+        print(f"   ❌ Error processing {file_path.name}: {e}")
+        return False
+
+
+def _process_file_worker(file_path: str, sequence: str, exif_data: Optional[dict] = None) -> bool:
+    """Process one incoming file in a worker process; must be module-level to pickle."""
+    return _process_file(Path(file_path), sequence, exif_data)
+
+
+class IncomingWatcher(WorkerPoolMixin, BothIncomingMixin, DirectorySweepMixin):
     """
     Standalone watcher for incoming directories that processes files independently.
     """
@@ -33,26 +139,38 @@ class IncomingWatcher:
                  ron_incoming: Optional[str] = None,
                  claudia_incoming: Optional[str] = None, 
                  both_incoming: Optional[str] = None,
-                 sleep_time: int = 10):
+                 sleep_time: int = 10,
+                 max_workers: Optional[int] = None):
         """Initialize the incoming watcher."""
         self.ron_incoming = Path(ron_incoming or config.RON_INCOMING)
         self.claudia_incoming = Path(claudia_incoming or config.CLAUDIA_INCOMING) 
         self.both_incoming = Path(both_incoming or config.BOTH_INCOMING)
         self.sleep_time = sleep_time
         
-        # File patterns
-        self.jpeg_patterns = ['*.[Jj][Pp][Gg]', '*.[Jj][Pp][Ee][Gg]']
-        self.video_patterns = ['*.mp4', '*.mov', '*.m4v', '*.mpg', '*.mpeg', '*.MP4', '*.MOV', '*.M4V', '*.MPG', '*.MPEG']
+        # Worker processes for files found in one directory sweep (1 = process inline)
+        self.max_workers = max_workers or config.WATCHER_MAX_WORKERS
+        self._executor = None
+        self._exiftool = None  # Session for the batched metadata reads, opened on first use
+        
+        # Lower-case file suffixes picked up by the directory scan
+        self.jpeg_suffixes = JPEG_SUFFIXES
+        self.video_suffixes = VIDEO_SUFFIXES
         
         # Incoming directories to process
         self.incoming_directories = [self.ron_incoming, self.claudia_incoming]
         
         # Setup logging
-        self.logger = logging.getLogger(__name__)
+        self.logger = logger
         
         # Sequence counter for filename uniqueness
         self._sequence_counter = 0
         
+        # (size, mtime) of Both_Incoming files seen on the previous pass
+        self._file_snapshots = {}
+        
+        # Directory mtimes (st_mtime_ns) from sweeps that left nothing to retry
+        self._dir_mtimes = {}
+        
         print(f"🚀 INCOMING WATCHER: Initialized")
         print(f"   📁 Ron Incoming: {self.ron_incoming}")
         print(f"   📁 Claudia Incoming: {self.claudia_incoming}")
@@ -71,31 +189,28 @@ class IncomingWatcher:
             tuple: (is_ready, reason)
         """
         try:
-            # Check if file exists
-            if not file_path.exists():
+            # One stat answers existence, file type, size and age
+            try:
+                stat_result = file_path.stat()
+            except FileNotFoundError:
                 return False, "File does not exist"
                 
             # Check if it's a regular file
-            if not file_path.is_file():
+            if not stat.S_ISREG(stat_result.st_mode):
                 return False, "Not a regular file"
                 
             # Check file size
-            file_size = file_path.stat().st_size
-            if file_size == 0:
+            if stat_result.st_size == 0:
                 return False, "Zero-byte file"
             
             # Check file age
-            import time
-            file_age = time.time() - file_path.stat().st_mtime
+            file_age = time.time() - stat_result.st_mtime
             if file_age < min_file_age:
                 return False, f"File too new (< {min_file_age} seconds old)"
             
-            # Check if file is locked
-            try:
-                with open(file_path, 'r+'):
-                    pass
-            except IOError:
-                return False, "File is locked"
+            # Check the file has stopped changing since the last pass
+            if not self._is_file_stable(file_path, stat_result):
+                return False, "File still being written (size/mtime changed)"
             
             return True, "Ready"
             
@@ -117,10 +232,14 @@ class IncomingWatcher:
         if not self.both_incoming.exists():
             self.logger.warning(f"Both_Incoming directory does not exist: {self.both_incoming}")
             return False
+        if self._directory_unchanged(self.both_incoming):
+            return False
             
         print(f"🔍 BOTH_INCOMING: Checking {self.both_incoming} for files to distribute...")
         found_files = False
         file_count = 0
+        seen_files = set()
+        destinations_ready = False
         
         try:
             # Iterate through all files in the Both_Incoming directory
@@ -130,24 +249,30 @@ class IncomingWatcher:
                     
                 found_files = True  # Mark as found even if not ready
                 file_count += 1
+                seen_files.add(file)
                 
                 # Check if file is ready for distribution
                 is_ready, reason = self._is_file_ready(file)
                 if is_ready:
                     print(f"   📤 Distributing: {file.name}")
                     
-                    # Copy the file to all incoming directories
+                    # Ensure the destination directories exist, once per pass
+                    if not destinations_ready:
+                        for incoming_dir in self.incoming_directories:
+                            incoming_dir.mkdir(parents=True, exist_ok=True)
+                        destinations_ready = True
+                    
+                    # Link (or copy) the file into all incoming directories
                     for incoming_dir in self.incoming_directories:
-                        # Ensure destination directory exists
-                        incoming_dir.mkdir(parents=True, exist_ok=True)
                         dest_path = incoming_dir / file.name
-                        shutil.copy(file, dest_path)
-                        self.logger.info(f"Copied {file.name} to {incoming_dir.name} directory.")
-                        print(f"      → Copied to {incoming_dir.name}")
+                        action = self._link_or_copy(file, dest_path)
+                        self.logger.info("%s %s to %s directory.", action, file.name, incoming_dir.name)
+                        print(f"      → {action} to {incoming_dir.name}")
                     
                     # Delete the original file
                     file.unlink()
-                    self.logger.info(f"Deleted {file.name} from Both_Incoming.")
+                    self._file_snapshots.pop(file, None)
+                    self.logger.info("Deleted %s from Both_Incoming.", file.name)
                     print(f"      ✓ Deleted from Both_Incoming")
                 else:
                     self.logger.warning(f"File {file.name} not ready for distribution: {reason}")
@@ -156,101 +281,79 @@ class IncomingWatcher:
         
         except Exception as e:
             self.logger.error(f"Error processing Both_Incoming: {e}")
+            self._forget_directory(self.both_incoming)
             found_files = False
         
+        # Forget snapshots of files that have disappeared since the last pass
+        for stale in set(self._file_snapshots) - seen_files:
+            del self._file_snapshots[stale]
+        
         if file_count == 0:
             print(f"   ✅ No files to distribute from Both_Incoming")
+        else:
+            # Files not ready yet are rechecked next pass even without new arrivals
+            self._forget_directory(self.both_incoming)
         
         return found_files
     
-    def process_file(self, file_path: Path) -> bool:
+    def process_file(self, file_path: Path, sequence: Optional[str] = None) -> bool:
         """
-        Process a single file (JPEG or video).
+        Process a single file (JPEG or video) in this process.
         
         Args:
             file_path: Path to the file to process
+            sequence: Sequence number for the filename; the next one is used if None
             
         Returns:
             bool: True if processing succeeded, False otherwise
         """
-        if not file_path.is_file():
-            return False
-            
-        # Check for zero-byte files
-        if file_path.stat().st_size == 0:
-            self.logger.warning(f"Skipping zero-byte file: {str(file_path)}")
-            print(f"   ⚠️  Skipping zero-byte file: {file_path.name}")
-            return False
-            
-        try:
-            # Skip files that are already processed
-            if "__LRE" in file_path.name:
-                self.logger.debug(f"Skipping already processed file: {file_path}")
-                return True
-                
-            print(f"   🎨 PROCESSING: {file_path.name}")
-            
-            # Process based on file type
-            if file_path.suffix.lower() in ['.jpg', '.jpeg']:
-                return self._process_jpeg(file_path)
-            elif any(file_path.match(pattern) for pattern in self.video_patterns):
-                return self._process_video(file_path)
-            else:
-                self.logger.debug(f"Unsupported file type: {file_path}")
-                return False
-                
-        except Exception as e:
-            self.logger.error(f"Error processing file {file_path}: {e}")
-            print(f"   ❌ Error processing {file_path.name}: {e}")
-            return False
+        return _process_file(file_path, sequence or self._get_next_sequence())
     
-    def _process_jpeg(self, file_path: Path) -> bool:
-        """Process a JPEG file with metadata extraction and renaming."""
-        try:
-            sequence = self._get_next_sequence()
-            processor = JPEGExifProcessor(str(file_path), sequence=sequence)
-            new_path = processor.process_image()
-            
-            self.logger.info(f"JPEG processed successfully: {new_path}")
-            print(f"      ✓ Processed to: {Path(new_path).name}")
-            return True
+    def _scan_directory(self, directory: Path) -> tuple:
+        """
+        List unprocessed JPEG and video files with a single directory read.
+        
+        Args:
+            directory: Directory to scan
             
-        except ValueError as e:
-            if "not ready for processing" in str(e):
-                self.logger.warning(f"JPEG file not ready, skipping: {file_path} - {e}")
-                print(f"      ⏳ File not ready - will retry later: {file_path.name}")
-                return False
-            else:
-                raise
-        except Exception as e:
-            self.logger.error(f"Error processing JPEG {file_path}: {e}")
-            print(f"      ❌ JPEG processing failed: {e}")
-            return False
-    
-    def _process_video(self, file_path: Path) -> bool:
-        """Process a video file with metadata extraction and renaming."""
-        try:
-            sequence = self._get_next_sequence()
-            processor = VideoProcessor(str(file_path), sequence=sequence)
-            success = processor.process_video()
+        Returns:
+            tuple: (jpeg_files, video_files) as lists of Paths
+        """
+        jpeg_files = []
+        video_files = []
+        with os.scandir(directory) as entries:
+            for entry in entries:
+                name = entry.name
+                # scandir reports the entry type from readdir, so no extra stat here
+                if '__LRE' in name or not entry.is_file():
+                    continue
+                lower_name = name.lower()
+                if lower_name.endswith(self.jpeg_suffixes):
+                    jpeg_files.append(Path(entry.path))
+                elif lower_name.endswith(self.video_suffixes):
+                    video_files.append(Path(entry.path))
+        return jpeg_files, video_files
+        
+    def _process_files(self, file_paths: list) -> int:
+        """
+        Process files, spreading them over the worker pool when there are several.
+        
+        Processing is dominated by exiftool round trips, so the metadata of every
+        JPEG is read up front with one exiftool call and the files then run in
+        separate processes, each with its own exiftool session.
+        
+        Args:
+            file_paths: Files to process
             
-            if success:
-                # Get the new filename (processor renames the file)
-                new_name = processor.generate_filename()
-                new_path = file_path.parent / new_name
-                self.logger.info(f"Video processed successfully: {new_path}")
-                print(f"      ✓ Processed to: {new_path.name}")
-                return True
-            else:
-                self.logger.warning(f"Video processing failed: {file_path}")
-                print(f"      ❌ Video processing failed: {file_path.name}")
-                return False
-                
-        except Exception as e:
-            self.logger.error(f"Error processing video {file_path}: {e}")
-            print(f"      ❌ Video processing failed: {e}")
-            return False
-    
+        Returns:
+            int: Number of files processed successfully
+        """
+        jpeg_files = [path for path in file_paths if path.suffix.lower() in JPEG_SUFFIXES]
+        metadata = self._bulk_read_metadata(jpeg_files, tags=JPEGExifProcessor.exif_tags)
+        
+        results = self._process_in_parallel(_process_file_worker, file_paths, metadata=metadata)
+        return sum(1 for processed in results if processed)
+        
     def check_directory(self, directory: Path) -> int:
         """
         Check a directory for files to process.
@@ -264,23 +367,20 @@ class IncomingWatcher:
         if not directory.exists():
             self.logger.warning(f"Directory does not exist: {directory}")
             return 0
+        if self._directory_unchanged(directory):
+            return 0
             
         try:
             print(f"🔍 INCOMING: Checking {directory.name} for files to process...")
             
-            processed_count = 0
+            jpeg_files, video_files = self._scan_directory(directory)
+            if jpeg_files or video_files:
+                # Processed files are renamed, which changes the directory anyway;
+                # anything that failed or was not ready gets retried
+                self._forget_directory(directory)
             
-            # Process JPEG files
-            for pattern in self.jpeg_patterns:
-                for file_path in directory.glob(pattern):
-                    if self.process_file(file_path):
-                        processed_count += 1
-                    
-            # Process video files
-            for pattern in self.video_patterns:
-                for file_path in directory.glob(pattern):
-                    if self.process_file(file_path):
-                        processed_count += 1
+            # Submit JPEG files first, then video files
+            processed_count = self._process_files(jpeg_files + video_files)
             
             if processed_count == 0:
                 print(f"   ✅ No new files to process in {directory.name}")
@@ -291,6 +391,7 @@ class IncomingWatcher:
             
         except Exception as e:
             self.logger.error(f"Error checking directory {directory}: {e}")
+            self._forget_directory(directory)
             return 0
     
     def run_cycle(self) -> None:
@@ -328,14 +429,24 @@ class IncomingWatcher:
         print(f"\n🎬 INCOMING WATCHER: Starting continuous monitoring...")
         print(f"Press Ctrl+C to stop")
         
+        # Wake on file arrival; sleep_time remains the retry interval for files not yet ready
+        monitor = FileEventMonitor([self.both_incoming] + self.incoming_directories)
+        if monitor.start():
+            print(f"   👀 Event-driven: waking on new files (retry every {self.sleep_time} seconds)")
+        
         try:
             while True:
                 self.run_cycle()
-                time.sleep(self.sleep_time)
+                arrived = monitor.wait(self.sleep_time)
+                if arrived:
+                    self.logger.debug(f"Woken by {len(arrived)} file event(s)")
                 
         except KeyboardInterrupt:
             print(f"\n🛑 INCOMING WATCHER: Stopping...")
             self.logger.info("Incoming watcher stopped by user")
+        finally:
+            monitor.stop()
+            self.shutdown()
 
 
 def setup_logging(log_level: str = "INFO") -> None:
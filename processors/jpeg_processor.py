@@ -8,10 +8,20 @@ import time
 
 from processors.media_processor import MediaProcessor
 
+# Accepted input extensions, compared against the lowercased suffix
+JPEG_EXTENSIONS = frozenset({'.jpg', '.jpeg'})
+
 class JPEGExifProcessor(MediaProcessor):
     """A class to process JPEG images and their EXIF data using exiftool."""
     
-    def __init__(self, input_path: str, output_path: str = None, sequence: str = None):
+    # Only the tags used for naming, keywords and transfer logging
+    exif_tags = [
+        'DateTimeOriginal', 'Title', 'Location', 'Sub-location', 'City',
+        'State', 'Province-State', 'Country', 'Rating', 'Keywords', 'Subject'
+    ]
+    
+    def __init__(self, input_path: str, output_path: str = None, sequence: str = None,
+                 exif_data: dict = None):
         """
         Initialize the JPEG processor with input and output paths.
         Validates file type and username requirements.
@@ -20,14 +30,15 @@ class JPEGExifProcessor(MediaProcessor):
             input_path (str): Path to input JPEG file
             output_path (str): Optional path for output file. If None, will use input directory
             sequence (str): Optional sequence number for filename
+            exif_data (dict): Optional metadata already read for this file
         """
-        super().__init__(input_path, sequence=sequence)
+        super().__init__(input_path, sequence=sequence, exif_data=exif_data)
         self.input_path = Path(input_path)
         self.output_path = (Path(output_path) if output_path 
                           else self.input_path.parent)
         
         # Validate file is JPEG
-        if self.input_path.suffix.lower() not in ['.jpg', '.jpeg']:
+        if self.input_path.suffix.lower() not in JPEG_EXTENSIONS:
             self.logger.error(f"File must be JPEG format. Found: {self.input_path.suffix}")
             sys.exit(1)
             
@@ -51,16 +62,7 @@ class JPEGExifProcessor(MediaProcessor):
                 raw_date = self.exif_data[key]
                 # Convert YYYY:MM:DD HH:MM:SS to YYYY_MM_DD
                 if raw_date and ' ' in raw_date:  # Must have space between date and time
-                    try:
-                        date_parts = raw_date.split(' ')[0].split(':')
-                        if len(date_parts) == 3:  # Must have year, month, day
-                            date_str = '_'.join(date_parts)
-                        else:
-                            self.logger.error(f"Invalid date format: {raw_date}")
-                            date_str = None
-                    except Exception as e:
-                        self.logger.error(f"Error parsing date: {e}")
-                        date_str = None
+                    date_str = self._format_exif_date(raw_date)
                 break
                 
         # Get title and location data
@@ -71,6 +73,33 @@ class JPEGExifProcessor(MediaProcessor):
         
         return date_str, title, location, city, state, country
     
+    def _format_exif_date(self, raw_date: str) -> str:
+        """
+        Convert an EXIF 'YYYY:MM:DD HH:MM:SS' timestamp to 'YYYY_MM_DD'.
+        
+        EXIF dates have a fixed layout, so the common case is handled by
+        slicing; anything else falls back to splitting on the separators.
+        
+        Args:
+            raw_date: Raw DateTimeOriginal value
+            
+        Returns:
+            str: Date as YYYY_MM_DD, or None if the value is malformed
+        """
+        if (len(raw_date) >= 11 and raw_date[4] == ':' and raw_date[7] == ':'
+                and raw_date[10] == ' ' and raw_date[:4].isdigit()
+                and raw_date[5:7].isdigit() and raw_date[8:10].isdigit()):
+            return f"{raw_date[:4]}_{raw_date[5:7]}_{raw_date[8:10]}"
+            
+        try:
+            date_parts = raw_date.split(' ')[0].split(':')
+            if len(date_parts) == 3:  # Must have year, month, day
+                return '_'.join(date_parts)
+            self.logger.error(f"Invalid date format: {raw_date}")
+        except Exception as e:
+            self.logger.error(f"Error parsing date: {e}")
+        return None
+        
     def _validate_file_ready(self) -> bool:
         """
         Validate that the file is ready for processing (not zero bytes and stable).
@@ -131,8 +160,9 @@ class JPEGExifProcessor(MediaProcessor):
             self.logger.warning(f"File not ready for processing: {self.file_path}")
             raise ValueError(f"File not ready for processing: {self.file_path}")
             
-        # Read EXIF data for filename generation
-        self.read_exif()
+        # Read EXIF data for filename generation unless the caller already supplied it
+        if not self.exif_data:
+            self.read_exif()
             
         # Rename the file
         return self.rename_file()
@@ -9,14 +9,30 @@ import sys
 import shutil
 from datetime import datetime
 import re
+from functools import lru_cache
 
 from config import LRE_SUFFIX
 from utils.exiftool import ExifTool
 
+# Any run of characters that are invalid in a filename, whitespace, or underscores
+_SEPARATOR_RUN = re.compile(r'(?:[^\w-]|_)+')
+
+# exif_data keys holding existing keywords, merged in this order
+_KEYWORD_KEYS = ('IPTC:Keywords', 'XMP:Subject')
+
+@lru_cache(maxsize=None)
+def _grouped_keys(*fields: str) -> tuple:
+    """Return the group-qualified exif_data keys to try for the fields, in priority order."""
+    return tuple(key for field in fields for key in (f'XMP:{field}', f'IPTC:{field}', field))
+
 class MediaProcessor(ABC):
     """Base class for processing media files (JPEG, Video) with exiftool."""
     
-    def __init__(self, file_path: str, exiftool: ExifTool = None, sequence: str = None):
+    # Tags read by read_exif; None reads every tag
+    exif_tags = None
+    
+    def __init__(self, file_path: str, exiftool: ExifTool = None, sequence: str = None,
+                 exif_data: dict = None):
         """
         Initialize the media processor.
         
@@ -24,10 +40,13 @@ class MediaProcessor(ABC):
             file_path (str): Path to input media file
             exiftool (ExifTool, optional): ExifTool instance to use
             sequence (str, optional): Optional sequence number for filename
+            exif_data (dict, optional): Metadata already read for this file, e.g. by a
+                watcher's batched directory read
         """
         self.file_path = Path(file_path)
         self.logger = logging.getLogger(__name__)
-        self.exif_data = {}  # Initialize exif_data
+        self.exif_data = exif_data or {}  # Initialize exif_data
+        self._location_cache = None  # (exif_data it was built from, location tuple)
         self.sequence = sequence  # Store sequence for filename generation
         self.exiftool = exiftool or ExifTool()
             
@@ -38,17 +57,14 @@ class MediaProcessor(ABC):
         Returns:
             dict: Dictionary containing the EXIF data
         """
-        self.logger.debug(f"Reading metadata from file: {self.file_path}")
-        self.exif_data = self.exiftool.read_all_metadata(self.file_path)
+        self.logger.debug("Reading metadata from file: %s", self.file_path)
+        self.exif_data = self.exiftool.read_all_metadata(self.file_path, tags=self.exif_tags)
         return self.exif_data
         
-    def _get_exif_field_with_group(self, field: str) -> str:
-        """Get EXIF field value checking different group prefixes."""
-        for group in ['XMP:', 'IPTC:', '']:
-            value = self.exif_data.get(f'{group}{field}', '')
-            if value:
-                return value
-        return ''
+    def _get_exif_field_with_group(self, *fields: str) -> str:
+        """Get the first non-empty EXIF value for the fields, checking different group prefixes."""
+        exif_data = self.exif_data
+        return next((value for key in _grouped_keys(*fields) if (value := exif_data.get(key))), '')
 
     def get_exif_title(self) -> str:
         """
@@ -64,11 +80,18 @@ class MediaProcessor(ABC):
         
     def get_location_data(self):
         """Get location data from EXIF metadata."""
+        # generate_title and get_metadata_components both ask for this; extract it
+        # once per exif_data dict
+        cached = self._location_cache
+        if cached is not None and cached[0] is self.exif_data:
+            return cached[1]
+            
         location = self._get_exif_field_with_group('Location')
         city = self._get_exif_field_with_group('City')
-        state = self._get_exif_field_with_group('State') or self._get_exif_field_with_group('Province-State')
+        state = self._get_exif_field_with_group('State', 'Province-State')
         country = self._get_exif_field_with_group('Country')
-        self.logger.debug(f"Extracted location data: location={location}, city={city}, state={state}, country={country}")
+        self.logger.debug("Extracted location data: location=%s, city=%s, state=%s, country=%s", location, city, state, country)
+        self._location_cache = (self.exif_data, (location, city, state, country))
         return location, city, state, country
         
     def _join_location_parts(self, parts: list) -> str:
@@ -104,19 +127,16 @@ class MediaProcessor(ABC):
 
     def _truncate_if_needed(self, text: str, max_length: int = 100) -> str:
         """Truncate text if it exceeds max_length."""
-        return text[:max_length] if len(text) > max_length else text
+        # Slicing past the end is a no-op, so no length check is needed
+        return text[:max_length]
 
     def clean_component(self, component: str) -> str:
         """Clean a filename component."""
         if not component or self._is_json_like(component):
             return ''
             
-        # Replace invalid characters with underscores
-        cleaned = re.sub(r'[^\w\s-]', '_', component)
-        # Replace whitespace with underscores
-        cleaned = re.sub(r'\s+', '_', cleaned)
-        # Remove consecutive underscores
-        cleaned = re.sub(r'_+', '_', cleaned)
+        # Collapse invalid characters, whitespace and underscores to a single underscore
+        cleaned = _SEPARATOR_RUN.sub('_', component)
         # Strip leading/trailing underscores
         cleaned = cleaned.strip('_')
         
@@ -137,40 +157,32 @@ class MediaProcessor(ABC):
         """Get base keywords including existing."""
         # Get keywords from both IPTC:Keywords and XMP:Subject
         keywords = []
-        iptc_keywords = self.exif_data.get('IPTC:Keywords', [])
-        xmp_subject = self.exif_data.get('XMP:Subject', [])
-        
-        # Handle string or list for IPTC:Keywords
-        if isinstance(iptc_keywords, str):
-            keywords.extend(iptc_keywords.split(','))
-        elif isinstance(iptc_keywords, list):
-            keywords.extend(iptc_keywords)
-            
-        # Handle string or list for XMP:Subject
-        if isinstance(xmp_subject, str):
-            keywords.extend(xmp_subject.split(','))
-        elif isinstance(xmp_subject, list):
-            keywords.extend(xmp_subject)
+        for key in _KEYWORD_KEYS:
+            # Handle string or list values
+            value = self.exif_data.get(key)
+            if isinstance(value, str):
+                keywords.extend(value.split(','))
+            elif isinstance(value, list):
+                keywords.extend(value)
             
         # Remove duplicates while preserving order
-        seen = set()
-        return [k for k in keywords if not (k in seen or seen.add(k))]
+        return list(dict.fromkeys(keywords))
 
     def _clean_location_component(self, component: str) -> str:
         """Clean a single location component."""
         return self.clean_component(component)
 
-    def _build_base_components(self) -> tuple:
+    def _build_base_components(self, components: tuple) -> tuple:
         """Get and clean base filename components."""
-        date_str, title, _, _, _, _ = self.get_metadata_components()  # Updated for 6-tuple with state
+        date_str, title, _, _, _, _ = components  # 6-tuple with state
         if not date_str and not title:
             self.logger.info("No valid metadata components found for filename")
             return None, None
         return date_str, title
 
-    def _build_location_components(self, existing_text: str) -> list:
+    def _build_location_components(self, existing_text: str, components: tuple) -> list:
         """Get and clean location components, skipping if in existing text."""
-        _, _, location, city, state, country = self.get_metadata_components()  # Updated for 6-tuple with state
+        _, _, location, city, state, country = components  # 6-tuple with state
         components = []
         
         # Clean all components first
@@ -200,8 +212,11 @@ class MediaProcessor(ABC):
 
     def generate_filename(self) -> str:
         """Generate new filename based on metadata."""
+        # Extract metadata once and share it between the base and location parts
+        components = self.get_metadata_components()
+        
         # Get base components
-        date_str, title = self._build_base_components()
+        date_str, title = self._build_base_components(components)
         if date_str is None and title is None:
             # If no valid metadata, just add LRE suffix to original name
             return f"{self.file_path.stem}__LRE{self.file_path.suffix}"
@@ -217,7 +232,7 @@ class MediaProcessor(ABC):
             
         # Add location components
         existing_text = '_'.join(parts)
-        parts.extend(self._build_location_components(existing_text))
+        parts.extend(self._build_location_components(existing_text, components))
             
         # Build filename with sequence and LRE suffix
         return self._build_filename_with_sequence(parts) + self.file_path.suffix.lower()
@@ -229,9 +244,13 @@ class MediaProcessor(ABC):
             if not new_name:
                 return self.file_path
                 
+            if new_name == self.file_path.name:
+                return self.file_path
+                
+            # Same-directory rename: a single rename(2), no exiftool pass needed
             new_path = self.file_path.parent / new_name
             self.file_path.rename(new_path)
-            self.logger.info(f"Renamed file from: {self.file_path.name} to: {new_name}")
+            self.logger.info("Renamed file from: %s to: %s", self.file_path.name, new_name)
             return new_path
         except Exception as e:
             self.logger.error(f"Failed to rename file: {e}")
@@ -5,9 +5,22 @@ import subprocess
 import logging
 import sys
 import os
-import xml.etree.ElementTree as ET
+try:
+    # libxml2-backed parser; exposes the same find/findall/iter/get API as ElementTree
+    from lxml import etree as ET
+    # Shared sidecar parser: skips whitespace-only text, comments and the xpacket
+    # processing instructions while building the tree, and never expands entities
+    XMP_PARSER = ET.XMLParser(remove_blank_text=True, remove_comments=True,
+                              remove_pis=True, resolve_entities=False)
+    # Elements of this type can be searched with compiled XPath
+    _LXML_ELEMENT = ET._Element
+except ImportError:
+    import xml.etree.ElementTree as ET
+    XMP_PARSER = None
+    _LXML_ELEMENT = None
 import re
 from datetime import datetime
+from functools import lru_cache
 
 from config import (
     MCCARTYS_PREFIX,
@@ -53,57 +66,216 @@ from processors.media_processor import MediaProcessor
 from utils.exiftool import ExifTool  # Import the new ExifTool class
 from utils.date_normalizer import DateNormalizer  # Import DateNormalizer
 
+# Valid video extensions, derived once from VIDEO_PATTERN instead of per processor
+VIDEO_EXTENSIONS = frozenset(pattern.lower().replace('*', '') for pattern in VIDEO_PATTERN)
+
+# Every tag the processor writes or verifies; reads are restricted to these so the
+# post-write JSON stays small however much other metadata the video carries
+VIDEO_READ_TAGS = list(dict.fromkeys(
+    [field.lstrip('-') for fields in METADATA_FIELDS.values() for field in fields] + list(VERIFY_FIELDS)
+))
+
+# Namespace-qualified ElementTree names and paths, formatted once at import
+_RDF = f'{{{XML_NAMESPACES["rdf"]}}}'
+_DC = f'{{{XML_NAMESPACES["dc"]}}}'
+_LR = f'{{{XML_NAMESPACES["lr"]}}}'
+_IPTC = f'{{{XML_NAMESPACES["Iptc4xmpCore"]}}}'
+_PHOTOSHOP = f'{{{XML_NAMESPACES["photoshop"]}}}'
+_EXIF = f'{{{XML_NAMESPACES["exif"]}}}'
+_X_DEFAULT = f'[@{{{XML_NAMESPACES["xml"]}}}lang="x-default"]'
+
+RDF_DESCRIPTION = f'{_RDF}Description'
+# x:xmpmeta/rdf:RDF/rdf:Description in a standard sidecar; bare rdf:RDF roots and
+# anything unusual fall through to the descendant search
+DESCRIPTION_PATHS = (f'{_RDF}RDF/{RDF_DESCRIPTION}', RDF_DESCRIPTION, f'.//{RDF_DESCRIPTION}')
+HIERARCHICAL_SUBJECT_PATH = f'.//{_LR}hierarchicalSubject/{_RDF}Bag/{_RDF}li'
+SUBJECT_BAG_PATH = f'.//{_DC}subject/{_RDF}Bag/{_RDF}li'
+SUBJECT_SEQ_PATH = f'.//{_DC}subject/{_RDF}Seq/{_RDF}li'
+TITLE_ALT_PATH = f'.//{_DC}title/{_RDF}Alt/{_RDF}li'
+TITLE_LI_PATH = f'.//{_DC}title/{_RDF}li'
+CAPTION_ALT_PATH = f'.//{_DC}description/{_RDF}Alt/{_RDF}li'
+
+class _CompiledPath:
+    """
+    A namespaced path searched on every sidecar, compiled once at import.
+    
+    lxml elements are searched with the path compiled to libxml2 XPath, so it is
+    not re-parsed per call; any other element (stdlib ElementTree, or lxml not
+    installed) is searched with find/findall as before.
+    """
+    
+    def __init__(self, path: str):
+        self.path = path
+        self._xpath = ET.ETXPath(path) if _LXML_ELEMENT is not None else None
+        
+    def findall(self, element) -> list:
+        """Return every matching element."""
+        if self._xpath is not None and isinstance(element, _LXML_ELEMENT):
+            return self._xpath(element)
+        return element.findall(self.path)
+        
+    def find(self, element):
+        """Return the first matching element, or None."""
+        if self._xpath is not None and isinstance(element, _LXML_ELEMENT):
+            matches = self._xpath(element)
+            return matches[0] if matches else None
+        return element.find(self.path)
+
+HIERARCHICAL_SUBJECT_XPATH = _CompiledPath(HIERARCHICAL_SUBJECT_PATH)
+SUBJECT_BAG_XPATH = _CompiledPath(SUBJECT_BAG_PATH)
+SUBJECT_SEQ_XPATH = _CompiledPath(SUBJECT_SEQ_PATH)
+TITLE_ALT_DEFAULT_XPATH = _CompiledPath(TITLE_ALT_PATH + _X_DEFAULT)
+TITLE_ALT_XPATH = _CompiledPath(TITLE_ALT_PATH)
+TITLE_LI_DEFAULT_XPATH = _CompiledPath(TITLE_LI_PATH + _X_DEFAULT)
+TITLE_LI_XPATH = _CompiledPath(TITLE_LI_PATH)
+CAPTION_ALT_DEFAULT_XPATH = _CompiledPath(CAPTION_ALT_PATH + _X_DEFAULT)
+CAPTION_ALT_XPATH = _CompiledPath(CAPTION_ALT_PATH)
+
+# Qualified attribute names, in (location, city, country) / (lat, lon, alt) order
+IPTC_LOCATION_NAMES = (f'{_IPTC}Location', f'{_IPTC}City', f'{_IPTC}CountryName')
+IPTC_LOCATION_PATHS = tuple(f'.//{name}' for name in IPTC_LOCATION_NAMES)
+PHOTOSHOP_LOCATION_NAMES = (f'{_PHOTOSHOP}City', f'{_PHOTOSHOP}State', f'{_PHOTOSHOP}Country')
+GPS_NAMES = (f'{_EXIF}GPSLatitude', f'{_EXIF}GPSLongitude', f'{_EXIF}GPSAltitude')
+
+class _DescriptionWithAttributes:
+    """
+    Finds the first rdf:Description (the element itself or a descendant) with a
+    non-empty value for any of the given attributes.
+    
+    With lxml the attribute test runs inside one compiled XPath, so libxml2 skips
+    the non-matching Descriptions; other elements are walked with iter().
+    """
+    
+    def __init__(self, names: tuple):
+        self.names = names
+        condition = ' or '.join(f"@{name} != ''" for name in names)
+        self._xpath = (ET.ETXPath(f'descendant-or-self::{RDF_DESCRIPTION}[{condition}][1]')
+                       if _LXML_ELEMENT is not None else None)
+        
+    def find(self, element):
+        """Return the first matching Description, or None."""
+        if self._xpath is not None and isinstance(element, _LXML_ELEMENT):
+            matches = self._xpath(element)
+            return matches[0] if matches else None
+        return next((desc for desc in element.iter(RDF_DESCRIPTION)
+                     if any(desc.get(name) for name in self.names)), None)
+
+PHOTOSHOP_LOCATION_DESCRIPTION = _DescriptionWithAttributes(PHOTOSHOP_LOCATION_NAMES)
+
+# exif:DateTimeOriginal, written either as a Description attribute or as an element
+EXIF_DATE_TIME_ORIGINAL = f'{_EXIF}DateTimeOriginal'
+DATE_TIME_ORIGINAL_DESCRIPTION = _DescriptionWithAttributes((EXIF_DATE_TIME_ORIGINAL,))
+DATE_TIME_ORIGINAL_XPATH = _CompiledPath(f'.//{EXIF_DATE_TIME_ORIGINAL}')
+# A full XMP timestamp; like exiftool's -d formatting, fractional seconds and the
+# timezone offset that may follow are dropped
+XMP_DATE_PATTERN = re.compile(r'(\d{4})-(\d{2})-(\d{2})T(\d{2}):(\d{2}):(\d{2})')
+# A GPS position needs a latitude or longitude; altitude alone does not count
+GPS_DESCRIPTION = _DescriptionWithAttributes(GPS_NAMES[:2])
+
+# Tag names (without group) of each configured write field, deduplicated; metadata
+# keys read back from the video carry one of these after their group prefix
+FIELD_KEY_SUFFIXES = {
+    field_type: tuple(dict.fromkeys(field.replace('-', '').split(':')[-1] for field in fields))
+    for field_type, fields in METADATA_FIELDS.items()
+}
+
+# Lowercase tag names whose presence in a metadata key marks it as a keyword field
+KEYWORD_KEY_MARKERS = tuple(dict.fromkeys(name.lower() for name in FIELD_KEY_SUFFIXES['keywords']))
+
+# Lowercase markers of the read-back keys logged after a write, matched as substrings
+WRITTEN_TITLE_KEY_MARKERS = ('xmp:title', 'dc:title', 'quicktime:title', 'itemlist:title')
+KEYWORD_RELATED_KEY_TERMS = ('keyword', 'subject', 'tag', 'category')
+
+# Keyword fields Apple Photos reads best as one comma-separated string
+APPLE_PHOTOS_KEYWORD_FIELDS = frozenset({'-QuickTime:Keywords', '-XMP:Subject', '-IPTC:Keywords'})
+
+# Date and time of an exiftool value in either separator style; sub-seconds and
+# any timezone after the seconds are simply not captured
+EXIF_DATE_PATTERN = re.compile(r'(\d{4})[:-](\d{2})[:-](\d{2})[ T](\d{2}):(\d{2}):(\d{2})')
+
+@lru_cache(maxsize=1024)
+def _normalize_date(value: str) -> str:
+    """Strip sub-seconds and timezone from an exiftool date and use colons throughout."""
+    match = EXIF_DATE_PATTERN.match(value)
+    if match:
+        return '%s:%s:%s %s:%s:%s' % match.groups()
+    return value.split('.')[0].split('+')[0].split('-0')[0].replace('-', ':')
+
 class VideoProcessor(MediaProcessor):
     """A class to process video files and their metadata using exiftool."""
     
-    def _debug_log(self, message: str, debug_type: str = 'debug') -> None:
-        """Log debug message only if debug is enabled for the specified type."""
+    exif_tags = VIDEO_READ_TAGS
+    
+    def _debug_log(self, message: str, debug_type: str = 'debug', *args) -> None:
+        """
+        Log debug message only if debug is enabled for the specified type.
+        
+        Like logging calls, message is %-formatted with args only when it is
+        actually emitted, so disabled debug types cost no string building.
+        """
         if VIDEO_DEBUG_SETTINGS.get('debug', False) and VIDEO_DEBUG_SETTINGS.get(debug_type, False):
-            self.logger.debug(f"[VIDEO DEBUG] {message}")
+            self.logger.debug("[VIDEO DEBUG] " + message, *args)
     
     def __init__(self, file_path: str, sequence: str = None):
         """Initialize with video file path."""
         super().__init__(file_path, sequence=sequence)
         
         # Validate file extension
-        ext = Path(file_path).suffix.lower()
-        valid_extensions = [pattern.lower().replace('*', '') for pattern in VIDEO_PATTERN]
-        if ext not in valid_extensions:
+        ext = self.file_path.suffix.lower()
+        if ext not in VIDEO_EXTENSIONS:
             self.logger.error(f"File must be video format matching {VIDEO_PATTERN}. Found: {ext}")
             sys.exit(1)
             
         # Check for XMP sidecar file
-        self.xmp_file = Path(file_path).with_suffix('.xmp')
-        self.logger.debug(f"Looking for XMP file at: {self.xmp_file}")
-        self.logger.debug(f"XMP file absolute path: {self.xmp_file.absolute()}")
-        self.logger.debug(f"XMP file exists: {self.xmp_file.exists()}")
+        self._xmp_path = None
+        xmp_path = self._resolve_xmp_path()
+        self._xmp_available = xmp_path is not None
+        # Keep the conventional location for log messages when no sidecar exists
+        self.xmp_file = xmp_path or self.file_path.with_suffix('.xmp')
         
-        if not self.xmp_file.exists():
+        if not self._xmp_available:
             self.logger.error(f"CRITICAL: No XMP sidecar file found at: {self.xmp_file}")
             self.logger.error(f"Video processing requires XMP file for metadata")
             # Don't exit - let the process continue but flag this as an error
-            self._xmp_available = False
         else:
             self.logger.info(f"Found XMP sidecar file: {self.xmp_file}")
-            self._xmp_available = True
             
+        # (exif_data it was built from, tag name -> [(key, value)]) for verification
+        self._tag_index_cache = None
         # Initialize the ExifTool class
         self.exiftool = ExifTool()
         # Initialize the DateNormalizer class
         self.date_normalizer = DateNormalizer()
             
+    def _resolve_xmp_path(self) -> Path | None:
+        """
+        Find the XMP sidecar for this video, probing the filesystem only once.
+        
+        Both video.xmp and video.mov.xmp naming conventions are accepted.
+        
+        Returns:
+            Path | None: The sidecar path, or None if neither candidate exists
+        """
+        if self._xmp_path is None:
+            candidates = (
+                self.file_path.with_suffix('.xmp'),
+                self.file_path.parent / (self.file_path.name + '.xmp'),
+            )
+            self._xmp_path = next((c for c in candidates if c.is_file()), None)
+        return self._xmp_path
+            
     def read_metadata_from_xmp(self) -> tuple:
         """Read metadata from XMP sidecar file."""
-        if not self.xmp_file.exists():
+        if not self._xmp_available:
             self.logger.warning(f"No XMP sidecar file found: {self.xmp_file}")
             return (None, None, None, None, (None, None, None), None)
             
         try:
-            tree = ET.parse(str(self.xmp_file))
+            tree = ET.parse(str(self.xmp_file), XMP_PARSER)
             root = tree.getroot()
             
             # Find the Description element that contains our metadata
-            description = root.find('.//{http://www.w3.org/1999/02/22-rdf-syntax-ns#}Description')
+            description = self._find_description(root)
             if description is None:
                 self.logger.warning("No Description element found in XMP")
                 return (None, None, None, None, (None, None, None), None)
@@ -111,55 +283,81 @@ class VideoProcessor(MediaProcessor):
             # Extract metadata fields
             title = self.get_title_from_rdf(description)
             keywords = self.get_keywords_from_rdf(description)
-            date_str = self.exiftool.read_date_from_xmp(self.xmp_file)
+            # exiftool is only asked when the tree has no full timestamp to reuse
+            date_str = self._get_date_from_rdf(root) or self.exiftool.read_date_from_xmp(self.xmp_file)
             caption = self.get_caption_from_rdf(description)
             location = self.get_location_from_rdf(description)
             gps_data = self.get_gps_from_rdf(description)
             
             # Log extracted XMP data
             self.logger.warning("XMP metadata extracted:")
-            self.logger.warning(f"  ┌─ Title:    '{title}'")
-            self.logger.warning(f"  ├─ Keywords: {keywords}")
-            self.logger.warning(f"  ├─ Date:     '{date_str}'")
-            self.logger.warning(f"  ├─ Caption:  '{caption}'")
-            self.logger.warning(f"  ├─ Location: {location}")
-            self.logger.warning(f"  └─ GPS:      {gps_data}")
+            self.logger.warning("  ┌─ Title:    '%s'", title)
+            self.logger.warning("  ├─ Keywords: %s", keywords)
+            self.logger.warning("  ├─ Date:     '%s'", date_str)
+            self.logger.warning("  ├─ Caption:  '%s'", caption)
+            self.logger.warning("  ├─ Location: %s", location)
+            self.logger.warning("  └─ GPS:      %s", gps_data)
             
             return (title, keywords, date_str, caption, location, gps_data)
             
-        except ET.ParseError as e:
+        except SyntaxError as e:  # ParseError from either ElementTree or lxml
             self.logger.error(f"Error parsing XMP file: {str(e)}")
             return (None, None, None, None, (None, None, None), None)
         except Exception as e:
             self.logger.error(f"Error reading XMP metadata: {str(e)}")
             return (None, None, None, None, (None, None, None), None)
             
+    def _get_date_from_rdf(self, root) -> str | None:
+        """
+        Read exif:DateTimeOriginal from the already-parsed sidecar.
+        
+        Args:
+            root: Root element of the XMP tree
+            
+        Returns:
+            str | None: Date in YYYY:MM:DD HH:MM:SS format, or None if the tag is
+                missing or is not a full timestamp
+        """
+        desc = DATE_TIME_ORIGINAL_DESCRIPTION.find(root)
+        if desc is not None:
+            value = desc.get(EXIF_DATE_TIME_ORIGINAL)
+        else:
+            elem = DATE_TIME_ORIGINAL_XPATH.find(root)
+            value = elem.text if elem is not None else None
+            
+        match = XMP_DATE_PATTERN.match(value.strip()) if value else None
+        if match is None:
+            return None
+        return '{}:{}:{} {}:{}:{}'.format(*match.groups())
+        
+    def _find_description(self, root):
+        """Return the first rdf:Description, trying its known locations before a tree search."""
+        for path in DESCRIPTION_PATHS:
+            description = root.find(path)
+            if description is not None:
+                return description
+        return None
+        
     def _get_keywords_from_hierarchical(self, rdf) -> list[str] | None:
         """Get keywords from hierarchical subjects."""
-        ns = XML_NAMESPACES
         keywords = []
-        subject_path = f'.//{{{ns["lr"]}}}hierarchicalSubject/{{{ns["rdf"]}}}Bag/{{{ns["rdf"]}}}li'
-        for elem in rdf.findall(subject_path):
+        for elem in HIERARCHICAL_SUBJECT_XPATH.findall(rdf):
             if elem.text:
                 keywords.append(elem.text)
         return keywords if keywords else None
         
     def _get_keywords_from_flat_bag(self, rdf) -> list[str] | None:
         """Get keywords from flat subject list using rdf:Bag (Lightroom format)."""
-        ns = XML_NAMESPACES
         keywords = []
-        subject_path = f'.//{{{ns["dc"]}}}subject/{{{ns["rdf"]}}}Bag/{{{ns["rdf"]}}}li'
-        for elem in rdf.findall(subject_path):
+        for elem in SUBJECT_BAG_XPATH.findall(rdf):
             if elem.text:
                 keywords.append(elem.text)
         return keywords if keywords else None
         
     def _get_keywords_from_flat_seq(self, rdf) -> list[str] | None:
         """Get keywords from flat subject list using rdf:Seq (Apple Photos format)."""
-        ns = XML_NAMESPACES
         keywords = []
-        subject_path = f'.//{{{ns["dc"]}}}subject/{{{ns["rdf"]}}}Seq/{{{ns["rdf"]}}}li'
-        for elem in rdf.findall(subject_path):
+        for elem in SUBJECT_SEQ_XPATH.findall(rdf):
             if elem.text:
                 keywords.append(elem.text)
         return keywords if keywords else None
@@ -177,14 +375,14 @@ class VideoProcessor(MediaProcessor):
             self._debug_log("Trying multiple keyword extraction strategies", 'log_keyword_processing')
             
             for strategy in strategies:
-                self._debug_log(f"Trying strategy: {strategy.__name__}", 'log_keyword_processing')
+                self._debug_log("Trying strategy: %s", 'log_keyword_processing', strategy.__name__)
                 keywords = strategy(rdf)
                 if keywords:
-                    self._debug_log(f"Found keywords using {strategy.__name__}: {keywords}", 'log_keyword_processing')
-                    self.logger.debug(f"Found keywords using {strategy.__name__}: {keywords}")
+                    self._debug_log("Found keywords using %s: %s", 'log_keyword_processing', strategy.__name__, keywords)
+                    self.logger.debug("Found keywords using %s: %s", strategy.__name__, keywords)
                     return keywords
                 else:
-                    self._debug_log(f"No keywords found with {strategy.__name__}", 'log_keyword_processing')
+                    self._debug_log("No keywords found with %s", 'log_keyword_processing', strategy.__name__)
                     
             self._debug_log("No keywords found in RDF with any strategy", 'log_keyword_processing')
             self.logger.debug("No keywords found in RDF")
@@ -214,48 +412,38 @@ class VideoProcessor(MediaProcessor):
         
     def _get_iptc_location(self, rdf) -> tuple[str | None, str | None, str | None]:
         """Extract location data from IPTC Core fields."""
-        ns = XML_NAMESPACES
-        for desc in rdf.iter('{http://www.w3.org/1999/02/22-rdf-syntax-ns#}Description'):
+        for desc in rdf.iter(RDF_DESCRIPTION):
             # Check for attributes first (your XMP format)
-            location = desc.get(f'{{{ns["Iptc4xmpCore"]}}}Location')
-            city = desc.get(f'{{{ns["Iptc4xmpCore"]}}}City')
-            country = desc.get(f'{{{ns["Iptc4xmpCore"]}}}CountryName')
+            location, city, country = (desc.get(name) for name in IPTC_LOCATION_NAMES)
             
             if any([location, city, country]):
-                self.logger.debug(f"Found IPTC location attributes: {location} ({city}, {country})")
+                self.logger.debug("Found IPTC location attributes: %s (%s, %s)", location, city, country)
                 return location, city, country
             
             # Fallback to elements if no attributes found
-            location_elem = desc.find(f'.//{{{ns["Iptc4xmpCore"]}}}Location')
-            city_elem = desc.find(f'.//{{{ns["Iptc4xmpCore"]}}}City')
-            country_elem = desc.find(f'.//{{{ns["Iptc4xmpCore"]}}}CountryName')
+            location_elem, city_elem, country_elem = (desc.find(path) for path in IPTC_LOCATION_PATHS)
             
             location_text = location_elem.text if location_elem is not None else None
             city_text = city_elem.text if city_elem is not None else None
             country_text = country_elem.text if country_elem is not None else None
             
             if any([location_text, city_text, country_text]):
-                self.logger.debug(f"Found IPTC location elements: {location_text} ({city_text}, {country_text})")
+                self.logger.debug("Found IPTC location elements: %s (%s, %s)", location_text, city_text, country_text)
                 return location_text, city_text, country_text
                 
         return None, None, None
         
     def _get_photoshop_location(self, rdf) -> tuple:
         """Extract location data from photoshop namespace."""
-        ns = XML_NAMESPACES  # Get namespaces from config
-        # Look for location data in Description elements
-        for desc in rdf.iter('{http://www.w3.org/1999/02/22-rdf-syntax-ns#}Description'):
-            # Get attributes using the full namespace
-            city = desc.get(f'{{{ns["photoshop"]}}}City')
-            state = desc.get(f'{{{ns["photoshop"]}}}State')
-            country = desc.get(f'{{{ns["photoshop"]}}}Country')
-            
-            if city or state or country:
-                # Return raw components - let _prepare_location_fields build the string
-                self.logger.debug(f"Found Photoshop location data: city={city}, state={state}, country={country}")
-                return state, city, country
-                
-        return None, None, None
+        # First Description carrying any of the attributes
+        desc = PHOTOSHOP_LOCATION_DESCRIPTION.find(rdf)
+        if desc is None:
+            return None, None, None
+            
+        city, state, country = (desc.get(name) for name in PHOTOSHOP_LOCATION_NAMES)
+        # Return raw components - let _prepare_location_fields build the string
+        self.logger.debug("Found Photoshop location data: city=%s, state=%s, country=%s", city, state, country)
+        return state, city, country
         
     def _build_location_string(self, location_data: tuple) -> str:
         """Build a location string from location data tuple."""
@@ -281,15 +469,13 @@ class VideoProcessor(MediaProcessor):
         """Extract GPS coordinates from RDF."""
         try:
             # Look for EXIF GPS data in Description attributes
-            for desc in rdf.iter('{http://www.w3.org/1999/02/22-rdf-syntax-ns#}Description'):
-                latitude = desc.get('{http://ns.adobe.com/exif/1.0/}GPSLatitude')
-                longitude = desc.get('{http://ns.adobe.com/exif/1.0/}GPSLongitude')
-                altitude = desc.get('{http://ns.adobe.com/exif/1.0/}GPSAltitude')
+            desc = GPS_DESCRIPTION.find(rdf)
+            if desc is not None:
+                latitude, longitude, altitude = (desc.get(name) for name in GPS_NAMES)
+                self.logger.debug("Found GPS coordinates: lat=%s, lon=%s, alt=%s", latitude, longitude, altitude)
+                return latitude, longitude, altitude
                 
-                if latitude or longitude:
-                    self.logger.debug(f"Found GPS coordinates: lat={latitude}, lon={longitude}, alt={altitude}")
-                    return latitude, longitude, altitude
-                    
+
         except Exception as e:
             self.logger.error(f"Error extracting GPS from RDF: {e}")
             
@@ -350,7 +536,7 @@ class VideoProcessor(MediaProcessor):
                 
             gps_fields['-QuickTime:GPSCoordinates'] = gps_coords
             
-            self.logger.debug(f"Converted GPS: {gps_fields}")
+            self.logger.debug("Converted GPS: %s", gps_fields)
             return gps_fields
             
         except Exception as e:
@@ -526,29 +712,28 @@ class VideoProcessor(MediaProcessor):
         
         # Get Apple Photos optimization settings
         keyword_format = APPLE_PHOTOS_VIDEO_OPTIMIZATIONS.get('keyword_format', 'comma_separated')
-        self._debug_log(f"Using keyword format: {keyword_format}", 'log_keyword_processing')
+        self._debug_log("Using keyword format: %s", 'log_keyword_processing', keyword_format)
         
         # Prepare keywords in different formats
         keywords_str = ', '.join(keywords) if isinstance(keywords, list) else str(keywords)
         keywords_list = keywords if isinstance(keywords, list) else [str(keywords)]
         
-        self._debug_log(f"Keywords as string: '{keywords_str}'", 'log_keyword_processing')
-        self._debug_log(f"Keywords as list: {keywords_list}", 'log_keyword_processing')
+        self._debug_log("Keywords as string: '%s'", 'log_keyword_processing', keywords_str)
+        self._debug_log("Keywords as list: %s", 'log_keyword_processing', keywords_list)
         
         # Apply Apple Photos optimized field mapping
-        apple_photos_fields = ['-QuickTime:Keywords', '-XMP:Subject', '-IPTC:Keywords']
         for field in METADATA_FIELDS['keywords']:
-            if field in apple_photos_fields:
+            if field in APPLE_PHOTOS_KEYWORD_FIELDS:
                 # These fields work best with comma-separated strings for Apple Photos
                 fields[field] = keywords_str
-                self._debug_log(f"Apple Photos field {field} = '{keywords_str}'", 'log_keyword_processing')
+                self._debug_log("Apple Photos field %s = '%s'", 'log_keyword_processing', field, keywords_str)
             else:
                 # Other fields use list format
                 fields[field] = keywords_list
-                self._debug_log(f"Standard field {field} = {keywords_list}", 'log_keyword_processing')
+                self._debug_log("Standard field %s = %s", 'log_keyword_processing', field, keywords_list)
         
-        self._debug_log(f"Total keyword fields prepared: {len(fields)}", 'log_keyword_processing')
-        self.logger.debug(f"Prepared keyword fields for Apple Photos: {fields}")
+        self._debug_log("Total keyword fields prepared: %s", 'log_keyword_processing', len(fields))
+        self.logger.debug("Prepared keyword fields for Apple Photos: %s", fields)
         return fields
         
     def _prepare_location_fields(self, location_data: tuple | None) -> dict:
@@ -603,59 +788,74 @@ class VideoProcessor(MediaProcessor):
             # Fallback to converted GPS if no config
             gps_fields = converted_gps
         
-        self.logger.debug(f"Prepared GPS fields using config mappings: {gps_fields}")
+        self.logger.debug("Prepared GPS fields using config mappings: %s", gps_fields)
         return gps_fields
         
+    def _exif_items_for(self, field_type: str) -> list:
+        """
+        Return the exif_data items whose tag name is one of a field type's tags.
+        
+        exif_data is indexed by tag name (the key without its group) once per
+        dict, so each verified field is a few dict lookups instead of a scan of
+        every key.
+        
+        Args:
+            field_type (str): METADATA_FIELDS category, e.g. 'title' or 'city'
+            
+        Returns:
+            list: (key, value) pairs, grouped by tag in FIELD_KEY_SUFFIXES order
+        """
+        cached = self._tag_index_cache
+        if cached is None or cached[0] is not self.exif_data:
+            index = {}
+            for key, value in self.exif_data.items():
+                index.setdefault(key.rpartition(':')[2], []).append((key, value))
+            cached = self._tag_index_cache = (self.exif_data, index)
+        index = cached[1]
+        return [item for tag in FIELD_KEY_SUFFIXES[field_type] for item in index.get(tag, ())]
+        
     def _verify_location_component(self, value: str | None, field_type: str) -> bool:
         """Verify a location component (location, city, or country)."""
         if not value:
             return True  # Skip verification for empty field
             
-        self.logger.debug(f"Verifying {field_type}: {value}")
-        self.logger.debug(f"Current exif data: {self.exif_data}")
+        self.logger.debug("Verifying %s: %s", field_type, value)
+        self.logger.debug("Current exif data: %s", self.exif_data)
             
+        candidates = self._exif_items_for(field_type)
+        
         # For location field, check if any of the location fields contain our expected location string
         if field_type == 'location':
-            for field in METADATA_FIELDS[field_type]:
-                clean_field = field.replace('-', '').split(':')[-1]
-                for key in self.exif_data:
-                    if key.endswith(clean_field):
-                        current_value = self.exif_data[key]
-                        self.logger.debug(f"Checking {key}: {current_value}")
-                        # State might be stored directly or as part of location string
-                        if value == current_value or value in current_value.split(", "):
-                            self.logger.debug(f"Location match found in {key}")
-                            return True
-                        else:
-                            self.logger.debug(f"No match: {value} not in {current_value}")
+            for key, current_value in candidates:
+                self.logger.debug("Checking %s: %s", key, current_value)
+                # State might be stored directly or as part of location string
+                if value == current_value or value in current_value.split(", "):
+                    self.logger.debug("Location match found in %s", key)
+                    return True
+                else:
+                    self.logger.debug("No match: %s not in %s", value, current_value)
         else:
             # For city and country, do exact match
-            for field in METADATA_FIELDS[field_type]:
-                clean_field = field.replace('-', '').split(':')[-1]
-                for key in self.exif_data:
-                    if key.endswith(clean_field):
-                        current_value = self.exif_data[key]
-                        self.logger.debug(f"Checking {key}: {current_value}")
-                        if current_value == value:
-                            self.logger.debug(f"Exact match found in {key}")
-                            return True
+            for key, current_value in candidates:
+                self.logger.debug("Checking %s: %s", key, current_value)
+                if current_value == value:
+                    self.logger.debug("Exact match found in %s", key)
+                    return True
                         
         self.logger.error(f"Metadata verification failed for {field_type.title()}")
         self.logger.error(f"Expected: {value}")
         self.logger.error(f"Found values:")
-        for field in METADATA_FIELDS[field_type]:
-            clean_field = field.replace('-', '').split(':')[-1]
-            for key in self.exif_data:
-                if key.endswith(clean_field):
-                    self.logger.error(f"  {key}: {self.exif_data[key]}")
+        for key, current_value in candidates:
+            self.logger.error(f"  {key}: {current_value}")
         return False
 
-    def verify_metadata(self, expected_metadata: tuple) -> bool:
+    def verify_metadata(self, expected_metadata: tuple, reread: bool = True) -> bool:
         """
         Verify that metadata was written correctly.
         
         Args:
             expected_metadata (tuple): Tuple containing expected metadata values
+            reread (bool): Read the file first; False checks the current exif_data
             
         Returns:
             bool: True if verification passes, False otherwise
@@ -663,12 +863,13 @@ class VideoProcessor(MediaProcessor):
         self.logger.debug("Starting metadata verification...")
         
         # First read the metadata from the file
-        self.logger.debug(f"Reading metadata from file: {self.file_path}")
-        self.exif_data = self.read_exif()
+        if reread:
+            self.logger.debug("Reading metadata from file: %s", self.file_path)
+            self.exif_data = self.read_exif()
         
         # Build expected fields dictionary
         expected_fields = self._build_expected_fields(expected_metadata)
-        self.logger.debug(f"Expected fields: {expected_fields}")
+        self.logger.debug("Expected fields: %s", expected_fields)
         
         # Verify each component
         title, keywords, date_str, caption, location_data, gps_data = expected_metadata
@@ -685,7 +886,7 @@ class VideoProcessor(MediaProcessor):
         
         self.logger.debug("Verification results:")
         for field, result in verification_results.items():
-            self.logger.debug(f"  {field}: {'✓' if result else '✗'}")
+            self.logger.debug("  %s: %s", field, '✓' if result else '✗')
         
         if all(verification_results.values()):
             self.logger.debug("All metadata verified successfully")
@@ -700,11 +901,8 @@ class VideoProcessor(MediaProcessor):
         if not title:
             return True  # Skip verification for empty field
             
-        for field in METADATA_FIELDS['title']:
-            clean_field = field.replace('-', '').split(':')[-1]
-            for key in self.exif_data:
-                if key.endswith(clean_field) and self.exif_data[key] == title:
-                    return True
+        if any(current == title for _, current in self._exif_items_for('title')):
+            return True
         self.logger.error(f"Metadata verification failed for Title\nExpected: {title}\nNot found")
         return False
         
@@ -714,52 +912,31 @@ class VideoProcessor(MediaProcessor):
             self._debug_log("No keywords to verify", 'log_verification')
             return True  # Skip verification for empty field
             
-        self._debug_log(f"Starting keyword verification for: {keywords}", 'log_verification')
-        self.logger.debug(f"Verifying keywords: {keywords}")
-        
-        # Check all keyword-related fields in the metadata
-        found_keywords = []
-        for field in METADATA_FIELDS['keywords']:
-            clean_field = field.replace('-', '').split(':')[-1]
-            self._debug_log(f"Checking for field pattern: {clean_field}", 'log_verification')
-            for key in self.exif_data:
-                if key.endswith(clean_field) or clean_field.lower() in key.lower():
-                    current_keywords = self.exif_data[key]
-                    self._debug_log(f"Found matching field {key} with value: {current_keywords}", 'log_verification')
-                    if isinstance(current_keywords, str):
-                        # Split comma-separated keywords
-                        current_keywords = [kw.strip() for kw in current_keywords.split(',')]
-                        self._debug_log(f"Parsed string keywords: {current_keywords}", 'log_verification')
-                    elif isinstance(current_keywords, list):
-                        # Handle list of keywords, also check for comma-separated items
-                        expanded_keywords = []
-                        for kw in current_keywords:
-                            if isinstance(kw, str) and ',' in kw:
-                                expanded_keywords.extend([k.strip() for k in kw.split(',')])
-                            else:
-                                expanded_keywords.append(kw)
-                        current_keywords = expanded_keywords
-                        self._debug_log(f"Processed list keywords: {current_keywords}", 'log_verification')
-                    found_keywords.extend(current_keywords)
-                    self.logger.debug(f"Found keywords in {key}: {current_keywords}")
-        
-        # Remove duplicates and empty strings
-        found_keywords = list(set([kw for kw in found_keywords if kw.strip()]))
-        self._debug_log(f"Final unique keywords found: {found_keywords}", 'log_verification')
-        
-        # Check if all expected keywords are present (case-insensitive)
-        expected_lower = [k.lower() for k in keywords]
-        found_lower = [k.lower() for k in found_keywords]
-        
-        self._debug_log(f"Expected keywords (lowercase): {expected_lower}", 'log_verification')
-        self._debug_log(f"Found keywords (lowercase): {found_lower}", 'log_verification')
-        
-        missing_keywords = []
-        for expected in expected_lower:
-            if expected not in found_lower:
-                missing_keywords.append(keywords[expected_lower.index(expected)])
+        self._debug_log("Starting keyword verification for: %s", 'log_verification', keywords)
+        self.logger.debug("Verifying keywords: %s", keywords)
+        
+        # One pass over the metadata, splitting comma-separated values and
+        # dropping empty entries as they are collected; stops as soon as every
+        # expected keyword (compared case-insensitively) has turned up
+        remaining = {k.lower() for k in keywords}
+        found_keywords = set()
+        for key, value in self.exif_data.items():
+            key_lower = key.lower()
+            if not any(marker in key_lower for marker in KEYWORD_KEY_MARKERS):
+                continue
+            values = [value] if isinstance(value, str) else value if isinstance(value, list) else ()
+            current_keywords = {kw for item in values if isinstance(item, str)
+                                for kw in (part.strip() for part in item.split(',')) if kw}
+            self.logger.debug("Found keywords in %s: %s", key, current_keywords)
+            found_keywords |= current_keywords
+            remaining.difference_update(kw.lower() for kw in current_keywords)
+            if not remaining:
+                break
+        self._debug_log("Final unique keywords found: %s", 'log_verification', found_keywords)
+        
+        missing_keywords = [k for k in keywords if k.lower() in remaining]
                 
-        self._debug_log(f"Missing keywords: {missing_keywords}", 'log_verification')
+        self._debug_log("Missing keywords: %s", 'log_verification', missing_keywords)
         
         if missing_keywords:
             self._debug_log("Some keywords are missing - verification failed", 'log_verification')
@@ -770,7 +947,7 @@ class VideoProcessor(MediaProcessor):
             # Don't fail verification for keywords - they might be stored differently
             return True
         
-        self.logger.debug(f"Keywords verification passed: {found_keywords}")
+        self.logger.debug("Keywords verification passed: %s", found_keywords)
         return True
         
     def _verify_date(self, date_str: str | None) -> bool:
@@ -778,37 +955,25 @@ class VideoProcessor(MediaProcessor):
         if not date_str:
             return True  # Skip verification for empty field
             
-        for field in METADATA_FIELDS['date']:
-            clean_field = field.replace('-', '').split(':')[-1]
-            for key in self.exif_data:
-                if key.endswith(clean_field):
-                    current_date = self.exif_data[key]
-                    self.logger.debug(f"Checking date field {key}: {current_date} against {date_str}")
-                    
-                    # Try to normalize both dates to standard format
-                    try:
-                        # Remove any milliseconds and timezone info
-                        current_date = current_date.split('.')[0].split('+')[0].split('-0')[0]
-                        # Replace dashes with colons in date part
-                        current_date = current_date.replace('-', ':')
-                        
-                        if current_date == date_str:
-                            self.logger.debug(f"Date match found in {key}")
-                            return True
-                        else:
-                            self.logger.debug(f"Dates don't match: {current_date} != {date_str}")
-                    except (ValueError, AttributeError) as e:
-                        self.logger.debug(f"Error comparing dates: {e}")
-                        continue
+        date_items = self._exif_items_for('date')
+        for key, current_date in date_items:
+            self.logger.debug("Checking date field %s: %s against %s", key, current_date, date_str)
+            if not isinstance(current_date, str):
+                self.logger.debug("Error comparing dates: unexpected value type %s", type(current_date).__name__)
+                continue
+                
+            # Normalized forms are cached: the same date usually repeats across tags and files
+            current_date = _normalize_date(current_date)
+            if current_date == date_str:
+                self.logger.debug("Date match found in %s", key)
+                return True
+            self.logger.debug("Dates don't match: %s != %s", current_date, date_str)
                         
         self.logger.error(f"Metadata verification failed for Date")
         self.logger.error(f"Expected: {date_str}")
         self.logger.error("Found values:")
-        for field in METADATA_FIELDS['date']:
-            clean_field = field.replace('-', '').split(':')[-1]
-            for key in self.exif_data:
-                if key.endswith(clean_field):
-                    self.logger.error(f"  {key}: {self.exif_data[key]}")
+        for key, value in date_items:
+            self.logger.error(f"  {key}: {value}")
         return False
 
     def write_metadata_to_video(self, metadata: tuple) -> bool:
@@ -841,17 +1006,15 @@ class VideoProcessor(MediaProcessor):
             # Log metadata fields being written
             self.logger.warning("Writing metadata to video file:")
             for field, value in metadata_fields.items():
-                self.logger.warning(f"  {field}: '{value}'")
+                self.logger.warning("  %s: '%s'", field, value)
             
-            # Execute ExifTool metadata write
+            # Execute ExifTool metadata write; the read-back rides the same round trip
             self.logger.warning("📝 Executing ExifTool metadata write...")
-            result = self.exiftool.write_metadata(self.file_path, metadata_fields)
+            result, self.exif_data = self.exiftool.write_and_read_metadata(
+                self.file_path, metadata_fields, tags=self.exif_tags)
             
             if result:
                 self.logger.warning("✅ ExifTool metadata write completed successfully")
-                
-                # Verify metadata was written by reading it back
-                self._verify_written_metadata(metadata)
             else:
                 self.logger.warning("❌ ExifTool metadata write failed")
             return result
@@ -860,72 +1023,64 @@ class VideoProcessor(MediaProcessor):
             self.logger.error(f"Error writing metadata: {e}")
             return False
 
-    def _verify_written_metadata(self, original_metadata: tuple) -> None:
+    def _verify_written_metadata(self, original_metadata: tuple, video_metadata: dict) -> None:
         """
-        Verify metadata was written correctly by reading it back from the video file.
+        Log the title, keyword and caption fields found in the written video.
         
         Args:
             original_metadata (tuple): Original metadata that was written
+            video_metadata (dict): Metadata read back from the video file
         """
         try:
-            self.logger.warning("🔍 Verifying written metadata by reading back from video file...")
-            
-            # Read all metadata from the video file
-            video_metadata = self.exiftool.read_all_metadata(self.file_path)
+            self.logger.warning("🔍 Verifying written metadata read back from video file...")
             
             title, keywords, date_str, caption, location_data, gps_data = original_metadata
             
+            # Sort the read-back keys into title, keyword-related and caption fields in one pass
+            title_items, keyword_items, caption_items = [], [], []
+            for key, value in video_metadata.items():
+                key_lower = key.lower()
+                if any(marker in key_lower for marker in WRITTEN_TITLE_KEY_MARKERS):
+                    title_items.append((key, value))
+                if any(term in key_lower for term in KEYWORD_RELATED_KEY_TERMS):
+                    keyword_items.append((key, value))
+                if 'description' in key_lower:
+                    caption_items.append((key, value))
+            
             # Check title fields
             title_found = False
-            for field in ['-XMP:Title', '-DC:Title', '-QuickTime:Title', '-ItemList:Title']:
-                clean_field = field.replace('-', '')
-                for key in video_metadata:
-                    if clean_field.lower() in key.lower():
-                        self.logger.warning(f"  📄 Title field {key}: '{video_metadata[key]}'")
-                        if video_metadata[key] == title:
-                            title_found = True
+            for key, value in title_items:
+                self.logger.warning("  📄 Title field %s: '%s'", key, value)
+                if value == title:
+                    title_found = True
             
             # Check keyword fields  
             keywords_found = False
-            self.logger.warning(f"  🔍 Looking for keywords: {keywords}")
+            self.logger.warning("  🔍 Looking for keywords: %s", keywords)
+            
+            # Check if keywords match (handle both list and comma-separated string formats)
+            if keywords:
+                expected_keywords = keywords if isinstance(keywords, list) else [str(keywords)]
+                for key, value in keyword_items:
+                    video_value = str(value)
+                    if all(keyword in video_value for keyword in expected_keywords):
+                        keywords_found = True
+                        self.logger.warning("    ✅ MATCH: %s contains expected keywords", key)
             
             # Show ALL metadata fields that might contain keywords
-            keyword_related_fields = []
-            for key in video_metadata:
-                if any(term in key.lower() for term in ['keyword', 'subject', 'tag', 'category']):
-                    keyword_related_fields.append(f"{key}: '{video_metadata[key]}'")
-                    
-                    # Check if keywords match (handle both list and comma-separated string formats)
-                    if keywords:
-                        video_value = str(video_metadata[key])
-                        if isinstance(keywords, list):
-                            # Convert list to comma-separated string for comparison
-                            keywords_str = ','.join(keywords)
-                            # Check if all keywords are present in the video value
-                            if all(keyword in video_value for keyword in keywords):
-                                keywords_found = True
-                                self.logger.warning(f"    ✅ MATCH: {key} contains expected keywords")
-                        else:
-                            if str(keywords) in video_value:
-                                keywords_found = True
-                                self.logger.warning(f"    ✅ MATCH: {key} contains expected keywords")
-            
-            if keyword_related_fields:
+            if keyword_items:
                 self.logger.warning("  🏷️  Found keyword-related fields in video:")
-                for field in keyword_related_fields:
-                    self.logger.warning(f"    {field}")
+                for key, value in keyword_items:
+                    self.logger.warning("    %s: '%s'", key, value)
             else:
                 self.logger.warning("  ❌ No keyword-related fields found in video metadata")
             
             # Check caption fields
             caption_found = False
-            for field in ['-QuickTime:Description', '-ItemList:Description']:
-                clean_field = field.replace('-', '')
-                for key in video_metadata:
-                    if 'description' in key.lower():
-                        self.logger.warning(f"  💬 Caption field {key}: '{video_metadata[key]}'")
-                        if video_metadata[key] == caption:
-                            caption_found = True
+            for key, value in caption_items:
+                self.logger.warning("  💬 Caption field %s: '%s'", key, value)
+                if value == caption:
+                    caption_found = True
             
             # Summary
             self.logger.warning("📊 Metadata verification summary:")
@@ -968,16 +1123,16 @@ class VideoProcessor(MediaProcessor):
         
     def _get_and_validate_metadata(self) -> tuple | None:
         """Read and validate metadata from XMP file."""
-        self.logger.debug(f"Attempting to read metadata from XMP file: {self.xmp_file}")
+        self.logger.debug("Attempting to read metadata from XMP file: %s", self.xmp_file)
         
         metadata = self.get_metadata_from_xmp()
         if not metadata:
             self.logger.error("CRITICAL: No metadata found in XMP file")
             self.logger.error(f"XMP file path: {self.xmp_file}")
-            self.logger.error(f"XMP file exists: {self.xmp_file.exists() if hasattr(self, 'xmp_file') else 'Unknown'}")
+            self.logger.error(f"XMP file exists: {self._xmp_available}")
             return None
             
-        self.logger.debug(f"Successfully read metadata: {metadata}")
+        self.logger.debug("Successfully read metadata: %s", metadata)
         
         if self._is_metadata_empty(metadata):
             self.logger.warning("All metadata fields are empty but XMP was read successfully")
@@ -993,7 +1148,13 @@ class VideoProcessor(MediaProcessor):
             self.logger.error("Failed to write metadata to video")
             return False
             
-        if not self.verify_metadata(metadata):
+        # write_metadata_to_video leaves exif_data holding the video's current metadata
+        verified = self.verify_metadata(metadata, reread=False)
+        
+        # Reuse the same read-back rather than reading the video again
+        self._verify_written_metadata(metadata, self.exif_data)
+        
+        if not verified:
             self.logger.error("Failed to verify metadata")
             return False
             
@@ -1002,12 +1163,15 @@ class VideoProcessor(MediaProcessor):
     def _cleanup_and_rename(self) -> Path:
         """Clean up XMP file and rename video with LRE suffix."""
         # Delete XMP file first (order is critical)
-        self.logger.debug(f"Checking for XMP file at: {self.xmp_file}")
-        if self.xmp_file.exists():
+        self.logger.debug("Checking for XMP file at: %s", self.xmp_file)
+        if self._xmp_available:
             try:
                 self.logger.info("Deleting XMP file before renaming video (critical order)")
                 self.xmp_file.unlink()
-                self.logger.debug(f"Successfully deleted XMP file: {self.xmp_file}")
+                self.logger.debug("Successfully deleted XMP file: %s", self.xmp_file)
+            except FileNotFoundError:
+                # Already gone (e.g. removed by another pass) - the goal is met
+                self.logger.debug("XMP file already removed: %s", self.xmp_file)
             except Exception as e:
                 self.logger.error(f"Failed to delete XMP file: {e}")
                 self.logger.error("Cannot proceed with renaming without deleting XMP first")
@@ -1020,7 +1184,7 @@ class VideoProcessor(MediaProcessor):
     def process_video(self) -> Path:
         """Main method to process a video file - reads XMP metadata and writes to video."""
         try:
-            self.logger.info(f"Starting video processing for: {self.file_path}")
+            self.logger.info("Starting video processing for: %s", self.file_path)
             
             # Check if file should be skipped first
             if self._should_skip_processing():
@@ -1050,11 +1214,11 @@ class VideoProcessor(MediaProcessor):
                 return self._cleanup_and_rename()
             else:
                 self.logger.debug("Found valid metadata:")
-                self.logger.debug(f"  Title: {title}")
-                self.logger.debug(f"  Keywords: {keywords}")
-                self.logger.debug(f"  Date: {date_str}")
-                self.logger.debug(f"  Caption: {caption}")
-                self.logger.debug(f"  Location: {location_data}")
+                self.logger.debug("  Title: %s", title)
+                self.logger.debug("  Keywords: %s", keywords)
+                self.logger.debug("  Date: %s", date_str)
+                self.logger.debug("  Caption: %s", caption)
+                self.logger.debug("  Location: %s", location_data)
             
             # Write metadata and verify
             self.logger.info("Writing metadata to video file")
@@ -1083,11 +1247,11 @@ class VideoProcessor(MediaProcessor):
             return None, None, None, None, None, None
             
         self.logger.info("Metadata components for filename:")
-        self.logger.info(f"  ┌─ Date:     '{self.metadata_for_filename.get('CreateDate', '')}'")
-        self.logger.info(f"  ├─ Title:    '{self.metadata_for_filename.get('Title', '')}'")
-        self.logger.info(f"  ├─ Location: '{self.metadata_for_filename.get('Location', '')}'")
-        self.logger.info(f"  ├─ City:     '{self.metadata_for_filename.get('City', '')}'")
-        self.logger.info(f"  └─ Country:  '{self.metadata_for_filename.get('Country', '')}'")
+        self.logger.info("  ┌─ Date:     '%s'", self.metadata_for_filename.get('CreateDate', ''))
+        self.logger.info("  ├─ Title:    '%s'", self.metadata_for_filename.get('Title', ''))
+        self.logger.info("  ├─ Location: '%s'", self.metadata_for_filename.get('Location', ''))
+        self.logger.info("  ├─ City:     '%s'", self.metadata_for_filename.get('City', ''))
+        self.logger.info("  └─ Country:  '%s'", self.metadata_for_filename.get('Country', ''))
         
         # Get components from stored metadata
         date_str = self.metadata_for_filename.get('CreateDate', '')
@@ -1113,15 +1277,15 @@ class VideoProcessor(MediaProcessor):
         self.logger.info(f"Extracted city from video metadata: {city}")
         
         if date_str:
-            self.logger.debug(f"Added date to filename: {date_str}")
+            self.logger.debug("Added date to filename: %s", date_str)
         if title:
-            self.logger.debug(f"Added title to filename: {title}")
+            self.logger.debug("Added title to filename: %s", title)
         if location:
-            self.logger.debug(f"Added location to filename: {location}")
+            self.logger.debug("Added location to filename: %s", location)
         if city:
-            self.logger.debug(f"Added city to filename: {city}")
+            self.logger.debug("Added city to filename: %s", city)
         if country:
-            self.logger.debug(f"Added country to filename: {country}")
+            self.logger.debug("Added country to filename: %s", country)
             
         return date_str, title, location, city, state, country
 
@@ -1167,42 +1331,40 @@ class VideoProcessor(MediaProcessor):
 
     def _get_title_from_dc_alt(self, rdf) -> str | None:
         """Get title from dc:title/rdf:Alt/rdf:li path."""
-        ns = XML_NAMESPACES
         # First try with x-default language
-        title_elem = rdf.find(f'.//{{{ns["dc"]}}}title/{{{ns["rdf"]}}}Alt/{{{ns["rdf"]}}}li[@{{{ns["xml"]}}}lang="x-default"]')
+        title_elem = TITLE_ALT_DEFAULT_XPATH.find(rdf)
         if title_elem is not None and title_elem.text:
-            self.logger.debug(f"Found title in dc:title with x-default: {title_elem.text}")
+            self.logger.debug("Found title in dc:title with x-default: %s", title_elem.text)
             return title_elem.text
             
         # If no x-default, try without language
-        title_elem = rdf.find(f'.//{{{ns["dc"]}}}title/{{{ns["rdf"]}}}Alt/{{{ns["rdf"]}}}li')
+        title_elem = TITLE_ALT_XPATH.find(rdf)
         if title_elem is not None and title_elem.text:
-            self.logger.debug(f"Found title in dc:title: {title_elem.text}")
+            self.logger.debug("Found title in dc:title: %s", title_elem.text)
             return title_elem.text
         return None
         
     def _get_title_from_dc_li(self, rdf) -> str | None:
         """Get title from dc:title/rdf:li path."""
-        ns = XML_NAMESPACES
         # First try with x-default language
-        for elem in rdf.findall(f'.//{{{ns["dc"]}}}title/{{{ns["rdf"]}}}li[@{{{ns["xml"]}}}lang="x-default"]'):
+        for elem in TITLE_LI_DEFAULT_XPATH.findall(rdf):
             if elem.text:
-                self.logger.debug(f"Found title in dc:title/li with x-default: {elem.text}")
+                self.logger.debug("Found title in dc:title/li with x-default: %s", elem.text)
                 return elem.text
                 
         # If no x-default, try without language
-        for elem in rdf.findall(f'.//{{{ns["dc"]}}}title/{{{ns["rdf"]}}}li'):
+        for elem in TITLE_LI_XPATH.findall(rdf):
             if elem.text:
-                self.logger.debug(f"Found title in dc:title/li: {elem.text}")
+                self.logger.debug("Found title in dc:title/li: %s", elem.text)
                 return elem.text
         return None
         
     def _get_title_from_location(self, rdf) -> str | None:
         """Get title from IPTC location attribute."""
-        for desc in rdf.iter('{http://www.w3.org/1999/02/22-rdf-syntax-ns#}Description'):
-            location = desc.get('{http://iptc.org/std/Iptc4xmpCore/1.0/xmlns/}Location')
+        for desc in rdf.iter(RDF_DESCRIPTION):
+            location = desc.get(IPTC_LOCATION_NAMES[0])
             if location:
-                self.logger.debug(f"Using Location as title: {location}")
+                self.logger.debug("Using Location as title: %s", location)
                 return location
         return None
         
@@ -1233,17 +1395,16 @@ class VideoProcessor(MediaProcessor):
     def get_caption_from_rdf(self, rdf):
         """Extract caption from RDF data."""
         try:
-            ns = XML_NAMESPACES
             # First try with x-default language
-            caption_elem = rdf.find(f'.//{{{ns["dc"]}}}description/{{{ns["rdf"]}}}Alt/{{{ns["rdf"]}}}li[@{{{ns["xml"]}}}lang="x-default"]')
+            caption_elem = CAPTION_ALT_DEFAULT_XPATH.find(rdf)
             if caption_elem is not None and caption_elem.text:
-                self.logger.debug(f"Found caption in dc:description with x-default: {caption_elem.text}")
+                self.logger.debug("Found caption in dc:description with x-default: %s", caption_elem.text)
                 return caption_elem.text
                 
             # If no x-default, try without language
-            caption_elem = rdf.find(f'.//{{{ns["dc"]}}}description/{{{ns["rdf"]}}}Alt/{{{ns["rdf"]}}}li')
+            caption_elem = CAPTION_ALT_XPATH.find(rdf)
             if caption_elem is not None and caption_elem.text:
-                self.logger.debug(f"Found caption in dc:description: {caption_elem.text}")
+                self.logger.debug("Found caption in dc:description: %s", caption_elem.text)
                 return caption_elem.text
         except Exception as e:
             self.logger.error(f"Error getting caption from RDF: {e}")
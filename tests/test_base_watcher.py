@@ -1,7 +1,10 @@
 #!/usr/bin/env python3
 
+import os
+import tempfile
 import unittest
-from unittest.mock import patch
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import patch, Mock
 from pathlib import Path
 
 from watchers.base_watcher import BaseWatcher
@@ -51,7 +54,15 @@ class TestBaseWatcher(unittest.TestCase):
         self.watcher_class._sequence = 9999
         seq = self.watcher_class._get_next_sequence()
         self.assertEqual(seq, '0001')  # Should roll over to 0001
-        
+
+    def test_when_getting_sequence_from_threads_then_numbers_are_unique(self):
+        """Should never hand the same sequence to two threads."""
+        self.watcher_class._sequence = 0
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            sequences = list(executor.map(lambda _: self.watcher_class._get_next_sequence(), range(2000)))
+
+        self.assertEqual(len(set(sequences)), 2000)
+
     def test_when_initializing_then_sets_default_values(self):
         """Should set default values for running and sleep_time."""
         watcher = self.watcher_class()
@@ -67,5 +78,142 @@ class TestBaseWatcher(unittest.TestCase):
         for directory in watcher.directories:
             self.assertIsInstance(directory, Path)
 
+    def test_when_checking_directory_then_processes_media_files_only(self):
+        """Should hand every media file, and nothing else, to process_file."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            directory = Path(temp_dir)
+            for name in ('a.jpg', 'B.MOV', 'a.xmp', 'notes.txt'):
+                (directory / name).touch()
+            (directory / 'folder.mov').mkdir()
+            watcher = self.watcher_class([directory])
+
+            with patch.object(watcher, 'process_file') as mock_process:
+                watcher.check_directory(directory)
+
+            processed = sorted(call.args[0].name for call in mock_process.call_args_list)
+            self.assertEqual(processed, ['B.MOV', 'a.jpg'])
+
+    def test_when_directory_unchanged_then_skips_sweep(self):
+        """Should only rescan a directory without pending files once its mtime changes."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            directory = Path(temp_dir)
+            watcher = self.watcher_class([directory])
+            
+            self.assertFalse(watcher._directory_unchanged(directory))
+            self.assertTrue(watcher._directory_unchanged(directory))
+            
+            os.utime(directory, ns=(0, 0))
+            self.assertFalse(watcher._directory_unchanged(directory))
+            
+            watcher._forget_directory(directory)
+            self.assertFalse(watcher._directory_unchanged(directory))
+
+    def test_when_media_found_then_rescans_next_pass(self):
+        """Should keep retrying a directory that still holds media files."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            directory = Path(temp_dir)
+            (directory / 'a.jpg').touch()
+            watcher = self.watcher_class([directory])
+            
+            with patch.object(watcher, 'process_file') as mock_process:
+                watcher.check_directory(directory)
+                watcher.check_directory(directory)
+            
+            self.assertEqual(mock_process.call_count, 2)
+
+    def test_when_checking_missing_directory_then_does_nothing(self):
+        """Should skip directories that do not exist."""
+        watcher = self.watcher_class(self.test_dirs)
+        with patch.object(watcher, 'process_file') as mock_process:
+            watcher.check_directory(Path('/test/missing'))
+        mock_process.assert_not_called()
+
+    def test_when_processing_in_parallel_then_collects_results_and_logs_failures(self):
+        """Should give each file its own sequence and skip files whose worker raised."""
+        watcher = self.watcher_class(self.test_dirs)
+        watcher.max_workers = 2
+
+        def worker(file_path, sequence):
+            if file_path.endswith('bad.mov'):
+                raise RuntimeError("exiftool failed")
+            return (file_path, sequence)
+
+        with ThreadPoolExecutor(max_workers=2) as executor, \
+             patch.object(watcher, '_get_executor', return_value=executor), \
+             patch.object(watcher.logger, 'error') as mock_error:
+            results = watcher._process_in_parallel(
+                worker, [Path('/test/dir1/a.mov'), Path('/test/dir1/bad.mov'), Path('/test/dir1/b.mov')])
+
+        self.assertEqual(sorted(path for path, _ in results), ['/test/dir1/a.mov', '/test/dir1/b.mov'])
+        self.assertEqual(len({sequence for _, sequence in results}), 2)
+        mock_error.assert_called_once()
+
+    def test_when_processing_in_parallel_with_metadata_then_passes_each_files_entry(self):
+        """Should hand every worker its own file's metadata, or None if it was not read."""
+        watcher = self.watcher_class(self.test_dirs)
+        watcher.max_workers = 2
+        files = [Path('/test/dir1/a.mov'), Path('/test/dir1/b.mov')]
+
+        def worker(file_path, sequence, exif_data):
+            return (file_path, exif_data)
+
+        with ThreadPoolExecutor(max_workers=2) as executor, \
+             patch.object(watcher, '_get_executor', return_value=executor):
+            results = watcher._process_in_parallel(
+                worker, files, metadata={files[0]: {'XMP:Title': 'a'}})
+
+        self.assertEqual(sorted(results, key=lambda r: r[0]),
+                         [('/test/dir1/a.mov', {'XMP:Title': 'a'}), ('/test/dir1/b.mov', None)])
+
+    def test_when_single_worker_then_processes_inline_without_pool(self):
+        """Should run the worker in this process when there is nothing to overlap."""
+        watcher = self.watcher_class(self.test_dirs)
+        watcher.max_workers = 1
+
+        def worker(file_path, sequence):
+            if file_path.endswith('bad.mov'):
+                raise RuntimeError("exiftool failed")
+            return file_path
+
+        with patch.object(watcher, '_get_executor') as mock_executor, \
+             patch.object(watcher.logger, 'error') as mock_error:
+            results = watcher._process_in_parallel(
+                worker, [Path('/test/dir1/a.mov'), Path('/test/dir1/bad.mov')])
+
+        mock_executor.assert_not_called()
+        self.assertEqual(results, ['/test/dir1/a.mov'])
+        mock_error.assert_called_once()
+
+    def test_when_shutting_down_then_releases_executor(self):
+        """Should shut the worker pool down and allow a fresh one later."""
+        watcher = self.watcher_class(self.test_dirs)
+        executor = Mock()
+        watcher._executor = executor
+
+        watcher.shutdown()
+
+        executor.shutdown.assert_called_once_with(wait=True)
+        self.assertIsNone(watcher._executor)
+
+    def test_when_bulk_reading_metadata_then_batches_and_keys_by_path(self):
+        """Should read files in fixed-size batches and return metadata keyed by Path."""
+        watcher = self.watcher_class(self.test_dirs)
+        watcher.metadata_batch_size = 2
+        watcher._exiftool = Mock()
+        watcher._exiftool.read_metadata_batch.side_effect = lambda batch, tags=None: {
+            str(path): {'XMP:Title': path.stem} for path in batch if path.stem != 'c'}
+        files = [Path('/test/dir1/a.jpg'), Path('/test/dir1/b.jpg'), Path('/test/dir1/c.jpg')]
+
+        result = watcher._bulk_read_metadata(files, tags=['Title'])
+
+        self.assertEqual(watcher._exiftool.read_metadata_batch.call_count, 2)
+        self.assertEqual(result, {files[0]: {'XMP:Title': 'a'}, files[1]: {'XMP:Title': 'b'}})
+
+    def test_when_bulk_reading_no_files_then_skips_exiftool(self):
+        """Should not start exiftool when there is nothing to read."""
+        watcher = self.watcher_class(self.test_dirs)
+        self.assertEqual(watcher._bulk_read_metadata([]), {})
+        self.assertIsNone(watcher._exiftool)
+
 if __name__ == '__main__':
     unittest.main()
@@ -3,10 +3,13 @@
 import unittest
 from unittest.mock import patch, MagicMock
 from pathlib import Path
-import subprocess
 import json
+import io
+import os
+import threading
 
-from utils.exiftool import ExifTool
+import utils.exiftool as exiftool_module
+from utils.exiftool import ExifTool, ExifToolSession, EXIFTOOL_BIN, get_session
 
 class TestExifTool(unittest.TestCase):
     def setUp(self):
@@ -14,14 +17,13 @@ class TestExifTool(unittest.TestCase):
         self.test_file = Path('/test/path/file.mov')
         self.test_xmp = Path('/test/path/file.xmp')
 
-    @patch('shutil.which')
-    def test_when_exiftool_not_installed_then_exits(self, mock_which):
+    @patch('utils.exiftool.EXIFTOOL_BIN', None)
+    def test_when_exiftool_not_installed_then_exits(self):
         """Should exit if exiftool is not found in PATH"""
-        mock_which.return_value = None
         with self.assertRaises(SystemExit):
             ExifTool()
 
-    @patch('subprocess.run')
+    @patch.object(ExifToolSession, 'execute')
     def test_when_reading_metadata_then_returns_parsed_json(self, mock_run):
         """Should return parsed metadata when exiftool succeeds"""
         expected_metadata = {
@@ -36,13 +38,34 @@ class TestExifTool(unittest.TestCase):
 
         result = self.exiftool.read_all_metadata(self.test_file)
         self.assertEqual(result, expected_metadata)
-        mock_run.assert_called_once_with(
-            ['exiftool', '-j', '-m', '-G', str(self.test_file)],
-            capture_output=True,
-            text=True
-        )
+        mock_run.assert_called_once_with(['-j', '-m', '-G', str(self.test_file)])
 
-    @patch('subprocess.run')
+    @patch.object(ExifToolSession, 'execute')
+    def test_when_reading_selected_tags_then_requests_only_those_tags(self, mock_run):
+        """Should pass each requested tag to exiftool before the file name"""
+        mock_run.return_value = MagicMock(returncode=0, stdout=json.dumps([{'XMP:Title': 'Test'}]))
+
+        result = self.exiftool.read_all_metadata(self.test_file, tags=['Title', 'City'])
+        self.assertEqual(result, {'XMP:Title': 'Test'})
+        mock_run.assert_called_once_with(['-j', '-m', '-G', '-Title', '-City', str(self.test_file)])
+
+    @patch.object(ExifToolSession, 'execute')
+    def test_when_reading_jpeg_then_skips_trailers_and_makernotes(self, mock_run):
+        """Should add -fast2 for JPEG reads only"""
+        mock_run.return_value = MagicMock(returncode=0, stdout=json.dumps([{'XMP:Title': 'Test'}]))
+
+        self.exiftool.read_all_metadata(Path('/test/path/photo.JPG'), tags=['Title'])
+        mock_run.assert_called_once_with(['-j', '-m', '-G', '-fast2', '-Title', '/test/path/photo.JPG'])
+
+    @patch.object(ExifToolSession, 'execute')
+    def test_when_batch_includes_video_then_reads_without_fast(self, mock_run):
+        """Should read a mixed batch in full so video atoms are never skipped"""
+        mock_run.return_value = MagicMock(returncode=0, stdout='[]')
+
+        self.exiftool.read_metadata_batch(['/test/a.jpg', str(self.test_file)])
+        mock_run.assert_called_once_with(['-j', '-m', '-G', '/test/a.jpg', str(self.test_file)])
+
+    @patch.object(ExifToolSession, 'execute')
     def test_when_reading_metadata_fails_then_returns_empty_dict(self, mock_run):
         """Should return empty dict when exiftool fails"""
         mock_run.return_value = MagicMock(
@@ -53,14 +76,14 @@ class TestExifTool(unittest.TestCase):
         result = self.exiftool.read_all_metadata(self.test_file)
         self.assertEqual(result, {})
 
-    @patch('subprocess.run')
+    @patch.object(ExifToolSession, 'execute')
     def test_when_reading_metadata_raises_error_then_returns_empty_dict(self, mock_run):
-        """Should return empty dict when subprocess raises error"""
-        mock_run.side_effect = subprocess.CalledProcessError(1, 'cmd')
+        """Should return empty dict when the exiftool process dies"""
+        mock_run.side_effect = BrokenPipeError('exiftool exited unexpectedly')
         result = self.exiftool.read_all_metadata(self.test_file)
         self.assertEqual(result, {})
 
-    @patch('subprocess.run')
+    @patch.object(ExifToolSession, 'execute')
     def test_when_reading_metadata_invalid_json_then_returns_empty_dict(self, mock_run):
         """Should return empty dict when JSON is invalid"""
         mock_run.return_value = MagicMock(
@@ -70,7 +93,7 @@ class TestExifTool(unittest.TestCase):
         result = self.exiftool.read_all_metadata(self.test_file)
         self.assertEqual(result, {})
 
-    @patch('subprocess.run')
+    @patch.object(ExifToolSession, 'execute')
     def test_when_reading_date_then_returns_formatted_date(self, mock_run):
         """Should return properly formatted date from XMP"""
         expected_date = '2025:03:26 15:30:00'
@@ -83,10 +106,10 @@ class TestExifTool(unittest.TestCase):
         self.assertEqual(result, expected_date)
         mock_run.assert_called_once()
         cmd_args = mock_run.call_args[0][0]
-        self.assertEqual(cmd_args[:2], ['exiftool', '-s'])
+        self.assertEqual(cmd_args[0], '-s')
         self.assertEqual(cmd_args[-2:], ['-DateTimeOriginal', str(self.test_xmp)])
 
-    @patch('subprocess.run')
+    @patch.object(ExifToolSession, 'execute')
     def test_when_date_not_in_xmp_then_returns_none(self, mock_run):
         """Should return None when date not found in XMP"""
         mock_run.return_value = MagicMock(
@@ -97,14 +120,14 @@ class TestExifTool(unittest.TestCase):
         result = self.exiftool.read_date_from_xmp(self.test_xmp)
         self.assertIsNone(result)
 
-    @patch('subprocess.run')
+    @patch.object(ExifToolSession, 'execute')
     def test_when_reading_date_raises_error_then_returns_none(self, mock_run):
-        """Should return None when subprocess raises error"""
-        mock_run.side_effect = subprocess.CalledProcessError(1, 'cmd')
+        """Should return None when the exiftool process dies"""
+        mock_run.side_effect = BrokenPipeError('exiftool exited unexpectedly')
         result = self.exiftool.read_date_from_xmp(self.test_xmp)
         self.assertIsNone(result)
 
-    @patch('subprocess.run')
+    @patch.object(ExifToolSession, 'execute')
     def test_when_writing_metadata_then_formats_command_correctly(self, mock_run):
         """Should format exiftool command with correct flags and values"""
         mock_run.return_value = MagicMock(returncode=0)
@@ -122,16 +145,16 @@ class TestExifTool(unittest.TestCase):
         self.assertIn('-Keywords=test,video', cmd_args)  # Keywords are joined with commas
         self.assertNotIn('-Empty', cmd_args)
 
-    @patch('subprocess.run')
+    @patch.object(ExifToolSession, 'execute')
     def test_when_writing_metadata_fails_then_returns_false(self, mock_run):
         """Should return False when exiftool fails to write metadata"""
-        mock_run.side_effect = subprocess.CalledProcessError(1, 'cmd')
+        mock_run.side_effect = BrokenPipeError('exiftool exited unexpectedly')
         fields = {'Title': 'Test Video'}
 
         result = self.exiftool.write_metadata(self.test_file, fields)
         self.assertFalse(result)
 
-    @patch('subprocess.run')
+    @patch.object(ExifToolSession, 'execute')
     def test_when_writing_metadata_nonzero_exit_then_returns_false(self, mock_run):
         """Should return False when exiftool returns non-zero"""
         mock_run.return_value = MagicMock(
@@ -143,7 +166,7 @@ class TestExifTool(unittest.TestCase):
         result = self.exiftool.write_metadata(self.test_file, fields)
         self.assertFalse(result)
 
-    @patch('subprocess.run')
+    @patch.object(ExifToolSession, 'execute')
     def test_when_writing_metadata_with_predashed_fields_then_preserves_dash(self, mock_run):
         """Should preserve existing dashes in field names and not add extra ones"""
         mock_run.return_value = MagicMock(returncode=0)
@@ -166,7 +189,7 @@ class TestExifTool(unittest.TestCase):
         # Make sure no double-dashes were created
         self.assertNotIn('--', ' '.join(cmd_args))
 
-    @patch('subprocess.run')
+    @patch.object(ExifToolSession, 'execute')
     def test_when_copying_metadata_then_formats_command_correctly(self, mock_run):
         """Should format copy metadata command correctly"""
         mock_run.return_value = MagicMock(returncode=0)
@@ -179,17 +202,17 @@ class TestExifTool(unittest.TestCase):
         cmd_args = mock_run.call_args[0][0]
         self.assertEqual(cmd_args[-3:], ['-TagsFromFile', str(source), str(target)])
 
-    @patch('subprocess.run')
+    @patch.object(ExifToolSession, 'execute')
     def test_when_copying_metadata_fails_then_returns_false(self, mock_run):
         """Should return False when copy metadata fails"""
-        mock_run.side_effect = subprocess.CalledProcessError(1, 'cmd')
+        mock_run.side_effect = BrokenPipeError('exiftool exited unexpectedly')
         source = Path('/test/source.mov')
         target = Path('/test/target.mov')
 
         result = self.exiftool.copy_metadata(source, target)
         self.assertFalse(result)
 
-    @patch('subprocess.run')
+    @patch.object(ExifToolSession, 'execute')
     def test_when_copying_metadata_nonzero_exit_then_returns_false(self, mock_run):
         """Should return False when copy returns non-zero"""
         mock_run.return_value = MagicMock(
@@ -202,16 +225,16 @@ class TestExifTool(unittest.TestCase):
         result = self.exiftool.copy_metadata(source, target)
         self.assertFalse(result)
 
-    @patch('subprocess.run')
+    @patch.object(ExifToolSession, 'execute')
     def test_when_updating_keywords_fails_then_returns_false(self, mock_run):
         """Should return False when exiftool fails to update keywords"""
-        mock_run.side_effect = subprocess.CalledProcessError(1, 'cmd')
+        mock_run.side_effect = BrokenPipeError('exiftool exited unexpectedly')
         keywords = ['test']
 
         result = self.exiftool.update_keywords(self.test_file, keywords)
         self.assertFalse(result)
 
-    @patch('subprocess.run')
+    @patch.object(ExifToolSession, 'execute')
     def test_when_updating_keywords_nonzero_exit_then_returns_false(self, mock_run):
         """Should return False when keywords update returns non-zero"""
         mock_run.return_value = MagicMock(
@@ -223,7 +246,7 @@ class TestExifTool(unittest.TestCase):
         result = self.exiftool.update_keywords(self.test_file, keywords)
         self.assertFalse(result)
 
-    @patch('subprocess.run')
+    @patch.object(ExifToolSession, 'execute')
     def test_when_metadata_has_integer_values_then_converts_to_strings(self, mock_run):
         """Should convert integer values to strings when reading metadata"""
         input_metadata = {
@@ -248,7 +271,7 @@ class TestExifTool(unittest.TestCase):
         result = self.exiftool.read_all_metadata(self.test_file)
         self.assertEqual(result, expected_metadata)
 
-    @patch('subprocess.run')
+    @patch.object(ExifToolSession, 'execute')
     def test_when_writing_metadata_with_integer_values_then_converts_to_strings(self, mock_run):
         """Should convert integer values to strings when writing metadata"""
         fields = {
@@ -265,5 +288,171 @@ class TestExifTool(unittest.TestCase):
         self.assertIn('-Rating=2', cmd_args)
         self.assertIn('-Keywords=test,123,456', cmd_args)
 
+    @patch.object(ExifToolSession, 'execute_many')
+    def test_when_writing_and_reading_then_uses_one_round_trip(self, mock_execute_many):
+        """Should send the write and the read-back together and parse the read"""
+        mock_execute_many.return_value = [
+            MagicMock(returncode=0, stdout='', stderr=''),
+            MagicMock(returncode=0, stdout=json.dumps([{'XMP:Title': 'New'}]), stderr='')
+        ]
+
+        success, metadata = self.exiftool.write_and_read_metadata(self.test_file, {'-XMP:Title': 'New'})
+
+        self.assertTrue(success)
+        self.assertEqual(metadata, {'XMP:Title': 'New'})
+        write_args, read_args = mock_execute_many.call_args[0][0]
+        self.assertIn('-XMP:Title=New', write_args)
+        self.assertEqual(read_args[:3], ['-j', '-m', '-G'])
+
+    @patch.object(ExifToolSession, 'execute_many')
+    def test_when_combined_write_fails_then_returns_false_and_no_metadata(self, mock_execute_many):
+        """Should ignore the read-back when the write failed"""
+        mock_execute_many.return_value = [
+            MagicMock(returncode=1, stdout='', stderr='Error: bad tag'),
+            MagicMock(returncode=0, stdout=json.dumps([{'XMP:Title': 'Old'}]), stderr='')
+        ]
+
+        self.assertEqual(self.exiftool.write_and_read_metadata(self.test_file, {'-XMP:Title': 'New'}), (False, {}))
+
+    @patch.object(ExifToolSession, 'execute')
+    def test_when_reading_batch_then_keys_results_by_source_file(self, mock_execute):
+        """Should read every file in one command and keep results even if one file failed"""
+        mock_execute.return_value = MagicMock(returncode=1, stderr='Error: File not found - /test/c.jpg',
+            stdout=json.dumps([{'SourceFile': '/test/a.jpg', 'EXIF:Rating': 3},
+                               {'SourceFile': '/test/b.jpg', 'XMP:Title': 'B'}]))
+
+        result = self.exiftool.read_metadata_batch([Path('/test/a.jpg'), '/test/b.jpg', '/test/c.jpg'], tags=['Rating'])
+
+        mock_execute.assert_called_once_with(['-j', '-m', '-G', '-fast2', '-Rating', '/test/a.jpg', '/test/b.jpg', '/test/c.jpg'])
+        self.assertEqual(result['/test/a.jpg']['EXIF:Rating'], '3')
+        self.assertEqual(result['/test/b.jpg']['XMP:Title'], 'B')
+        self.assertNotIn('/test/c.jpg', result)
+
+class TestExifToolSession(unittest.TestCase):
+    def setUp(self):
+        self.session = ExifToolSession()
+        self.process = MagicMock()
+        self.process.poll.return_value = None
+        self.session._process = self.process
+
+    def test_when_executing_then_writes_argfile_and_parses_output(self):
+        """Should send one arg per line ending in -execute and split output at the sentinels"""
+        self.process.stdout = io.StringIO('[{"Title": "Test"}]\n{ready1}\n')
+        self.process.stderr = io.StringIO('Warning: minor\n{status1 0}\n')
+
+        result = self.session.execute(['-j', '/test/path/file.mov'])
+
+        written = self.process.stdin.write.call_args[0][0]
+        self.assertEqual(written.splitlines(), ['-j', '/test/path/file.mov', '-echo4', '{status1 ${status}}', '-execute1'])
+        self.assertEqual(result.returncode, 0)
+        self.assertEqual(result.stdout, '[{"Title": "Test"}]\n')
+        self.assertEqual(result.stderr, 'Warning: minor\n')
+
+    def test_when_command_fails_then_returns_exit_status(self):
+        """Should report exiftool's exit status for the command"""
+        self.process.stdout = io.StringIO('{ready1}\n')
+        self.process.stderr = io.StringIO('Error: File not found\n{status1 1}\n')
+
+        result = self.session.execute(['-j', '/missing.mov'])
+
+        self.assertEqual(result.returncode, 1)
+        self.assertEqual(result.stderr, 'Error: File not found\n')
+
+    def test_when_process_dies_then_raises_and_resets(self):
+        """Should raise OSError and drop the dead process so the next call respawns it"""
+        self.process.stdout = io.StringIO('')
+        self.process.stderr = io.StringIO('')
+
+        with self.assertRaises(OSError):
+            self.session.execute(['-j', '/test/path/file.mov'])
+        self.assertIsNone(self.session._process)
+
+    def test_when_executing_many_then_writes_all_before_reading(self):
+        """Should pipeline the commands in one write and split the replies in order"""
+        self.process.stdout = io.StringIO('{ready1}\n[{"Title": "Test"}]\n{ready2}\n')
+        self.process.stderr = io.StringIO('{status1 0}\n{status2 0}\n')
+
+        write_result, read_result = self.session.execute_many([
+            ['-Title=Test', '/test/path/file.mov'],
+            ['-j', '/test/path/file.mov']
+        ])
+
+        self.process.stdin.write.assert_called_once()
+        self.assertEqual(self.process.stdin.write.call_args[0][0].count('-execute'), 2)
+        self.assertEqual(write_result.stdout, '')
+        self.assertEqual(read_result.stdout, '[{"Title": "Test"}]\n')
+
+    def test_when_earlier_reply_was_abandoned_then_skips_its_output(self):
+        """Should match a reply to its own numbered sentinel and drop stale output"""
+        self.session._numbers = iter([2])
+        self.process.stdout = io.StringIO('[{"Title": "Stale"}]\n{ready1}\n[{"Title": "Test"}]\n{ready2}\n')
+        self.process.stderr = io.StringIO('Error: stale\n{status1 1}\n{status2 0}\n')
+
+        result = self.session.execute(['-j', '/test/path/file.mov'])
+
+        self.assertEqual(result.returncode, 0)
+        self.assertEqual(result.stdout, '[{"Title": "Test"}]\n')
+        self.assertEqual(result.stderr, '')
+
+    def test_when_stderr_outgrows_pipe_buffer_then_still_reads_reply(self):
+        """Should drain stderr while waiting for stdout so exiftool never blocks on a full pipe"""
+        out_read, out_write = os.pipe()
+        err_read, err_write = os.pipe()
+        self.process.stdout = open(out_read, encoding='utf-8')
+        self.process.stderr = open(err_read, encoding='utf-8')
+
+        def exiftool():
+            # Like a batch read with many failing files: warnings first, far past the pipe buffer
+            with open(err_write, 'w') as err, open(out_write, 'w') as out:
+                err.write('Warning: bad file\n' * 20000)
+                err.flush()
+                out.write('[]\n{ready1}\n')
+                out.flush()
+                err.write('{status1 0}\n')
+
+        writer = threading.Thread(target=exiftool, daemon=True)
+        writer.start()
+        result = self.session.execute(['-j', '/test/a.jpg'])
+        writer.join(timeout=5)
+        self.process.stdout.close()
+
+        self.assertEqual(result.stdout, '[]\n')
+        self.assertEqual(result.stderr.count('Warning: bad file'), 20000)
+
+    @patch('subprocess.run')
+    def test_when_argument_contains_newline_then_runs_one_shot(self, mock_run):
+        """Should bypass the argfile for arguments it cannot represent"""
+        self.session.execute(['-Caption=line one\nline two', '/test/path/file.mov'])
+
+        mock_run.assert_called_once_with(
+            [EXIFTOOL_BIN, '-Caption=line one\nline two', '/test/path/file.mov'],
+            capture_output=True,
+            text=True
+        )
+        self.process.stdin.write.assert_not_called()
+
+    def test_when_closing_then_asks_process_to_exit(self):
+        """Should send -stay_open False and wait for the process"""
+        self.session.close()
+
+        self.process.stdin.write.assert_called_once_with('-stay_open\nFalse\n')
+        self.process.wait.assert_called_once()
+        self.assertIsNone(self.session._process)
+    @patch('utils.exiftool.atexit.register')
+    def test_when_session_first_requested_then_registers_shutdown_once(self, mock_register):
+        """Should share one session and close it at interpreter exit"""
+        with patch.object(exiftool_module, '_session', None):
+            session = get_session()
+            self.assertIs(get_session(), session)
+        mock_register.assert_called_once_with(session.close)
+
+    @patch('utils.exiftool.atexit.register')
+    def test_when_requested_from_forked_worker_then_starts_own_session(self, mock_register):
+        """Should not reuse a session created by the parent process"""
+        with patch.object(exiftool_module, '_session', None):
+            parent_session = get_session()
+            with patch('utils.exiftool.os.getpid', return_value=-1):
+                self.assertIsNot(get_session(), parent_session)
+
 if __name__ == '__main__':
     unittest.main()
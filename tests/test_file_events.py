@@ -0,0 +1,87 @@
+#!/usr/bin/env python3
+
+import unittest
+from unittest.mock import patch, Mock, MagicMock
+from pathlib import Path
+
+import utils.file_events as file_events
+from utils.file_events import FileEventMonitor, _QueueingHandler
+
+
+class TestFileEventMonitor(unittest.TestCase):
+    """Test cases for FileEventMonitor."""
+
+    def setUp(self):
+        self.monitor = FileEventMonitor(['/test/dir1', '/test/dir2'])
+
+    def test_when_initializing_then_converts_to_paths(self):
+        """Should store watched directories as Path objects."""
+        self.assertEqual(self.monitor.directories, [Path('/test/dir1'), Path('/test/dir2')])
+        self.assertFalse(self.monitor.is_event_driven)
+
+    def test_when_watchdog_missing_then_start_returns_false(self):
+        """Should fall back to polling when watchdog is not installed."""
+        with patch.object(file_events, 'Observer', None):
+            self.assertFalse(self.monitor.start())
+            self.assertFalse(self.monitor.is_event_driven)
+
+    @patch('utils.file_events.time.sleep')
+    def test_when_polling_then_wait_sleeps_and_returns_nothing(self, mock_sleep):
+        """Should sleep for the timeout when no observer is running."""
+        result = self.monitor.wait(10)
+        self.assertEqual(result, [])
+        mock_sleep.assert_called_once_with(10)
+
+    def test_when_events_queued_then_wait_drains_burst(self):
+        """Should return every queued path from a single wake-up."""
+        self.monitor._observer = Mock()
+        self.monitor.events.put(Path('/test/dir1/a.jpg'))
+        self.monitor.events.put(Path('/test/dir1/b.jpg'))
+
+        result = self.monitor.wait(1)
+
+        self.assertEqual(result, [Path('/test/dir1/a.jpg'), Path('/test/dir1/b.jpg')])
+        self.assertTrue(self.monitor.events.empty())
+
+    def test_when_no_events_then_wait_times_out(self):
+        """Should return an empty list when nothing arrives before the timeout."""
+        self.monitor._observer = Mock()
+        self.assertEqual(self.monitor.wait(0.01), [])
+
+    def test_when_stopping_then_stops_observer(self):
+        """Should stop and join the observer thread."""
+        observer = Mock()
+        self.monitor._observer = observer
+
+        self.monitor.stop()
+
+        observer.stop.assert_called_once()
+        observer.join.assert_called_once()
+        self.assertFalse(self.monitor.is_event_driven)
+
+
+class TestQueueingHandler(unittest.TestCase):
+    """Test cases for the watchdog event handler."""
+
+    def setUp(self):
+        self.monitor = FileEventMonitor([])
+        self.handler = _QueueingHandler(self.monitor.events)
+
+    def test_when_file_created_then_queues_path(self):
+        """Should queue the path of a created file."""
+        self.handler.on_created(MagicMock(is_directory=False, src_path='/test/dir1/a.jpg'))
+        self.assertEqual(self.monitor.events.get_nowait(), Path('/test/dir1/a.jpg'))
+
+    def test_when_file_moved_in_then_queues_destination(self):
+        """Should queue the destination path of a moved file."""
+        self.handler.on_moved(MagicMock(is_directory=False, src_path='/tmp/a.jpg', dest_path='/test/dir1/a.jpg'))
+        self.assertEqual(self.monitor.events.get_nowait(), Path('/test/dir1/a.jpg'))
+
+    def test_when_directory_created_then_ignores_event(self):
+        """Should ignore directory events."""
+        self.handler.on_created(MagicMock(is_directory=True, src_path='/test/dir1/sub'))
+        self.assertTrue(self.monitor.events.empty())
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -5,6 +5,7 @@ from pathlib import Path
 from unittest.mock import MagicMock, patch
 
 from apple_photos_sdk.import_manager import ImportManager
+from utils.exiftool import ExifToolSession
 
 class TestImportManager(unittest.TestCase):
     """Test cases for ImportManager."""
@@ -411,7 +412,7 @@ class TestImportManager(unittest.TestCase):
             self.assertFalse(success)
             self.assertIsNone(asset_id)
 
-    @patch('subprocess.run')
+    @patch.object(ExifToolSession, 'execute')
     def test_when_importing_photo_then_gets_keywords(self, mock_run):
         """Should get keywords from original file before import."""
         # Mock exiftool output for both calls
@@ -461,14 +462,10 @@ class TestImportManager(unittest.TestCase):
             self.assertEqual(asset_id, 'test-id')
             self.assertEqual(mock_run.call_count, 2)
             mock_run.assert_any_call(
-                ["exiftool", "-XMP:Subject", "-s", "-s", "-sep", "||", str(self.test_file)],
-                capture_output=True,
-                text=True
+                ["-XMP:Subject", "-s", "-s", "-sep", "||", str(self.test_file)]
             )
             mock_run.assert_any_call(
-                ["exiftool", "-IPTC:ObjectName", "-XMP:Title", "-s", "-s", "-j", str(self.test_file)],
-                capture_output=True,
-                text=True
+                ["-IPTC:ObjectName", "-XMP:Title", "-s", "-s", "-j", str(self.test_file)]
             )
 
     @patch('apple_photos_sdk.import_manager.PHPhotoLibrary')
@@ -511,7 +508,7 @@ class TestImportManager(unittest.TestCase):
 
     def test_is_targeted_keyword(self):
         manager = ImportManager()
-        with patch('apple_photos_sdk.import_manager.TARGETED_ALBUM_PREFIXES', ['MyPrefix']):
+        with patch('apple_photos_sdk.import_manager.TARGETED_ALBUM_PREFIXES', ('MyPrefix',)):
             self.assertTrue(manager._is_targeted_keyword('MyPrefixSomething'))
             self.assertTrue(manager._is_targeted_keyword('Subject: MyPrefixSomething'))
             self.assertFalse(manager._is_targeted_keyword('OtherPrefixSomething'))
@@ -524,19 +521,19 @@ class TestImportManager(unittest.TestCase):
         manager = ImportManager()
         self.assertEqual(manager._handle_image_data(None, None, None, None), [])
 
-    @patch('apple_photos_sdk.import_manager.subprocess.run')
+    @patch.object(ExifToolSession, 'execute')
     def test_get_original_keywords_success(self, mock_run):
         manager = ImportManager()
         mock_result = MagicMock()
         mock_result.returncode = 0
         mock_result.stdout = 'keyword1||keyword2||keyword3'
         mock_run.return_value = mock_result
-        with patch('apple_photos_sdk.import_manager.TARGETED_ALBUM_PREFIXES', ['keyword']):
+        with patch('apple_photos_sdk.import_manager.TARGETED_ALBUM_PREFIXES', ('keyword',)):
             keywords = manager._get_original_keywords(Path('photo.jpg'))
             self.assertEqual(keywords, ['keyword1', 'keyword2', 'keyword3'])
             mock_run.assert_called_once()
 
-    @patch('apple_photos_sdk.import_manager.subprocess.run')
+    @patch.object(ExifToolSession, 'execute')
     def test_get_original_keywords_no_keywords(self, mock_run):
         manager = ImportManager()
         mock_result = MagicMock()
@@ -546,14 +543,14 @@ class TestImportManager(unittest.TestCase):
         keywords = manager._get_original_keywords(Path('photo.jpg'))
         self.assertEqual(keywords, [])
 
-    @patch('apple_photos_sdk.import_manager.subprocess.run')
+    @patch.object(ExifToolSession, 'execute')
     def test_get_original_keywords_exception(self, mock_run):
         manager = ImportManager()
         mock_run.side_effect = Exception('fail')
         keywords = manager._get_original_keywords(Path('photo.jpg'))
         self.assertEqual(keywords, [])
 
-    @patch('apple_photos_sdk.import_manager.subprocess.run')
+    @patch.object(ExifToolSession, 'execute')
     def test_get_original_title_success(self, mock_run):
         manager = ImportManager()
         mock_result = MagicMock()
@@ -563,7 +560,7 @@ class TestImportManager(unittest.TestCase):
         title = manager._get_original_title(Path('photo.jpg'))
         self.assertEqual(title, 'Title1')
 
-    @patch('apple_photos_sdk.import_manager.subprocess.run')
+    @patch.object(ExifToolSession, 'execute')
     def test_get_original_title_no_title(self, mock_run):
         manager = ImportManager()
         mock_result = MagicMock()
@@ -573,7 +570,7 @@ class TestImportManager(unittest.TestCase):
         title = manager._get_original_title(Path('photo.jpg'))
         self.assertIsNone(title)
 
-    @patch('apple_photos_sdk.import_manager.subprocess.run')
+    @patch.object(ExifToolSession, 'execute')
     def test_get_original_title_invalid_json(self, mock_run):
         manager = ImportManager()
         mock_result = MagicMock()
@@ -583,7 +580,7 @@ class TestImportManager(unittest.TestCase):
         title = manager._get_original_title(Path('photo.jpg'))
         self.assertIsNone(title)
 
-    @patch('apple_photos_sdk.import_manager.subprocess.run')
+    @patch.object(ExifToolSession, 'execute')
     def test_get_original_title_exception(self, mock_run):
         manager = ImportManager()
         mock_run.side_effect = Exception('fail')
@@ -288,6 +288,21 @@ class TestIncomingMover(unittest.TestCase):
             except Exception:
                 self.fail("run_cycle should not raise exceptions")
                 
+    @patch('incoming_mover.FileEventMonitor')
+    def test_when_running_then_waits_on_source_directory_events(self, mock_monitor_class):
+        """Should watch the source directories and run a cycle after each wake-up."""
+        monitor = mock_monitor_class.return_value
+        monitor.start.return_value = True
+        monitor.wait.side_effect = [[self.test_source1 / 'a__LRE.jpg'], [], KeyboardInterrupt]
+
+        with patch.object(self.mover, 'run_cycle') as mock_cycle:
+            self.mover.run()
+
+        self.assertEqual(list(mock_monitor_class.call_args[0][0]), [self.test_source1, self.test_source2])
+        self.assertEqual(mock_cycle.call_count, 3)
+        monitor.wait.assert_called_with(self.mover.sleep_time)
+        monitor.stop.assert_called_once()
+
     # 8. Integration Tests with Real Filesystem
     def test_integration_with_real_files(self):
         """Integration test with actual temporary files and directories."""
@@ -1,12 +1,16 @@
 #!/usr/bin/env python3
 
 import unittest
-from unittest.mock import patch, Mock, MagicMock, mock_open
+from unittest.mock import patch, Mock, MagicMock
 from pathlib import Path
 import tempfile
 import shutil
 import os
+import errno
+import pickle
+from concurrent.futures import ThreadPoolExecutor
 
+import incoming_watcher
 from incoming_watcher import IncomingWatcher
 
 
@@ -34,12 +38,12 @@ class TestIncomingWatcher(unittest.TestCase):
         self.assertEqual(str(self.watcher.both_incoming), self.test_both_incoming)
         self.assertEqual(self.watcher.sleep_time, 1)
         
-    def test_when_initializing_then_sets_file_patterns(self):
-        """Should initialize with correct file patterns."""
-        self.assertEqual(self.watcher.jpeg_pattern, '*.[Jj][Pp][Gg]')
-        self.assertIn('*.mp4', self.watcher.video_patterns)
-        self.assertIn('*.mov', self.watcher.video_patterns)
-        self.assertIn('*.m4v', self.watcher.video_patterns)
+    def test_when_initializing_then_sets_file_suffixes(self):
+        """Should initialize with the lower-case suffixes the scan matches."""
+        self.assertEqual(self.watcher.jpeg_suffixes, ('.jpg', '.jpeg'))
+        self.assertIn('.mp4', self.watcher.video_suffixes)
+        self.assertIn('.mov', self.watcher.video_suffixes)
+        self.assertIn('.m4v', self.watcher.video_suffixes)
         
     def test_when_getting_sequence_then_increments_counter(self):
         """Should increment sequence counter and return formatted string."""
@@ -86,21 +90,92 @@ class TestIncomingWatcher(unittest.TestCase):
         
         with patch.object(self.watcher, 'both_incoming', mock_both_path), \
              patch.object(self.watcher, 'incoming_directories', [mock_ron, mock_claudia]), \
-             patch('builtins.open', mock_open()), \
-             patch('shutil.copy') as mock_copy:
+             patch.object(self.watcher, '_is_file_ready', return_value=(True, "Ready")), \
+             patch('utils.watcher_mixins.os.link', side_effect=OSError(errno.EXDEV, "Cross-device link")), \
+             patch('shutil.copyfile') as mock_copy, \
+             patch('shutil.copystat') as mock_copystat:
             
             result = self.watcher.process_both_incoming()
             
             self.assertTrue(result)
-            # Should copy to both directories
+            # Should fall back to copying into both directories
             self.assertEqual(mock_copy.call_count, 2)
+            self.assertEqual(mock_copystat.call_count, 2)
             # Should delete original
             mock_file.unlink.assert_called_once()
             
-    def test_when_file_is_locked_then_skips_file(self):
-        """Should skip files that are currently open/locked."""
+    def test_when_distributing_several_files_then_creates_destinations_once(self):
+        """Should create each incoming directory once per pass, not once per file."""
+        mock_files = []
+        for name in ("a.jpg", "b.jpg", "c.jpg"):
+            mock_file = MagicMock(spec=Path)
+            mock_file.name = name
+            mock_file.is_file.return_value = True
+            mock_files.append(mock_file)
+        
+        mock_both_path = MagicMock(spec=Path)
+        mock_both_path.exists.return_value = True
+        mock_both_path.glob.return_value = mock_files
+        mock_ron = MagicMock(spec=Path)
+        mock_claudia = MagicMock(spec=Path)
+        
+        with patch.object(self.watcher, 'both_incoming', mock_both_path), \
+             patch.object(self.watcher, 'incoming_directories', [mock_ron, mock_claudia]), \
+             patch.object(self.watcher, '_is_file_ready', return_value=(True, "Ready")), \
+             patch.object(self.watcher, '_link_or_copy', return_value="Linked") as mock_link:
+            
+            self.watcher.process_both_incoming()
+            
+        mock_ron.mkdir.assert_called_once_with(parents=True, exist_ok=True)
+        mock_claudia.mkdir.assert_called_once_with(parents=True, exist_ok=True)
+        self.assertEqual(mock_link.call_count, 6)
+            
+    def test_when_same_filesystem_then_hard_links_instead_of_copying(self):
+        """Should hard-link into each incoming directory without copying bytes."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            source = Path(temp_dir) / "test.jpg"
+            source.write_bytes(b"jpeg data")
+            dest_path = Path(temp_dir) / "linked.jpg"
+            
+            with patch('shutil.copyfile') as mock_copy:
+                action = self.watcher._link_or_copy(source, dest_path)
+                
+            self.assertEqual(action, "Linked")
+            mock_copy.assert_not_called()
+            self.assertEqual(dest_path.stat().st_ino, source.stat().st_ino)
+            
+    def test_when_destination_exists_then_replaces_it_with_link(self):
+        """Should replace a leftover destination file with a fresh hard link."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            source = Path(temp_dir) / "test.jpg"
+            source.write_bytes(b"jpeg data")
+            dest_path = Path(temp_dir) / "linked.jpg"
+            dest_path.write_bytes(b"stale")
+            
+            action = self.watcher._link_or_copy(source, dest_path)
+            
+            self.assertEqual(action, "Linked")
+            self.assertEqual(dest_path.stat().st_ino, source.stat().st_ino)
+            
+    def test_when_link_fails_then_copies_with_source_mtime(self):
+        """Should copy the file and keep its modification time when linking fails."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            source = Path(temp_dir) / "test.jpg"
+            source.write_bytes(b"jpeg data")
+            os.utime(source, (1000000000, 1000000000))
+            dest_path = Path(temp_dir) / "copied.jpg"
+            
+            with patch('utils.watcher_mixins.os.link', side_effect=OSError(errno.EXDEV, "Cross-device link")):
+                action = self.watcher._link_or_copy(source, dest_path)
+                
+            self.assertEqual(action, "Copied")
+            self.assertEqual(dest_path.read_bytes(), b"jpeg data")
+            self.assertEqual(dest_path.stat().st_mtime, 1000000000)
+            
+    def test_when_file_is_still_changing_then_skips_file(self):
+        """Should skip files whose size/mtime changed since the previous pass."""
         mock_file = MagicMock(spec=Path)
-        mock_file.name = "locked.jpg"
+        mock_file.name = "growing.jpg"
         mock_file.is_file.return_value = True
         
         mock_both_path = MagicMock(spec=Path)
@@ -108,14 +183,39 @@ class TestIncomingWatcher(unittest.TestCase):
         mock_both_path.glob.return_value = [mock_file]
         
         with patch.object(self.watcher, 'both_incoming', mock_both_path), \
-             patch('builtins.open', side_effect=IOError("File is locked")), \
+             patch.object(self.watcher, '_is_file_ready', return_value=(False, "File still being written")), \
              patch('shutil.copy') as mock_copy:
             
             result = self.watcher.process_both_incoming()
             
-            self.assertTrue(result)  # Found files, even if locked
-            mock_copy.assert_not_called()  # Should not copy locked files
-            mock_file.unlink.assert_not_called()  # Should not delete locked files
+            self.assertTrue(result)  # Found files, even if not ready
+            mock_copy.assert_not_called()  # Should not copy changing files
+            mock_file.unlink.assert_not_called()  # Should not delete changing files
+            
+    def test_when_file_first_seen_then_waits_for_second_pass(self):
+        """Should only report a file stable once its size/mtime repeat."""
+        stat_result = Mock(st_size=1000, st_mtime=100.0)
+        file_path = Path("/test/both/incoming/test.jpg")
+        
+        self.assertFalse(self.watcher._is_file_stable(file_path, stat_result))
+        self.assertTrue(self.watcher._is_file_stable(file_path, stat_result))
+        
+        grown = Mock(st_size=2000, st_mtime=101.0)
+        self.assertFalse(self.watcher._is_file_stable(file_path, grown))
+            
+    def test_when_checking_readiness_then_classifies_with_one_stat(self):
+        """Should report missing paths, directories, empty and fresh files as not ready."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            directory = Path(temp_dir)
+            empty = directory / 'empty.jpg'
+            empty.touch()
+            fresh = directory / 'fresh.jpg'
+            fresh.write_bytes(b'data')
+            
+            self.assertEqual(self.watcher._is_file_ready(directory / 'missing.jpg'), (False, "File does not exist"))
+            self.assertEqual(self.watcher._is_file_ready(directory), (False, "Not a regular file"))
+            self.assertEqual(self.watcher._is_file_ready(empty), (False, "Zero-byte file"))
+            self.assertFalse(self.watcher._is_file_ready(fresh)[0])
             
     # 3. File Processing Tests
     def test_when_processing_non_file_then_returns_false(self):
@@ -171,7 +271,7 @@ class TestIncomingWatcher(unittest.TestCase):
             result = self.watcher.process_file(mock_path)
             
             self.assertTrue(result)
-            mock_processor_class.assert_called_once_with(str(mock_path), sequence="0001")
+            mock_processor_class.assert_called_once_with(str(mock_path), sequence="0001", exif_data=None)
             mock_processor.process_image.assert_called_once()
             
     def test_when_processing_video_then_calls_video_processor(self):
@@ -179,7 +279,7 @@ class TestIncomingWatcher(unittest.TestCase):
         mock_path = MagicMock(spec=Path)
         mock_path.is_file.return_value = True
         mock_path.name = "test.mp4"
-        mock_path.match.side_effect = lambda pattern: pattern == "*.mp4"
+        mock_path.suffix.lower.return_value = ".mp4"
         
         mock_stat = Mock()
         mock_stat.st_size = 1000
@@ -242,44 +342,107 @@ class TestIncomingWatcher(unittest.TestCase):
         self.assertEqual(result, 0)
         
     def test_when_directory_has_files_then_processes_them(self):
-        """Should process files found in directory."""
-        mock_dir = MagicMock(spec=Path)
-        mock_dir.exists.return_value = True
-        mock_dir.name = "test_dir"
-        
-        mock_jpeg = MagicMock(spec=Path)
-        mock_video = MagicMock(spec=Path)
-        
-        # Mock glob returns for different patterns
-        def glob_side_effect(pattern):
-            if pattern == '*.[Jj][Pp][Gg]':
-                return [mock_jpeg]
-            elif pattern in ['*.mp4', '*.mov', '*.m4v', '*.MP4', '*.MOV', '*.M4V']:
-                if pattern == '*.mp4':
-                    return [mock_video]
-                return []
-            return []
-            
-        mock_dir.glob.side_effect = glob_side_effect
-        
-        with patch.object(self.watcher, 'process_file', return_value=True) as mock_process:
-            result = self.watcher.check_directory(mock_dir)
+        """Should process JPEGs then videos found in directory."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            directory = Path(temp_dir)
+            for name in ['photo.JPG', 'clip.mp4', 'notes.txt', 'done__LRE.jpg']:
+                (directory / name).write_bytes(b'data')
+            (directory / 'subdir.jpg').mkdir()
+            self.watcher.max_workers = 1  # Inline processing keeps the call order observable
             
+            with patch.object(self.watcher, '_bulk_read_metadata', return_value={}), \
+                 patch('incoming_watcher._process_file_worker', return_value=True) as mock_worker:
+                result = self.watcher.check_directory(directory)
+                
             self.assertEqual(result, 2)  # 1 JPEG + 1 video
-            self.assertEqual(mock_process.call_count, 2)
-            mock_process.assert_any_call(mock_jpeg)
-            mock_process.assert_any_call(mock_video)
+            self.assertEqual(
+                [c.args[0] for c in mock_worker.call_args_list],
+                [str(directory / 'photo.JPG'), str(directory / 'clip.mp4')]
+            )
+            
+    def test_when_directory_has_jpegs_then_reads_their_metadata_in_one_batch(self):
+        """Should read JPEG metadata once per sweep and hand each worker its entry."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            directory = Path(temp_dir)
+            for name in ['a.jpg', 'b.jpeg', 'clip.mp4']:
+                (directory / name).write_bytes(b'data')
+            self.watcher.max_workers = 1
+            jpeg_metadata = {directory / 'a.jpg': {'XMP:Title': 'a'}}
+            
+            with patch.object(self.watcher, '_bulk_read_metadata', return_value=jpeg_metadata) as mock_read, \
+                 patch('incoming_watcher._process_file_worker', return_value=True) as mock_worker:
+                self.watcher.check_directory(directory)
+                
+            mock_read.assert_called_once()
+            self.assertEqual(sorted(mock_read.call_args.args[0]), [directory / 'a.jpg', directory / 'b.jpeg'])
+            self.assertEqual(mock_read.call_args.kwargs['tags'], incoming_watcher.JPEGExifProcessor.exif_tags)
+            passed = {Path(c.args[0]).name: c.args[2] for c in mock_worker.call_args_list}
+            self.assertEqual(passed, {'a.jpg': {'XMP:Title': 'a'}, 'b.jpeg': None, 'clip.mp4': None})
+            
+    def test_when_several_files_then_processes_in_pool_with_unique_sequences(self):
+        """Should submit each file with its own sequence and count the successes."""
+        files = [Path('/test/ron/incoming/a.jpg'), Path('/test/ron/incoming/b.jpg'), Path('/test/ron/incoming/c.mp4')]
+        self.watcher.max_workers = 2
+        
+        with ThreadPoolExecutor(max_workers=2) as executor, \
+             patch.object(self.watcher, '_get_executor', return_value=executor), \
+             patch.object(self.watcher, '_bulk_read_metadata', return_value={}), \
+             patch('incoming_watcher._process_file_worker', side_effect=[True, False, True]) as mock_worker:
+            result = self.watcher._process_files(files)
+            
+        self.assertEqual(result, 2)
+        self.assertEqual(sorted(c.args[1] for c in mock_worker.call_args_list), ['0001', '0002', '0003'])
+        
+    def test_when_submitting_to_pool_then_sends_only_picklable_job_data(self):
+        """Should submit the module-level worker so jobs pickle without the watcher."""
+        files = [Path('/test/ron/incoming/a.jpg'), Path('/test/ron/incoming/b.jpg')]
+        self.watcher.max_workers = 2
+        
+        with ThreadPoolExecutor(max_workers=2) as executor, \
+             patch.object(self.watcher, '_get_executor', return_value=executor), \
+             patch.object(self.watcher, '_bulk_read_metadata', return_value={files[0]: {'XMP:Title': 'a'}}), \
+             patch.object(executor, 'submit', wraps=executor.submit) as mock_submit:
+            self.watcher._process_files(files)
             
+        self.assertEqual(mock_submit.call_count, 2)
+        for call in mock_submit.call_args_list:
+            self.assertIs(call.args[0], incoming_watcher._process_file_worker)
+            pickle.dumps(call.args)
+        
     def test_when_directory_empty_then_returns_zero(self):
         """Should return 0 when directory has no processable files."""
-        mock_dir = MagicMock(spec=Path)
-        mock_dir.exists.return_value = True
-        mock_dir.name = "empty_dir"
-        mock_dir.glob.return_value = []  # No files
-        
-        result = self.watcher.check_directory(mock_dir)
+        with tempfile.TemporaryDirectory() as temp_dir:
+            result = self.watcher.check_directory(Path(temp_dir))
         self.assertEqual(result, 0)
         
+    def test_when_directory_unchanged_and_empty_then_skips_rescan(self):
+        """Should not rescan an empty directory until an entry is added."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            directory = Path(temp_dir)
+            self.assertEqual(self.watcher.check_directory(directory), 0)
+            
+            with patch.object(self.watcher, '_scan_directory', return_value=([], [])) as mock_scan:
+                self.watcher.check_directory(directory)
+                mock_scan.assert_not_called()
+                
+                (directory / 'photo.jpg').write_bytes(b'data')
+                os.utime(directory, ns=(0, 0))  # Force an mtime change on coarse filesystems
+                self.watcher.check_directory(directory)
+                mock_scan.assert_called_once()
+                
+    def test_when_files_left_unprocessed_then_rescans_next_pass(self):
+        """Should retry a directory whose files were not ready, even if it is unchanged."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            directory = Path(temp_dir)
+            (directory / 'photo.jpg').write_bytes(b'data')
+            
+            with patch.object(self.watcher, '_bulk_read_metadata', return_value={}), \
+                 patch('incoming_watcher._process_file_worker', return_value=False) as mock_worker:
+                self.watcher.check_directory(directory)
+                self.watcher.check_directory(directory)
+                
+            self.assertEqual(mock_worker.call_count, 2)
+            
     # 5. Cycle Processing Tests
     def test_when_running_cycle_then_processes_both_and_directories(self):
         """Should process Both_Incoming and all incoming directories."""
@@ -328,7 +491,15 @@ class TestIncomingWatcher(unittest.TestCase):
                 sleep_time=1
             )
             
-            # Process Both_Incoming
+            # Make the file old enough to be distributed
+            old_time = test_file.stat().st_mtime - 60
+            os.utime(test_file, (old_time, old_time))
+            
+            # First pass only records the file's size/mtime
+            watcher.process_both_incoming()
+            self.assertTrue(test_file.exists())
+            
+            # Second pass sees it unchanged and distributes it
             result = watcher.process_both_incoming()
             
             # Verify file was distributed
@@ -18,6 +18,12 @@ class TestJPEGExifProcessor(unittest.TestCase):
         with self.assertRaises(SystemExit):
             JPEGExifProcessor('/test/input/file.png')
             
+    def test_when_initializing_with_uppercase_jpeg_extension_then_accepts(self):
+        """Should accept .JPEG and .JPG regardless of case."""
+        for name in ('photo.JPEG', 'photo.Jpg'):
+            processor = JPEGExifProcessor(f'/test/input/{name}')
+            self.assertEqual(processor.input_path.name, name)
+
     def test_when_initializing_without_output_then_uses_input_dir(self):
         """Should use input directory as output when no output specified."""
         processor = JPEGExifProcessor(str(self.test_file))
@@ -71,6 +77,17 @@ class TestJPEGExifProcessor(unittest.TestCase):
             result = self.processor.process_image()
             self.assertEqual(result, self.test_file)
             
+    def test_when_exif_data_supplied_then_process_image_skips_read(self):
+        """Should reuse metadata passed in by the watcher instead of re-reading it."""
+        processor = JPEGExifProcessor(str(self.test_file), exif_data={'EXIF:DateTimeOriginal': '2024:01:01 12:00:00'})
+        with patch.object(processor, 'read_exif') as mock_read, \
+             patch.object(processor, 'rename_file', return_value=self.test_file), \
+             patch.object(processor, '_validate_file_ready', return_value=True):
+
+            processor.process_image()
+
+        mock_read.assert_not_called()
+
     def test_when_file_not_ready_then_raises_value_error(self):
         """Should raise ValueError when file is not ready for processing."""
         with patch.object(self.processor, '_validate_file_ready', return_value=False):
@@ -146,5 +163,22 @@ class TestJPEGExifProcessor(unittest.TestCase):
             self.assertEqual(state, "Test State")
             self.assertEqual(country, "Test Country")
 
+    def test_when_formatting_standard_exif_date_then_slices_date_part(self):
+        """Should convert a fixed-layout EXIF timestamp to YYYY_MM_DD."""
+        self.assertEqual(self.processor._format_exif_date('2024:03:28 15:30:00'), '2024_03_28')
+
+    def test_when_formatting_nonstandard_exif_date_then_falls_back_to_split(self):
+        """Should still accept dates without zero-padded fields."""
+        self.assertEqual(self.processor._format_exif_date('2024:3:8 15:30:00'), '2024_3_8')
+
+    def test_when_generating_filename_then_reads_metadata_components_once(self):
+        """Should extract metadata components a single time per filename."""
+        components = ("2024_01_01", "Test Title", "Test Location", "Test City", "Test State", "Test Country")
+        with patch.object(self.processor, 'get_metadata_components', return_value=components) as mock_components:
+            result = self.processor.generate_filename()
+
+        mock_components.assert_called_once()
+        self.assertEqual(result, "2024_01_01_Test_Title_Test_Location_Test_City_Test_State_Test_Country__LRE.jpg")
+
 if __name__ == '__main__':
     unittest.main()
@@ -158,6 +158,32 @@ class TestMetadataExtraction(unittest.TestCase):
         result = self.processor.get_exif_title()
         self.assertEqual(result, 'Beach Miami USA')
 
+    def test_when_getting_location_twice_then_extracts_once_per_exif_read(self):
+        """Should reuse the location tuple until exif_data is replaced."""
+        self.processor.exif_data = {'XMP:City': 'Miami'}
+        with patch.object(self.processor, '_get_exif_field_with_group',
+                          wraps=self.processor._get_exif_field_with_group) as mock_field:
+            first = self.processor.get_location_data()
+            calls = mock_field.call_count
+            self.assertEqual(self.processor.get_location_data(), first)
+            self.assertEqual(mock_field.call_count, calls)
+
+            self.processor.exif_data = {'XMP:City': 'Paris'}
+            self.assertEqual(self.processor.get_location_data()[1], 'Paris')
+
+    def test_when_state_missing_then_falls_back_to_province_state(self):
+        """Should take the state from any group's State before any Province-State."""
+        self.processor.exif_data = {'XMP:State': '', 'IPTC:Province-State': 'Florida'}
+        self.assertEqual(self.processor.get_location_data()[2], 'Florida')
+
+        self.processor.exif_data = {'State': 'Ohio', 'XMP:Province-State': 'Florida'}
+        self.assertEqual(self.processor.get_location_data()[2], 'Ohio')
+
+    def test_when_keywords_repeat_across_groups_then_keeps_first_occurrence(self):
+        """Should merge IPTC and XMP keywords without duplicates, in order."""
+        self.processor.exif_data = {'IPTC:Keywords': 'Beach,Sun', 'XMP:Subject': ['Sun', 'Sea', 'Beach']}
+        self.assertEqual(self.processor._get_base_keywords(), ['Beach', 'Sun', 'Sea'])
+
     def test_when_getting_location_data_then_returns_tuple(self):
         """Should return location data as tuple."""
         self.processor.exif_data = {
@@ -213,6 +239,21 @@ class TestRatingHandling(unittest.TestCase):
         result = self.processor.get_image_rating()
         self.assertEqual(result, 0)
 
+    def test_when_rating_is_digit_string_then_returns_int(self):
+        """Should convert exiftool's string rating to an int."""
+        self.processor.exif_data = {'XMP:Rating': '4'}
+        self.assertEqual(self.processor.get_image_rating(), 4)
+
+    def test_when_rating_is_not_integral_then_returns_zero(self):
+        """Should fall back to 0 for ratings int() cannot parse."""
+        self.processor.exif_data = {'XMP:Rating': '2.5'}
+        self.assertEqual(self.processor.get_image_rating(), 0)
+
+    def test_when_rating_is_non_decimal_digit_then_returns_zero(self):
+        """Should fall back to 0 for digit characters int() rejects, like superscripts."""
+        self.processor.exif_data = {'XMP:Rating': '\u00b2'}
+        self.assertEqual(self.processor.get_image_rating(), 0)
+
 class TestKeywordHandling(unittest.TestCase):
     """Tests for keyword-related methods."""
     
@@ -260,5 +301,13 @@ class TestFileOperations(unittest.TestCase):
         expected = self.test_file.parent / 'test__LRE.mov'
         mock_rename.assert_called_once_with(expected)
 
+    @patch('pathlib.Path.rename')
+    def test_when_name_already_matches_then_skips_rename(self, mock_rename):
+        """Should not touch the filesystem when the generated name is unchanged."""
+        with patch.object(self.processor, 'generate_filename', return_value=self.test_file.name):
+            new_path = self.processor.rename_file()
+        self.assertEqual(new_path, self.test_file)
+        mock_rename.assert_not_called()
+
 if __name__ == '__main__':
     unittest.main()
@@ -5,6 +5,8 @@ from unittest.mock import patch, Mock, MagicMock
 from pathlib import Path
 from datetime import datetime, timedelta
 import fcntl
+import errno
+import tempfile
 import time
 
 from transfers.transfer import Transfer, ValidationResult
@@ -85,6 +87,42 @@ class TestTransfer(unittest.TestCase):
             mock_mkdir.assert_called_once_with(parents=True, exist_ok=True)
             mock_rename.assert_called_once_with(self.dest_dir / self.test_file.name)
             
+    def test_when_transferring_to_same_destination_then_creates_directory_once(self):
+        """Should only call mkdir for the first file moved into a destination."""
+        with patch.object(Path, 'rename'), \
+             patch.object(Path, 'mkdir') as mock_mkdir:
+            self.assertTrue(self.transfer._perform_transfer(Path('/test/a__LRE.jpg'), self.dest_dir))
+            self.assertTrue(self.transfer._perform_transfer(Path('/test/b__LRE.jpg'), self.dest_dir))
+            
+        mock_mkdir.assert_called_once_with(parents=True, exist_ok=True)
+        
+    def test_when_known_destination_disappears_then_recreates_it_next_time(self):
+        """Should forget a destination whose rename failed with FileNotFoundError."""
+        with patch.object(Path, 'rename', side_effect=[FileNotFoundError, None]), \
+             patch.object(Path, 'mkdir') as mock_mkdir:
+            self.assertFalse(self.transfer._perform_transfer(Path('/test/a__LRE.jpg'), self.dest_dir))
+            self.assertTrue(self.transfer._perform_transfer(Path('/test/a__LRE.jpg'), self.dest_dir))
+            
+        self.assertEqual(mock_mkdir.call_count, 2)
+            
+    def test_when_destination_on_other_volume_then_falls_back_to_move(self):
+        """Should copy across volumes with shutil.move when rename fails with EXDEV."""
+        with patch.object(Path, 'exists', return_value=True), \
+             patch.object(Path, 'stat') as mock_stat, \
+             patch('builtins.open', MagicMock()), \
+             patch('fcntl.flock'), \
+             patch.object(Path, 'rename', side_effect=OSError(errno.EXDEV, "Cross-device link")), \
+             patch.object(Path, 'mkdir'), \
+             patch('transfers.transfer.shutil.move') as mock_move:
+             
+            # Mock file as being old enough
+            mock_stat.return_value.st_mtime = time.time() - (MIN_FILE_AGE + 10)
+            
+            result = self.transfer.transfer_file(self.test_file)
+            
+            self.assertTrue(result)
+            mock_move.assert_called_once_with(str(self.test_file), str(self.dest_dir / self.test_file.name))
+            
     def test_when_checking_file_age_with_invalid_file_then_returns_false(self):
         """Should return False when checking age of invalid/inaccessible file."""
         with patch.object(Path, 'stat', side_effect=OSError):
@@ -105,18 +143,28 @@ class TestTransfer(unittest.TestCase):
             result = self.transfer._is_file_old_enough(self.test_file)
             self.assertFalse(result)
             
-    def test_when_getting_file_access_with_timeout_then_returns_false(self):
-        """Should return False after timeout when can't get file access."""
+    def test_when_file_cannot_be_opened_then_returns_false_without_waiting(self):
+        """Should return False straight away when the file can't be opened."""
         with patch('builtins.open', side_effect=IOError), \
              patch('time.sleep') as mock_sleep:
-             
-            start_time = time.time()
             result = self.transfer._can_access_file(self.test_file, timeout=1)
-            end_time = time.time()
             
             self.assertFalse(result)
-            self.assertTrue(end_time - start_time >= 1)
-            mock_sleep.assert_called()
+            mock_sleep.assert_not_called()
+            
+    def test_when_getting_file_access_with_timeout_then_returns_false(self):
+        """Should give up once the timeout passes while another holder keeps the lock."""
+        with tempfile.NamedTemporaryFile() as locked_file:
+            with open(locked_file.name, 'rb') as holder:
+                fcntl.flock(holder.fileno(), fcntl.LOCK_EX)
+                
+                start_time = time.monotonic()
+                result = self.transfer._can_access_file(Path(locked_file.name), timeout=0.2)
+                elapsed = time.monotonic() - start_time
+                
+            self.assertFalse(result)
+            self.assertGreaterEqual(elapsed, 0.2)
+            self.assertLess(elapsed, 2)
             
     def test_when_getting_file_access_with_success_then_returns_true(self):
         """Should return True when file access is obtained."""
@@ -1,3 +1,4 @@
+import tempfile
 import unittest
 from unittest.mock import patch, MagicMock
 from pathlib import Path
@@ -36,32 +37,32 @@ class TestTransferWatcher(unittest.TestCase):
     # 3. check_directory Tests
     def test_when_directory_does_not_exist_then_logs_warning(self):
         watcher = TransferWatcher(directories=self.test_dirs)
-        mock_dir = MagicMock(spec=Path)
-        mock_dir.exists.return_value = False
-        with self.assertLogs(watcher.logger, level='WARNING') as log:
-            watcher.check_directory(mock_dir)
-            self.assertIn(f"Directory does not exist: {mock_dir}", log.output[0])
+        with tempfile.TemporaryDirectory() as temp_dir:
+            missing_dir = Path(temp_dir) / 'missing'
+            with self.assertLogs(watcher.logger, level='WARNING') as log:
+                watcher.check_directory(missing_dir)
+                self.assertIn(f"Directory does not exist: {missing_dir}", log.output[0])
 
     def test_when_directory_exists_then_processes_files(self):
         watcher = TransferWatcher(directories=self.test_dirs)
-        mock_dir = MagicMock(spec=Path)
-        mock_dir.exists.return_value = True
-        mock_file1 = MagicMock(spec=Path)
-        mock_file2 = MagicMock(spec=Path)
-        mock_dir.glob.return_value = [mock_file1, mock_file2]
-        with patch.object(watcher, 'process_batch', return_value=[True, True]) as mock_process_batch:
-            watcher.check_directory(mock_dir)
-            # Should call process_batch with both files
-            mock_process_batch.assert_called_once_with([mock_file1, mock_file2])
+        with tempfile.TemporaryDirectory() as temp_dir:
+            directory = Path(temp_dir)
+            for name in ('a__LRE.jpg', 'b__LRE.mov', 'c.jpg', 'd__LRE'):
+                (directory / name).touch()
+            (directory / 'e__LRE.dir').mkdir()
+            with patch.object(watcher, 'process_batch', return_value=[True, True]) as mock_process_batch:
+                watcher.check_directory(directory)
+                # Should call process_batch once with just the two __LRE files
+                mock_process_batch.assert_called_once()
+                self.assertEqual(sorted(f.name for f in mock_process_batch.call_args[0][0]),
+                                 ['a__LRE.jpg', 'b__LRE.mov'])
 
     def test_when_exception_occurs_then_logs_error(self):
         watcher = TransferWatcher(directories=self.test_dirs)
-        mock_dir = MagicMock(spec=Path)
-        mock_dir.exists.return_value = True
-        mock_dir.glob.side_effect = Exception("Test error")
-        with self.assertLogs(watcher.logger, level='ERROR') as log:
-            watcher.check_directory(mock_dir)
-            self.assertIn("Error checking directory", log.output[0])
+        with patch('watchers.transfer_watcher.os.scandir', side_effect=PermissionError("Test error")):
+            with self.assertLogs(watcher.logger, level='ERROR') as log:
+                watcher.check_directory(Path('/test/dir1'))
+                self.assertIn("Error checking directory", log.output[0])
 
     # 4. Batch Processing Tests
     def test_when_process_batch_with_valid_files_then_processes_successfully(self):
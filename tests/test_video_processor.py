@@ -9,8 +9,10 @@ import os
 import logging
 from io import StringIO
 import types
+import tempfile
 from utils.exiftool import ExifTool
 from processors.video_processor import VideoProcessor
+import processors.video_processor as video_processor
 from config import XML_NAMESPACES, VIDEO_PATTERN, LRE_SUFFIX, METADATA_FIELDS
 
 class TestVideoProcessor(unittest.TestCase):
@@ -69,7 +71,7 @@ class TestErrorHandling(TestVideoProcessor):
     def test_when_xml_parse_error_then_returns_none(self):
         """Should return None when XML parsing fails."""
         processor = VideoProcessor('/test/video.mp4')
-        with patch('xml.etree.ElementTree.parse') as mock_parse:
+        with patch('processors.video_processor.ET.parse') as mock_parse:
             mock_parse.side_effect = ET.ParseError("XML parse error")
             result = processor.read_metadata_from_xmp()
             self.assertEqual(result, (None, None, None, None, (None, None, None)))
@@ -162,7 +164,7 @@ class TestMetadataReading(TestVideoProcessor):
         # Mock Path.exists to return True for XMP file
         with patch('pathlib.Path.exists', return_value=True):
             # Create a temporary XMP file
-            with patch('xml.etree.ElementTree.parse') as mock_parse:
+            with patch('processors.video_processor.ET.parse') as mock_parse:
                 # Set up mock to return our sample XML
                 mock_parse.return_value = ET.ElementTree(ET.fromstring(self.sample_xml))
                 
@@ -317,7 +319,7 @@ class TestXMPProcessing(TestVideoProcessor):
         ''')
         
         with patch('pathlib.Path.exists', return_value=True), \
-             patch('xml.etree.ElementTree.parse') as mock_parse, \
+             patch('processors.video_processor.ET.parse') as mock_parse, \
              patch.object(self.processor.exiftool, 'read_date_from_xmp', return_value='2024:01:01 12:00:00'):
             mock_parse.return_value.getroot.return_value = rdf
             result = self.processor.read_metadata_from_xmp()
@@ -345,7 +347,7 @@ class TestXMPProcessing(TestVideoProcessor):
         ''')
         
         with patch('pathlib.Path.exists', return_value=True), \
-             patch('xml.etree.ElementTree.parse') as mock_parse, \
+             patch('processors.video_processor.ET.parse') as mock_parse, \
              patch.object(self.processor.exiftool, 'read_date_from_xmp', return_value=None):
             mock_parse.return_value.getroot.return_value = rdf
             result = self.processor.read_metadata_from_xmp()
@@ -384,7 +386,7 @@ class TestXMPProcessing(TestVideoProcessor):
         ''')
         
         with patch('pathlib.Path.exists', return_value=True), \
-             patch('xml.etree.ElementTree.parse') as mock_parse, \
+             patch('processors.video_processor.ET.parse') as mock_parse, \
              patch.object(self.processor.exiftool, 'read_date_from_xmp', return_value=None):
             mock_parse.return_value.getroot.return_value = rdf
             result = self.processor.read_metadata_from_xmp()
@@ -402,7 +404,7 @@ class TestXMPProcessing(TestVideoProcessor):
         
         # Mock ExifTool
         with patch.object(processor, 'exiftool') as mock_exiftool:
-            mock_exiftool.write_metadata.return_value = True
+            mock_exiftool.write_and_read_metadata.return_value = (True, {})
             
             # Write metadata
             metadata = (
@@ -417,8 +419,8 @@ class TestXMPProcessing(TestVideoProcessor):
             # Verify result
             self.assertTrue(result)
             
-            # Get fields passed to write_metadata
-            fields = mock_exiftool.write_metadata.call_args[0][1]
+            # Get fields passed to write_and_read_metadata
+            fields = mock_exiftool.write_and_read_metadata.call_args[0][1]
             
             # Check that fields are properly dashed
             self.assertIn("-ItemList:Title", fields)
@@ -436,7 +438,7 @@ class TestXMPProcessing(TestVideoProcessor):
         
         # Mock ExifTool
         with patch.object(processor, 'exiftool') as mock_exiftool:
-            mock_exiftool.write_metadata.return_value = True
+            mock_exiftool.write_and_read_metadata.return_value = (True, {})
             
             # Write metadata with some empty fields
             metadata = (
@@ -451,8 +453,8 @@ class TestXMPProcessing(TestVideoProcessor):
             # Verify result
             self.assertTrue(result)
             
-            # Get fields passed to write_metadata
-            fields = mock_exiftool.write_metadata.call_args[0][1]
+            # Get fields passed to write_and_read_metadata
+            fields = mock_exiftool.write_and_read_metadata.call_args[0][1]
             
             # Check that only title fields are present
             title_fields = {k: v for k, v in fields.items() if "Title" in k}
@@ -470,7 +472,7 @@ class TestXMPProcessing(TestVideoProcessor):
         
         # Mock ExifTool
         with patch.object(processor, 'exiftool') as mock_exiftool:
-            mock_exiftool.write_metadata.return_value = True
+            mock_exiftool.write_and_read_metadata.return_value = (True, {})
             
             # Write metadata with partial location
             metadata = (
@@ -485,8 +487,8 @@ class TestXMPProcessing(TestVideoProcessor):
             # Verify result
             self.assertTrue(result)
             
-            # Get fields passed to write_metadata
-            fields = mock_exiftool.write_metadata.call_args[0][1]
+            # Get fields passed to write_and_read_metadata
+            fields = mock_exiftool.write_and_read_metadata.call_args[0][1]
             
             # Check that location fields are present with just location
             location_fields = {k: v for k, v in fields.items() if "Location" in k}
@@ -1110,6 +1112,86 @@ class TestMetadataVerification(unittest.TestCase):
         self.assertFalse(result)
         self.processor.read_exif.assert_called_once()
 
+    def test_when_verifying_keywords_then_collects_from_every_keyword_tag(self):
+        """Should split, strip and merge keywords across tags and report only missing ones."""
+        self.processor.logger = MagicMock()
+        self.processor.exif_data = {
+            'QuickTime:Keywords': 'test, video',
+            'XMP:Subject': ['Family', 'Trip,  Beach '],
+            'QuickTime:Title': 'missing',
+        }
+        
+        self.assertTrue(self.processor._verify_keywords(['TEST', 'beach', 'missing']))
+        
+        self.processor.logger.warning.assert_any_call("  Missing: ['missing']")
+
+    def test_when_all_keywords_found_then_stops_scanning_metadata(self):
+        """Should not inspect later keyword tags once every expected keyword is found."""
+        self.processor.logger = MagicMock()
+        self.processor.exif_data = {'QuickTime:Keywords': 'test, Video', 'XMP:Subject': 'other'}
+        
+        self.assertTrue(self.processor._verify_keywords(['test', 'video']))
+        
+        logged = [str(c) for c in self.processor.logger.debug.call_args_list]
+        self.assertFalse(any('XMP:Subject' in message for message in logged))
+        self.processor.logger.warning.assert_not_called()
+
+    def test_when_verification_fails_then_lists_each_candidate_key_once(self):
+        """Should report every matching key once even though the config repeats tag names."""
+        self.processor.logger = MagicMock()
+        self.processor.exif_data = {'XMP:City': 'Paris', 'QuickTime:City': 'Lyon', 'XMP:Title': 'Nice'}
+        
+        self.assertFalse(self.processor._verify_location_component('Nice', 'city'))
+        
+        logged = [c.args[0] for c in self.processor.logger.error.call_args_list]
+        self.assertEqual(logged[-2:], ["  XMP:City: Paris", "  QuickTime:City: Lyon"])
+
+    def test_when_verifying_date_then_ignores_subseconds_and_timezone(self):
+        """Should match the written date after normalizing the read-back value."""
+        self.processor.exif_data = {
+            'QuickTime:Title': '2025:03:27 22:59:37',
+            'XMP:DateTimeOriginal': '2025:03:27 22:59:37.25+02:00',
+        }
+        
+        self.assertTrue(self.processor._verify_date('2025:03:27 22:59:37'))
+        self.assertFalse(self.processor._verify_date('2024:01:01 00:00:00'))
+        self.assertEqual(video_processor._normalize_date('2025:03:27 22:59:37-07:00'), '2025:03:27 22:59:37')
+
+    def test_when_normalizing_dashed_date_then_keeps_month_and_day(self):
+        """Should convert dashes to colons without mistaking '-0' for a timezone."""
+        self.assertEqual(video_processor._normalize_date('2025-03-07 08:05:09-05:00'), '2025:03:07 08:05:09')
+        self.assertEqual(video_processor._normalize_date('2025-03-07T08:05:09.5Z'), '2025:03:07 08:05:09')
+
+    def test_when_looking_up_field_items_then_indexes_exif_data_once(self):
+        """Should match keys by tag name and reuse the index until exif_data changes."""
+        self.processor.exif_data = {'XMP:Title': 'A', 'QuickTime:Title': 'B', 'XMP:City': 'Paris'}
+
+        self.assertEqual(self.processor._exif_items_for('title'), [('XMP:Title', 'A'), ('QuickTime:Title', 'B')])
+        index = self.processor._tag_index_cache
+        self.assertEqual(self.processor._exif_items_for('city'), [('XMP:City', 'Paris')])
+        self.assertIs(self.processor._tag_index_cache, index)
+
+        self.processor.exif_data = {'City': 'Lyon'}
+        self.assertEqual(self.processor._exif_items_for('city'), [('City', 'Lyon')])
+
+class TestDebugLog(TestVideoProcessor):
+    """Tests for the per-category debug logging helper."""
+
+    def test_when_debug_type_enabled_then_passes_args_to_logger(self):
+        """Should hand arguments to the logger for lazy formatting."""
+        settings = {'debug': True, 'log_verification': True}
+        with patch.dict(video_processor.VIDEO_DEBUG_SETTINGS, settings):
+            self.processor._debug_log("Missing keywords: %s", 'log_verification', ['a'])
+
+        self.processor.logger.debug.assert_called_once_with("[VIDEO DEBUG] Missing keywords: %s", ['a'])
+
+    def test_when_debug_type_disabled_then_does_not_log(self):
+        """Should skip the logger entirely for a disabled debug type."""
+        with patch.dict(video_processor.VIDEO_DEBUG_SETTINGS, {'debug': True, 'log_verification': False}):
+            self.processor._debug_log("Missing keywords: %s", 'log_verification', ['a'])
+
+        self.processor.logger.debug.assert_not_called()
+
 class TestXMPErrorHandling(TestVideoProcessor):
     """Tests for error handling in XMP processing."""
     
@@ -1127,7 +1209,7 @@ class TestXMPErrorHandling(TestVideoProcessor):
         
         # Mock ET.parse to raise an exception with specific message
         error_msg = "XML parse error"
-        with patch('xml.etree.ElementTree.parse', side_effect=ET.ParseError(error_msg)):
+        with patch('processors.video_processor.ET.parse', side_effect=ET.ParseError(error_msg)):
             result = processor.read_metadata_from_xmp()
             
             self.assertEqual(result, (None, None, None, None, (None, None, None)))
@@ -1206,5 +1288,228 @@ class TestXMPErrorHandling(TestVideoProcessor):
         self.assertEqual(result, expected)
         processor.logger.error.assert_called_once_with(f"Invalid date format: {date_str}")
 
+class TestMetadataReadBack(unittest.TestCase):
+    """Test cases for reading written metadata back from the video."""
+    
+    def setUp(self):
+        """Set up test environment."""
+        self.processor = VideoProcessor('/test/video.mp4')
+        self.processor.logger = Mock()
+        self.processor.exiftool = Mock()
+        
+    def test_when_writing_and_verifying_then_reads_video_once(self):
+        """Should share a single read-back between verification and the written-field log."""
+        metadata = ("Test Title", None, None, None, None, None)
+        self.processor.exiftool.write_and_read_metadata.return_value = (
+            True, {'XMP:Title': 'Test Title', 'DC:Title': 'Test Title'})
+        
+        result = self.processor._write_and_verify_metadata(metadata)
+        
+        self.assertTrue(result)
+        self.processor.exiftool.write_and_read_metadata.assert_called_once()
+        # The verify read comes back with the write; nothing is read beforehand
+        self.processor.exiftool.read_all_metadata.assert_not_called()
+
+    def test_when_logging_written_fields_then_reports_each_field_once(self):
+        """Should log each matching read-back field once and summarize what was found."""
+        metadata = ("Title", ['a', 'b'], None, "Caption", None, None)
+        video_metadata = {
+            'XMP:Title': 'Title',
+            'QuickTime:Description': 'Caption',
+            'ItemList:Description': 'Other',
+            'XMP:Subject': ['a', 'b'],
+            'QuickTime:Duration': '5 s',
+        }
+
+        self.processor._verify_written_metadata(metadata, video_metadata)
+
+        logged = [c.args[0] % c.args[1:] for c in self.processor.logger.warning.call_args_list]
+        self.assertEqual(sum('Caption field' in line for line in logged), 2)
+        self.assertEqual(sum('Title field' in line for line in logged), 1)
+        self.assertIn("  ✅ Title: FOUND", logged)
+        self.assertIn("  ✅ Keywords: FOUND", logged)
+        self.assertIn("  ✅ Caption: FOUND", logged)
+
+class TestFindDescription(unittest.TestCase):
+    """Test cases for locating the rdf:Description element."""
+
+    RDF = '{http://www.w3.org/1999/02/22-rdf-syntax-ns#}'
+
+    def setUp(self):
+        self.processor = VideoProcessor('/test/video.mp4')
+
+    def test_when_root_is_xmpmeta_then_finds_description(self):
+        """Should find the Description under x:xmpmeta/rdf:RDF."""
+        root = ET.Element('{adobe:ns:meta/}xmpmeta')
+        description = ET.SubElement(ET.SubElement(root, f'{self.RDF}RDF'), f'{self.RDF}Description')
+        self.assertIs(self.processor._find_description(root), description)
+
+    def test_when_root_is_rdf_then_finds_description(self):
+        """Should also accept sidecars whose root is rdf:RDF."""
+        root = ET.Element(f'{self.RDF}RDF')
+        description = ET.SubElement(root, f'{self.RDF}Description')
+        self.assertIs(self.processor._find_description(root), description)
+
+    def test_when_no_description_then_returns_none(self):
+        """Should return None when the XMP has no Description."""
+        self.assertIsNone(self.processor._find_description(ET.Element(f'{self.RDF}RDF')))
+
+class TestCompiledPaths(unittest.TestCase):
+    """Test cases for the precompiled XMP search paths."""
+
+    XMP = (
+        '<rdf:Description xmlns:rdf="http://www.w3.org/1999/02/22-rdf-syntax-ns#" '
+        'xmlns:dc="http://purl.org/dc/elements/1.1/">'
+        '<dc:title><rdf:Alt><rdf:li xml:lang="fr">Titre</rdf:li>'
+        '<rdf:li xml:lang="x-default">Title</rdf:li></rdf:Alt></dc:title>'
+        '<dc:subject><rdf:Bag><rdf:li>one</rdf:li><rdf:li>two</rdf:li></rdf:Bag></dc:subject>'
+        '</rdf:Description>'
+    )
+
+    def test_when_searching_stdlib_element_then_uses_element_path(self):
+        """Should fall back to find/findall for ElementTree elements."""
+        rdf = ET.fromstring(self.XMP)
+        self.assertEqual([e.text for e in video_processor.SUBJECT_BAG_XPATH.findall(rdf)], ['one', 'two'])
+        self.assertEqual(video_processor.TITLE_ALT_DEFAULT_XPATH.find(rdf).text, 'Title')
+        self.assertIsNone(video_processor.CAPTION_ALT_XPATH.find(rdf))
+
+    @unittest.skipIf(video_processor._LXML_ELEMENT is None, "lxml not installed")
+    def test_when_searching_lxml_element_then_matches_element_path(self):
+        """Should return the same elements from the compiled XPath as from findall."""
+        rdf = video_processor.ET.fromstring(self.XMP)
+        for compiled in (video_processor.SUBJECT_BAG_XPATH, video_processor.TITLE_ALT_XPATH,
+                         video_processor.TITLE_ALT_DEFAULT_XPATH, video_processor.CAPTION_ALT_XPATH):
+            self.assertEqual(compiled.findall(rdf), rdf.findall(compiled.path))
+            self.assertIs(compiled.find(rdf), rdf.find(compiled.path))
+
+    LOCATIONS = (
+        '<rdf:RDF xmlns:rdf="http://www.w3.org/1999/02/22-rdf-syntax-ns#" '
+        'xmlns:photoshop="http://ns.adobe.com/photoshop/1.0/">'
+        '<rdf:Description photoshop:City=""/>'
+        '<rdf:Description photoshop:Country="USA" photoshop:State="Texas"/>'
+        '</rdf:RDF>'
+    )
+
+    def test_when_first_description_lacks_location_then_photoshop_lookup_skips_it(self):
+        """Should return the first Description with a non-empty photoshop location attribute."""
+        parsers = [ET.fromstring]
+        if video_processor._LXML_ELEMENT is not None:
+            parsers.append(video_processor.ET.fromstring)
+        processor = VideoProcessor('/test/video.mp4')
+        for parse in parsers:
+            with self.subTest(parser=parse.__module__):
+                self.assertEqual(processor._get_photoshop_location(parse(self.LOCATIONS)),
+                                 ('Texas', None, 'USA'))
+                self.assertIsNone(video_processor.GPS_DESCRIPTION.find(parse(self.LOCATIONS)))
+
+class TestDateFromRdf(unittest.TestCase):
+    """Test cases for reading the capture date from the parsed sidecar."""
+
+    HEADER = ('<x:xmpmeta xmlns:x="adobe:ns:meta/"><rdf:RDF '
+              'xmlns:rdf="http://www.w3.org/1999/02/22-rdf-syntax-ns#" '
+              'xmlns:exif="http://ns.adobe.com/exif/1.0/">')
+    FOOTER = '</rdf:RDF></x:xmpmeta>'
+
+    def setUp(self):
+        self.processor = VideoProcessor('/test/video.mp4')
+
+    def test_when_date_is_attribute_then_formats_like_exiftool(self):
+        """Should drop fractional seconds and timezone from an attribute value."""
+        root = ET.fromstring(self.HEADER + '<rdf:Description/>'
+                             '<rdf:Description exif:DateTimeOriginal="2024-03-28T15:30:05.25-05:00"/>'
+                             + self.FOOTER)
+        self.assertEqual(self.processor._get_date_from_rdf(root), '2024:03:28 15:30:05')
+
+    def test_when_date_is_element_then_reads_its_text(self):
+        """Should also accept the date written as a child element."""
+        root = ET.fromstring(self.HEADER + '<rdf:Description>'
+                             '<exif:DateTimeOriginal>2024-03-28T15:30:05</exif:DateTimeOriginal>'
+                             '</rdf:Description>' + self.FOOTER)
+        self.assertEqual(self.processor._get_date_from_rdf(root), '2024:03:28 15:30:05')
+
+    def test_when_date_is_partial_then_returns_none(self):
+        """Should leave dates without a full time to exiftool."""
+        root = ET.fromstring(self.HEADER + '<rdf:Description exif:DateTimeOriginal="2024-03-28"/>'
+                             + self.FOOTER)
+        self.assertIsNone(self.processor._get_date_from_rdf(root))
+
+    def test_when_reading_xmp_with_date_then_skips_exiftool(self):
+        """Should not run exiftool for a date already present in the tree."""
+        root = ET.fromstring(self.HEADER + '<rdf:Description exif:DateTimeOriginal="2024-03-28T15:30:05"/>'
+                             + self.FOOTER)
+        self.processor._xmp_available = True
+        with patch('processors.video_processor.ET.parse', return_value=ET.ElementTree(root)), \
+             patch.object(self.processor.exiftool, 'read_date_from_xmp') as mock_read_date:
+            metadata = self.processor.read_metadata_from_xmp()
+
+        self.assertEqual(metadata[2], '2024:03:28 15:30:05')
+        mock_read_date.assert_not_called()
+
+class TestVideoReadTags(unittest.TestCase):
+    """Test cases for restricting video metadata reads."""
+
+    def test_when_reading_exif_then_requests_only_written_and_verified_tags(self):
+        """Should ask ExifTool for just the tags the processor writes or verifies."""
+        processor = VideoProcessor('/test/video.mp4')
+        processor.exiftool = Mock()
+
+        processor.read_exif()
+
+        tags = processor.exiftool.read_all_metadata.call_args[1]['tags']
+        self.assertIn('XMP:Title', tags)
+        self.assertIn('QuickTime:Keywords', tags)
+        self.assertIn('XMP:GPSLatitude', tags)
+        self.assertEqual(len(tags), len(set(tags)))
+
+class TestXmpSidecarResolution(unittest.TestCase):
+    """Tests for locating the XMP sidecar once per processor."""
+
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.directory = Path(self.temp_dir.name)
+        self.video = self.directory / 'clip.mov'
+        self.video.touch()
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def test_when_sidecar_uses_full_name_then_resolves_it(self):
+        """Should find clip.mov.xmp when clip.xmp does not exist."""
+        sidecar = self.directory / 'clip.mov.xmp'
+        sidecar.touch()
+
+        processor = VideoProcessor(str(self.video))
+
+        self.assertTrue(processor._xmp_available)
+        self.assertEqual(processor.xmp_file, sidecar)
+
+    def test_when_resolving_again_then_does_not_probe_filesystem(self):
+        """Should reuse the path found during initialization."""
+        (self.directory / 'clip.xmp').touch()
+        processor = VideoProcessor(str(self.video))
+
+        with patch('pathlib.Path.is_file') as mock_is_file:
+            self.assertEqual(processor._resolve_xmp_path(), self.directory / 'clip.xmp')
+        mock_is_file.assert_not_called()
+
+    def test_when_no_sidecar_then_flags_unavailable(self):
+        """Should mark the XMP as unavailable and keep the default path for logging."""
+        processor = VideoProcessor(str(self.video))
+
+        self.assertFalse(processor._xmp_available)
+        self.assertEqual(processor.xmp_file, self.directory / 'clip.xmp')
+
+    def test_when_sidecar_vanishes_before_cleanup_then_still_renames(self):
+        """Should treat an already deleted sidecar as cleaned up and rename the video."""
+        sidecar = self.directory / 'clip.xmp'
+        sidecar.touch()
+        processor = VideoProcessor(str(self.video))
+        sidecar.unlink()
+        renamed = self.directory / 'clip__LRE.mov'
+
+        with patch.object(processor, 'rename_file', return_value=renamed) as mock_rename:
+            self.assertEqual(processor._cleanup_and_rename(), renamed)
+        mock_rename.assert_called_once()
+
 if __name__ == '__main__':
     unittest.main()
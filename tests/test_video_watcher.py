@@ -0,0 +1,91 @@
+#!/usr/bin/env python3
+
+import tempfile
+import unittest
+from unittest.mock import patch
+from pathlib import Path
+
+from watchers.video_watcher import VideoWatcher, _process_video_worker
+
+class TestVideoWatcher(unittest.TestCase):
+    """Test cases for VideoWatcher."""
+
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.directory = Path(self.temp_dir.name)
+        self.watcher = VideoWatcher([self.directory])
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def _touch(self, *names):
+        for name in names:
+            (self.directory / name).touch()
+
+    def test_when_checking_directory_then_submits_unprocessed_videos_with_xmp(self):
+        """Should match extensions case-insensitively and skip __LRE and sidecar-less videos."""
+        self._touch('a.mov', 'a.xmp', 'B.MOV', 'B.xmp', 'c.Mp4', 'c.Mp4.xmp',
+                    'done__LRE.mov', 'done__LRE.xmp', 'no_sidecar.mov', 'photo.jpg')
+
+        with patch.object(self.watcher, '_process_in_parallel') as mock_parallel:
+            self.watcher.check_directory(self.directory)
+
+        worker, files = mock_parallel.call_args[0]
+        self.assertIs(worker, _process_video_worker)
+        self.assertEqual(sorted(f.name for f in files), ['B.MOV', 'a.mov', 'c.Mp4'])
+
+    def test_when_only_processed_videos_then_submits_nothing(self):
+        """Should not start any work when every video already has the __LRE suffix."""
+        self._touch('done__LRE.mov', 'done__LRE.xmp')
+
+        with patch.object(self.watcher, '_process_in_parallel') as mock_parallel:
+            self.watcher.check_directory(self.directory)
+
+        mock_parallel.assert_not_called()
+
+    def test_when_directory_has_video_extension_then_ignores_it(self):
+        """Should only pick up regular files, not folders named like videos."""
+        (self.directory / 'clips.mov').mkdir()
+        self._touch('clips.xmp')
+
+        with patch.object(self.watcher, '_process_in_parallel') as mock_parallel:
+            self.watcher.check_directory(self.directory)
+
+        mock_parallel.assert_not_called()
+
+    def test_when_directory_missing_then_returns_without_work(self):
+        """Should treat a directory that cannot be listed as empty."""
+        with patch.object(self.watcher, '_process_in_parallel') as mock_parallel:
+            self.watcher.check_directory(self.directory / 'missing')
+
+        mock_parallel.assert_not_called()
+
+    def test_when_checking_directory_then_matches_sidecars_without_stat(self):
+        """Should decide on sidecars from the directory listing alone."""
+        self._touch('a.mov', 'a.XMP', 'b.mp4', 'b.mp4.xmp', 'c.mov')
+
+        real_exists = Path.exists
+
+        def exists(path):
+            if path.suffix == '.xmp':
+                raise AssertionError(f"unexpected stat of {path}")
+            return real_exists(path)
+
+        with patch.object(self.watcher, '_process_in_parallel') as mock_parallel, \
+             patch.object(Path, 'exists', autospec=True, side_effect=exists):
+            self.watcher.check_directory(self.directory)
+
+        _, files = mock_parallel.call_args[0]
+        self.assertEqual(sorted(f.name for f in files), ['a.mov', 'b.mp4'])
+
+    def test_when_event_reports_processed_video_then_skips_processor(self):
+        """Should return before constructing a VideoProcessor for __LRE files."""
+        self._touch('done__LRE.mov', 'done__LRE.xmp')
+
+        with patch('watchers.video_watcher.VideoProcessor') as mock_processor:
+            self.watcher.process_file(self.directory / 'done__LRE.mov')
+
+        mock_processor.assert_not_called()
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,102 @@
+#!/usr/bin/env python3
+
+import logging
+import os
+import tempfile
+import unittest
+from pathlib import Path
+
+from utils.watcher_mixins import DirectorySweepMixin, WorkerPoolMixin
+
+
+class SweepingWatcher(DirectorySweepMixin):
+    def __init__(self):
+        self._dir_mtimes = {}
+
+
+class PooledWatcher(WorkerPoolMixin):
+    def __init__(self, max_workers):
+        self.max_workers = max_workers
+        self._executor = None
+        self._exiftool = None
+        self.logger = logging.getLogger(__name__)
+        self._sequence = 0
+
+    def _get_next_sequence(self):
+        self._sequence += 1
+        return f"{self._sequence:04d}"
+
+
+class RecordingHandler(logging.Handler):
+    def __init__(self):
+        super().__init__()
+        self.records = []
+
+    def emit(self, record):
+        self.records.append(record)
+
+
+def _log_from_worker(file_path, sequence):
+    """Worker that only logs, to check where its records end up."""
+    logging.getLogger('tests.worker').warning("processing %s", file_path)
+    return True
+
+
+class TestDirectorySweepMixin(unittest.TestCase):
+    """Test cases for DirectorySweepMixin."""
+
+    def setUp(self):
+        self.watcher = SweepingWatcher()
+
+    def test_when_directory_unchanged_then_skips_until_mtime_changes(self):
+        """Should skip a second sweep until the directory's mtime moves."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            directory = Path(temp_dir)
+
+            self.assertFalse(self.watcher._directory_unchanged(directory))
+            self.assertTrue(self.watcher._directory_unchanged(directory))
+
+            os.utime(directory, ns=(0, 0))
+            self.assertFalse(self.watcher._directory_unchanged(directory))
+
+    def test_when_directory_forgotten_then_rescans(self):
+        """Should sweep again after _forget_directory even without a change."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            directory = Path(temp_dir)
+            self.watcher._directory_unchanged(directory)
+
+            self.watcher._forget_directory(directory)
+
+            self.assertFalse(self.watcher._directory_unchanged(directory))
+
+    def test_when_directory_missing_then_never_skips(self):
+        """Should not skip, or remember, a directory that cannot be stat'ed."""
+        missing = Path('/test/missing')
+
+        self.assertFalse(self.watcher._directory_unchanged(missing))
+        self.assertNotIn(missing, self.watcher._dir_mtimes)
+
+
+class TestWorkerPoolMixin(unittest.TestCase):
+    """Test cases for WorkerPoolMixin."""
+
+    def test_when_worker_logs_then_parent_handlers_receive_records(self):
+        """Should write log records from pool workers through this process's handlers."""
+        handler = RecordingHandler()
+        root = logging.getLogger()
+        root.addHandler(handler)
+        self.addCleanup(root.removeHandler, handler)
+        watcher = PooledWatcher(max_workers=2)
+
+        try:
+            watcher._process_in_parallel(_log_from_worker, [Path('/test/a.jpg'), Path('/test/b.jpg')])
+        finally:
+            watcher.shutdown()
+
+        messages = sorted(r.getMessage() for r in handler.records if r.name == 'tests.worker')
+        self.assertEqual(messages, ['processing /test/a.jpg', 'processing /test/b.jpg'])
+        self.assertIsNone(watcher._log_listener)
+
+
+if __name__ == '__main__':
+    unittest.main()
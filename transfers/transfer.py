@@ -4,6 +4,9 @@ from pathlib import Path
 import logging
 import time
 import fcntl
+import signal
+import threading
+import errno
 from datetime import datetime, timedelta
 from dataclasses import dataclass
 import shutil
@@ -18,6 +21,8 @@ import sqlite3
 import os
 from pathlib import Path
 
+logger = logging.getLogger(__name__)
+
 @dataclass
 class ValidationResult:
     """
@@ -34,13 +39,18 @@ class Transfer:
     """
     
     def __init__(self):
-        self.logger = logging.getLogger(__name__)
+        self.logger = logger
         self.album_manager = AlbumManager()
+        self._known_dirs = set()  # Destination directories already created by this Transfer
         
     def _can_access_file(self, file_path: Path, timeout: int = 5) -> bool:
         """
         Try to get exclusive access to a file using flock.
         
+        An uncontended file is locked straight away. Otherwise the lock is
+        requested blocking, so the kernel wakes us as soon as the holder lets
+        go, with SIGALRM cutting the wait off at the timeout.
+        
         Args:
             file_path: Path to the file to check
             timeout: Maximum time to wait for lock in seconds
@@ -49,23 +59,64 @@ class Transfer:
             bool: True if exclusive access was obtained, False otherwise
         """
         try:
-            start_time = time.time()
-            while time.time() - start_time < timeout:
+            with open(file_path, 'rb') as f:
                 try:
-                    with open(file_path, 'rb') as f:
-                        # Try non-blocking exclusive lock
-                        fcntl.flock(f.fileno(), fcntl.LOCK_EX | fcntl.LOCK_NB)
-                        # If we get here, we got the lock
-                        fcntl.flock(f.fileno(), fcntl.LOCK_UN)
-                        return True
-                except (IOError, OSError):
-                    # File is locked or inaccessible
-                    time.sleep(0.1)
+                    # Try non-blocking exclusive lock
+                    fcntl.flock(f.fileno(), fcntl.LOCK_EX | fcntl.LOCK_NB)
+                except BlockingIOError:
+                    if not self._wait_for_lock(f.fileno(), timeout):
+                        return False
+                # If we get here, we got the lock
+                fcntl.flock(f.fileno(), fcntl.LOCK_UN)
+                return True
+        except (IOError, OSError):
+            # File is missing or inaccessible
             return False
         except Exception as e:
             self.logger.error(f"Error checking file access: {e}")
             return False
             
+    def _wait_for_lock(self, fd: int, timeout: float) -> bool:
+        """
+        Block until an exclusive flock is granted or the timeout passes.
+        
+        Signal handlers only run on the main thread, so other threads fall
+        back to retrying the non-blocking lock.
+        
+        Args:
+            fd: Descriptor of the open file
+            timeout: Maximum time to wait in seconds
+            
+        Returns:
+            bool: True if the lock is now held, False on timeout
+        """
+        if threading.current_thread() is not threading.main_thread():
+            deadline = time.monotonic() + timeout
+            while time.monotonic() < deadline:
+                time.sleep(0.1)
+                try:
+                    fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+                    return True
+                except BlockingIOError:
+                    pass
+            return False
+            
+        def on_timeout(signum, frame):
+            raise TimeoutError
+            
+        previous_handler = signal.signal(signal.SIGALRM, on_timeout)
+        try:
+            signal.setitimer(signal.ITIMER_REAL, timeout)
+            try:
+                fcntl.flock(fd, fcntl.LOCK_EX)
+            finally:
+                signal.setitimer(signal.ITIMER_REAL, 0)
+            return True
+        except TimeoutError:
+            return False
+        finally:
+            signal.signal(signal.SIGALRM, previous_handler)
+            
     def _is_file_old_enough(self, file_path: Path) -> bool:
         """
         Check if file's last modification time is at least MIN_FILE_AGE seconds old.
@@ -268,6 +319,12 @@ class Transfer:
                 return city
         return None
 
+    def _ensure_directory(self, directory: Path) -> None:
+        """Create a destination directory the first time this Transfer moves a file into it."""
+        if directory not in self._known_dirs:
+            directory.mkdir(parents=True, exist_ok=True)
+            self._known_dirs.add(directory)
+
     def _perform_transfer(self, file_path: Path, dest_dir: Path) -> bool:
         """
         Transfer a file to its destination.
@@ -280,17 +337,29 @@ class Transfer:
                 try:
                     from processors.jpeg_processor import JPEGExifProcessor
                     exif_logger = JPEGExifProcessor(str(file_path))
-                    exif_logger.read_exif()
-                    exif_data_before = exif_logger.exif_data
-                    self.logger.info(f"[EXIF BEFORE IMPORT] {file_path}: {exif_data_before}")
+                    # Every tag, not only the exif_tags processing reads, so the log is complete
+                    exif_data_before = exif_logger.exiftool.read_all_metadata(file_path)
+                    self.logger.info("[EXIF BEFORE IMPORT] %s: %s", file_path, exif_data_before)
                 except Exception as ex:
                     self.logger.warning(f"Could not read EXIF before import: {ex}")
             
             # First move file to destination
-            dest_dir.mkdir(parents=True, exist_ok=True)
+            self._ensure_directory(dest_dir)
             dest_path = dest_dir / file_path.name
             self.logger.debug(f"Moving file from {file_path} to {dest_path}")
-            file_path.rename(dest_path)
+            try:
+                file_path.rename(dest_path)
+            except FileNotFoundError:
+                # The destination may have been removed since it was created;
+                # forget it so the next attempt recreates it
+                self._known_dirs.discard(dest_dir)
+                raise
+            except OSError as e:
+                if e.errno != errno.EXDEV:
+                    raise
+                # Destination is on another volume - copy across, then remove the source
+                self.logger.debug(f"Cross-device move, copying {file_path} to {dest_path}")
+                shutil.move(str(file_path), str(dest_path))
             self.logger.info(f"Successfully moved file to {dest_path}")
             
             if ENABLE_APPLE_PHOTOS and dest_dir in APPLE_PHOTOS_PATHS:
@@ -348,8 +417,9 @@ class Transfer:
                 from processors.jpeg_processor import JPEGExifProcessor
                 if file_path.suffix.lower() in ['.jpg', '.jpeg']:
                     exif_logger = JPEGExifProcessor(str(file_path))
-                    exif_logger.read_exif()
-                    self.logger.info(f"[EXIF BEFORE MOVE] {file_path}: {exif_logger.exif_data}")
+                    # Every tag, not only the exif_tags processing reads, so the log is complete
+                    exif_data = exif_logger.exiftool.read_all_metadata(file_path)
+                    self.logger.info(f"[EXIF BEFORE MOVE] {file_path}: {exif_data}")
             except Exception as ex:
                 self.logger.warning(f"Could not log EXIF before move: {ex}")
             # Move file
@@ -1,66 +1,321 @@
 #!/usr/bin/env python3
 
+import atexit
+import itertools
 import subprocess
 import json
 import logging
+import os
+import queue
 import shutil
 import sys
+import threading
+from functools import lru_cache
 from pathlib import Path
 from typing import Dict, List, Union, Optional, Tuple
 
+try:
+    # Faster JSON decoding for large exiftool dumps; its errors subclass json.JSONDecodeError
+    from orjson import loads as json_loads
+except ImportError:
+    from json import loads as json_loads
+
+# Resolved once at import so each ExifTool() and each exec skips the $PATH walk
+EXIFTOOL_BIN = shutil.which('exiftool')
+
+# JSON read flags; -G keeps the group in each key
+READ_FLAGS = ['-j', '-m', '-G']
+# JPEGs keep every tag we read ahead of the image data, so reads of them can skip
+# trailer scanning and MakerNotes decoding. Other formats (QuickTime videos in
+# particular, where -fast can end the scan before atoms after the media data)
+# are always read in full.
+FAST_READ_SUFFIXES = frozenset({'.jpg', '.jpeg'})
+
+logger = logging.getLogger(__name__)
+
+def _read_flags(file_paths) -> List[str]:
+    """Return the JSON read flags for the files, adding -fast2 only if every file allows it."""
+    if all(os.path.splitext(str(path))[1].lower() in FAST_READ_SUFFIXES for path in file_paths):
+        return READ_FLAGS + ['-fast2']
+    return READ_FLAGS
+
+class ExifToolSession:
+    """
+    A single long-running `exiftool -stay_open` process.
+    
+    Commands are written to the process as argfile lines terminated by
+    -execute, so Perl and the ExifTool modules are loaded once rather than
+    on every call. Results are returned as subprocess.CompletedProcess so
+    callers can treat them exactly like subprocess.run output.
+    
+    Each command is numbered (-executeN, answered by {readyN}) so a reply is
+    only ever matched to the command that produced it.
+    
+    stderr is drained by a background thread while stdout is being read, so
+    a command with a lot of warnings cannot fill the stderr pipe and stall
+    exiftool before it reaches the stdout sentinel.
+    """
+    
+    READY_PREFIX = '{ready'
+    STATUS_PREFIX = '{status'
+    
+    def __init__(self):
+        """Initialize the session; the process is started on first use."""
+        self.logger = logger
+        self._process = None
+        self._lock = threading.Lock()
+        self._numbers = itertools.count(1)
+        self._stderr_lines = None
+        self._stderr_process = None  # Process whose stderr _stderr_lines is fed from
+        
+    def _start(self) -> subprocess.Popen:
+        """Start the exiftool process if it is not already running."""
+        if self._process is None or self._process.poll() is not None:
+            self._process = subprocess.Popen(
+                [EXIFTOOL_BIN, '-stay_open', 'True', '-@', '-'],
+                stdin=subprocess.PIPE,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.PIPE,
+                text=True,
+                encoding='utf-8'
+            )
+        if self._stderr_process is not self._process:
+            self._stderr_lines = queue.Queue()
+            self._stderr_process = self._process
+            threading.Thread(target=self._drain, args=(self._process.stderr, self._stderr_lines),
+                             name='exiftool-stderr', daemon=True).start()
+        return self._process
+        
+    @staticmethod
+    def _drain(stream, lines: queue.Queue) -> None:
+        """Move lines from a stream to a queue until EOF, which is queued as ''."""
+        for line in iter(stream.readline, ''):
+            lines.put(line)
+        lines.put('')
+        
+    def _read_until(self, readline, sentinel: str, prefix: str) -> List[str]:
+        """
+        Read lines up to and including the sentinel line.
+        
+        A different sentinel with the same prefix ends the reply of an earlier
+        command that was abandoned mid-read; the lines up to it are dropped.
+        
+        Args:
+            readline: Callable returning the next line, or '' at EOF
+            sentinel: Line prefix that ends the reply
+            prefix: Prefix shared by every command's sentinel
+        """
+        lines = []
+        while True:
+            line = readline()
+            if not line:
+                raise BrokenPipeError("exiftool exited unexpectedly")
+            lines.append(line)
+            if line.startswith(sentinel):
+                return lines
+            if line.startswith(prefix):
+                lines = []
+            
+    @staticmethod
+    def _fits_argfile(args: List[str]) -> bool:
+        """Return True if every argument survives the argfile round trip unchanged."""
+        # Argfile lines are stripped and '#' lines are comments
+        return not any('\n' in arg or arg != arg.strip() or arg.startswith('#') for arg in args)
+        
+    def _command_lines(self, args: List[str], number: int) -> str:
+        """Format one command as argfile lines ending in a numbered -execute."""
+        command = args + ['-echo4', f'{self.STATUS_PREFIX}{number} ${{status}}}}', f'-execute{number}']
+        return '\n'.join(command) + '\n'
+        
+    def _read_result(self, process: subprocess.Popen, args: List[str], number: int) -> subprocess.CompletedProcess:
+        """Read the output of the pending command with the given number."""
+        status_sentinel = f'{self.STATUS_PREFIX}{number} '
+        stdout = self._read_until(process.stdout.readline, f'{self.READY_PREFIX}{number}}}', self.READY_PREFIX)[:-1]
+        stderr = self._read_until(self._stderr_lines.get, status_sentinel, self.STATUS_PREFIX)
+        
+        status_line = stderr.pop().strip()
+        try:
+            returncode = int(status_line[len(status_sentinel):-1])
+        except ValueError:
+            # Older exiftool builds don't expand ${status}; fall back to the error text
+            returncode = 1 if any(line.startswith('Error') for line in stderr) else 0
+        return subprocess.CompletedProcess(args, returncode, ''.join(stdout), ''.join(stderr))
+        
+    def execute(self, args: List[str]) -> subprocess.CompletedProcess:
+        """
+        Run one exiftool command in the persistent process.
+        
+        Args:
+            args: exiftool arguments, without the executable
+            
+        Returns:
+            subprocess.CompletedProcess: returncode, stdout and stderr of the command
+            
+        Raises:
+            OSError: If the exiftool process cannot be started or dies mid-command
+        """
+        return self.execute_many([args])[0]
+        
+    def execute_many(self, commands: List[List[str]]) -> List[subprocess.CompletedProcess]:
+        """
+        Run several exiftool commands in one round trip.
+        
+        All commands are written before any output is read, and exiftool runs
+        them in order, so a write followed by a read of the same file sees the
+        written values. Commands should be small enough to fit the pipe buffer.
+        
+        Args:
+            commands: Lists of exiftool arguments, without the executable
+            
+        Returns:
+            list: One subprocess.CompletedProcess per command, in order
+            
+        Raises:
+            OSError: If the exiftool process cannot be started or dies mid-command
+        """
+        if not all(self._fits_argfile(args) for args in commands):
+            return [subprocess.run([EXIFTOOL_BIN] + args, capture_output=True, text=True)
+                    for args in commands]
+            
+        with self._lock:
+            try:
+                process = self._start()
+                numbers = [next(self._numbers) for _ in commands]
+                process.stdin.write(''.join(self._command_lines(args, number)
+                                            for args, number in zip(commands, numbers)))
+                process.stdin.flush()
+                return [self._read_result(process, args, number)
+                        for args, number in zip(commands, numbers)]
+            except OSError:
+                self.close()
+                raise
+        
+    def close(self) -> None:
+        """Ask the exiftool process to exit and wait for it."""
+        process, self._process = self._process, None
+        if process is None:
+            return
+        try:
+            if process.poll() is None:
+                process.stdin.write('-stay_open\nFalse\n')
+                process.stdin.flush()
+                process.wait(timeout=5)
+        except (OSError, subprocess.TimeoutExpired):
+            process.kill()
+            
+_session = None
+_session_pid = None
+
+@lru_cache(maxsize=None)
+def _assignment_prefix(field: str) -> str:
+    """Return the '-Tag=' prefix for a field, adding the dash if it is missing."""
+    return (field if field.startswith('-') else f'-{field}') + '='
+
+def get_session() -> ExifToolSession:
+    """Return the process-wide exiftool session, creating it on first use."""
+    global _session, _session_pid
+    # A forked worker must not share its parent's exiftool pipes
+    if _session is None or _session_pid != os.getpid():
+        _session = ExifToolSession()
+        _session_pid = os.getpid()
+        # Send -stay_open False on interpreter exit rather than leaving exiftool to notice EOF
+        atexit.register(_session.close)
+    return _session
+
 class ExifTool:
     """Wrapper for exiftool operations."""
     
     def __init__(self):
         """Initialize ExifTool wrapper."""
-        self.logger = logging.getLogger(__name__)
+        self.logger = logger
         
         # Verify exiftool is available
-        if not shutil.which('exiftool'):
+        if not EXIFTOOL_BIN:
             self.logger.error("exiftool is not installed or not in PATH")
             sys.exit(1)
             
+        self.session = get_session()
         self.default_flags = ['-overwrite_original']
         self.date_format = '%Y:%m:%d %H:%M:%S'
         
-    def read_all_metadata(self, file_path: Union[str, Path]) -> Dict:
+    def read_all_metadata(self, file_path: Union[str, Path], tags: Optional[List[str]] = None) -> Dict:
         """
         Read all metadata from a file using exiftool.
         
         Args:
             file_path: Path to the file
+            tags: Optional tag names to restrict the read to (default: every tag)
             
         Returns:
             dict: Dictionary containing all metadata
         """
         try:
-            cmd = ['exiftool', '-j', '-m', '-G', str(file_path)]
-            result = subprocess.run(cmd, capture_output=True, text=True)
+            result = self.session.execute(self._read_args(file_path, tags))
+            return self._parse_metadata(result)
+        except OSError as e:
+            self.logger.error(f"Error reading metadata: {e}")
+            return {}
             
-            if result.returncode != 0:
-                self.logger.error(f"Error reading metadata: {result.stderr}")
-                return {}
-                
-            data = json.loads(result.stdout)
-            if not data:
-                return {}
-                
-            # Convert any non-string values to strings
-            metadata = data[0]
-            for key, value in metadata.items():
-                if isinstance(value, list):
-                    metadata[key] = [str(item) for item in value]
-                elif not isinstance(value, str):
-                    metadata[key] = str(value)
-                
-            return metadata
+    def _read_args(self, file_path: Union[str, Path], tags: Optional[List[str]] = None) -> List[str]:
+        """Build the arguments for a JSON metadata read."""
+        tag_args = [f'-{tag}' for tag in tags] if tags else []
+        return _read_flags((file_path,)) + tag_args + [str(file_path)]
+        
+    def _parse_metadata(self, result: subprocess.CompletedProcess) -> Dict:
+        """Convert the output of a JSON metadata read to a dictionary of strings."""
+        if result.returncode != 0:
+            self.logger.error(f"Error reading metadata: {result.stderr}")
+            return {}
+            
+        try:
+            data = json_loads(result.stdout)
+        except json.JSONDecodeError as e:
+            self.logger.error(f"Error parsing metadata: {e}")
+            return {}
+        if not data:
+            return {}
+            
+        return self._stringify(data[0])
+        
+    @staticmethod
+    def _stringify(metadata: Dict) -> Dict:
+        """Convert any non-string values (and list items) to strings in place."""
+        for key, value in metadata.items():
+            if isinstance(value, list):
+                metadata[key] = [str(item) for item in value]
+            elif not isinstance(value, str):
+                metadata[key] = str(value)
+        return metadata
+        
+    def read_metadata_batch(self, file_paths: List[Union[str, Path]],
+                            tags: Optional[List[str]] = None) -> Dict[str, Dict]:
+        """
+        Read metadata for several files with a single exiftool command.
+        
+        Args:
+            file_paths: Files to read
+            tags: Optional tag names to restrict the read to (default: every tag)
             
-        except subprocess.CalledProcessError as e:
+        Returns:
+            dict: Metadata keyed by the file path string as passed in; files
+                  exiftool could not read are left out
+        """
+        if not file_paths:
+            return {}
+        try:
+            tag_args = [f'-{tag}' for tag in tags] if tags else []
+            result = self.session.execute(_read_flags(file_paths) + tag_args + [str(p) for p in file_paths])
+        except OSError as e:
             self.logger.error(f"Error reading metadata: {e}")
             return {}
+            
+        # exiftool exits non-zero if any file failed but still reports the others
+        try:
+            data = json_loads(result.stdout) if result.stdout.strip() else []
         except json.JSONDecodeError as e:
             self.logger.error(f"Error parsing metadata: {e}")
             return {}
+        return {entry.get('SourceFile'): self._stringify(entry) for entry in data}
             
     def read_date_from_xmp(self, file_path: Union[str, Path]) -> Optional[str]:
         """
@@ -74,21 +329,23 @@ class ExifTool:
         """
         try:
             cmd = [
-                'exiftool',
                 '-s',
                 '-d', self.date_format,
                 '-DateTimeOriginal',
                 str(file_path)
             ]
-            result = subprocess.run(cmd, capture_output=True, text=True, check=True)
-            
+            result = self.session.execute(cmd)
+            if result.returncode != 0:
+                self.logger.error(f"Error reading date from XMP: {result.stderr}")
+                return None
+                
             if result.stdout:
                 date_line = result.stdout.strip()
                 if ': ' in date_line:
                     return date_line.split(': ')[1].strip()
             return None
             
-        except subprocess.CalledProcessError as e:
+        except OSError as e:
             self.logger.error(f"Error reading date from XMP: {e}")
             return None
             
@@ -104,35 +361,59 @@ class ExifTool:
             bool: True if successful, False otherwise
         """
         try:
-            cmd = ['exiftool'] + self.default_flags
-            
-            # Add each field
-            for field, value in fields.items():
-                if value:
-                    # Convert value to string or list of strings
-                    if isinstance(value, list):
-                        value = [str(item) for item in value]
-                        value = ','.join(value)
-                    else:
-                        value = str(value)
-                        
-                    # Don't add extra dash if field already starts with one
-                    field_arg = field if field.startswith('-') else f'-{field}'
-                    cmd.append(f'{field_arg}={value}')
-                    
-            cmd.append(str(file_path))
-            
-            result = subprocess.run(cmd, capture_output=True, text=True)
+            result = self.session.execute(self._write_args(file_path, fields))
             if result.returncode != 0:
                 self.logger.error(f"Error writing metadata: {result.stderr}")
                 return False
                 
             return True
             
-        except subprocess.CalledProcessError as e:
+        except OSError as e:
             self.logger.error(f"Error writing metadata: {e}")
             return False
             
+    def write_and_read_metadata(self, file_path: Union[str, Path], fields: Dict[str, str],
+                                tags: Optional[List[str]] = None) -> Tuple[bool, Dict]:
+        """
+        Write metadata fields and read the file back in one exiftool round trip.
+        
+        Args:
+            file_path: Path to the file
+            fields: Dictionary of field names and values to write
+            tags: Optional tag names to restrict the read-back to
+            
+        Returns:
+            tuple: (True if the write succeeded, metadata read back after the write)
+        """
+        try:
+            write_result, read_result = self.session.execute_many([
+                self._write_args(file_path, fields),
+                self._read_args(file_path, tags)
+            ])
+        except OSError as e:
+            self.logger.error(f"Error writing metadata: {e}")
+            return False, {}
+            
+        if write_result.returncode != 0:
+            self.logger.error(f"Error writing metadata: {write_result.stderr}")
+            return False, {}
+        return True, self._parse_metadata(read_result)
+            
+    def _write_args(self, file_path: Union[str, Path], fields: Dict[str, str]) -> List[str]:
+        """Build the arguments for writing metadata fields."""
+        assignments = [
+            _assignment_prefix(field) + self._format_value(value)
+            for field, value in fields.items() if value
+        ]
+        return self.default_flags + assignments + [str(file_path)]
+        
+    @staticmethod
+    def _format_value(value) -> str:
+        """Convert a field value, or list of values, to exiftool's string form."""
+        if isinstance(value, list):
+            return ','.join(str(item) for item in value)
+        return str(value)
+            
     def copy_metadata(self, source_path: Union[str, Path], target_path: Union[str, Path]) -> bool:
         """
         Copy all metadata from source to target file.
@@ -145,8 +426,8 @@ class ExifTool:
             bool: True if successful, False otherwise
         """
         try:
-            cmd = ['exiftool'] + self.default_flags + ['-TagsFromFile', str(source_path), str(target_path)]
-            result = subprocess.run(cmd, capture_output=True, text=True)
+            cmd = self.default_flags + ['-TagsFromFile', str(source_path), str(target_path)]
+            result = self.session.execute(cmd)
             
             if result.returncode != 0:
                 self.logger.error(f"Error copying metadata: {result.stderr}")
@@ -154,7 +435,7 @@ class ExifTool:
                 
             return True
             
-        except subprocess.CalledProcessError as e:
+        except OSError as e:
             self.logger.error(f"Error copying metadata: {e}")
             return False
             
@@ -176,13 +457,13 @@ class ExifTool:
             
             # Comprehensive approach with QuickTimeHandler and dual keyword fields
             cmd = [
-                'exiftool', '-m', '-P', '-overwrite_original_in_place', 
+                '-m', '-P', '-overwrite_original_in_place',
                 '-api', 'QuickTimeHandler=1',
                 f'-Keys:Keywords={keywords_str}',
                 f'-ItemList:Keyword={keywords_str}',
                 str(file_path)
             ]
-            result = subprocess.run(cmd, capture_output=True, text=True)
+            result = self.session.execute(cmd)
             
             if result.returncode != 0:
                 self.logger.error(f"Error updating keywords: {result.stderr}")
@@ -190,6 +471,6 @@ class ExifTool:
                 
             return True
             
-        except subprocess.CalledProcessError as e:
+        except OSError as e:
             self.logger.error(f"Error updating keywords: {e}")
             return False
@@ -0,0 +1,115 @@
+#!/usr/bin/env python3
+
+"""Filesystem event notification for the watcher loops, with a polling fallback."""
+
+import logging
+import queue
+import time
+from pathlib import Path
+from typing import Iterable, List, Union
+
+try:
+    from watchdog.events import FileSystemEventHandler
+    from watchdog.observers import Observer
+except ImportError:
+    # watchdog not installed - FileEventMonitor falls back to plain sleeping
+    FileSystemEventHandler = object
+    Observer = None
+
+
+class _QueueingHandler(FileSystemEventHandler):
+    """Pushes the path of every created or moved-in file onto a queue."""
+
+    def __init__(self, events: queue.Queue):
+        super().__init__()
+        self.events = events
+
+    def on_created(self, event):
+        if not event.is_directory:
+            self.events.put(Path(event.src_path))
+
+    def on_moved(self, event):
+        if not event.is_directory:
+            self.events.put(Path(event.dest_path))
+
+
+class FileEventMonitor:
+    """
+    Wakes a watcher loop when files arrive instead of sleeping a fixed interval.
+
+    Uses watchdog (FSEvents on macOS, inotify on Linux) when it is installed.
+    Without it, wait() simply sleeps for the timeout so callers keep their
+    original polling behaviour.
+    """
+
+    def __init__(self, directories: Iterable[Union[str, Path]]):
+        """
+        Initialize the monitor.
+
+        Args:
+            directories: Directories to watch (non-recursively)
+        """
+        self.directories = [Path(d) for d in directories]
+        self.events = queue.Queue()
+        self.logger = logging.getLogger(__name__)
+        self._observer = None
+
+    @property
+    def is_event_driven(self) -> bool:
+        """True while a watchdog observer is delivering events."""
+        return self._observer is not None
+
+    def start(self) -> bool:
+        """
+        Start watching the configured directories.
+
+        Returns:
+            bool: True if event delivery started, False if polling will be used
+        """
+        if Observer is None:
+            self.logger.info("watchdog not installed - falling back to polling")
+            return False
+
+        observer = Observer()
+        handler = _QueueingHandler(self.events)
+        for directory in self.directories:
+            if directory.exists():
+                observer.schedule(handler, str(directory), recursive=False)
+            else:
+                self.logger.warning(f"Cannot watch missing directory: {directory}")
+        observer.start()
+        self._observer = observer
+        return True
+
+    def wait(self, timeout: float) -> List[Path]:
+        """
+        Block until a file event arrives or the timeout elapses.
+
+        Args:
+            timeout: Maximum number of seconds to wait
+
+        Returns:
+            list: Paths reported since the last call (empty on timeout or when polling)
+        """
+        if self._observer is None:
+            time.sleep(timeout)
+            return []
+
+        try:
+            paths = [self.events.get(timeout=timeout)]
+        except queue.Empty:
+            return []
+
+        # Drain the rest of the burst so one wake-up covers it
+        while True:
+            try:
+                paths.append(self.events.get_nowait())
+            except queue.Empty:
+                return paths
+
+    def stop(self) -> None:
+        """Stop the observer thread if one is running."""
+        if self._observer is not None:
+            self._observer.stop()
+            self._observer.join()
+            self._observer = None
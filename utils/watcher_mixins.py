@@ -0,0 +1,231 @@
+#!/usr/bin/env python3
+
+"""Behaviour shared by the directory watchers (watchers.BaseWatcher and IncomingWatcher)."""
+
+from concurrent.futures import Future, ProcessPoolExecutor, as_completed
+import logging
+import multiprocessing
+import os
+import shutil
+from logging.handlers import QueueHandler, QueueListener
+from pathlib import Path
+
+from utils.exiftool import ExifTool
+
+
+def _forward_worker_logs(log_queue, level: int) -> None:
+    """Pool initializer: send a worker's log records to the parent's handlers."""
+    root = logging.getLogger()
+    root.handlers[:] = [QueueHandler(log_queue)]
+    root.setLevel(level)
+
+
+class DirectorySweepMixin:
+    """
+    Skips sweeps of directories whose listing has not changed.
+
+    The host class sets self._dir_mtimes = {} in its __init__.
+    """
+
+    def _directory_unchanged(self, directory: Path) -> bool:
+        """
+        Check whether a directory is unchanged since its last sweep.
+
+        Adding, removing or renaming an entry bumps the directory's mtime, so
+        an unchanged mtime means there is nothing new to pick up. The current
+        mtime is recorded for the next call; sweeps that leave files behind for
+        a retry call _forget_directory so they are not skipped.
+
+        Args:
+            directory: Directory about to be scanned
+
+        Returns:
+            bool: True if the sweep can be skipped
+        """
+        try:
+            mtime = directory.stat().st_mtime_ns
+        except OSError:
+            self._dir_mtimes.pop(directory, None)
+            return False
+        if self._dir_mtimes.get(directory) == mtime:
+            return True
+        self._dir_mtimes[directory] = mtime
+        return False
+
+    def _forget_directory(self, directory: Path) -> None:
+        """Make the next sweep of a directory rescan it regardless of its mtime."""
+        self._dir_mtimes.pop(directory, None)
+
+
+class BothIncomingMixin:
+    """
+    File checks and placement used when distributing Both_Incoming.
+
+    The host class sets self._file_snapshots = {} and self.logger in its __init__.
+    """
+
+    def _is_file_stable(self, file_path: Path, stat_result) -> bool:
+        """
+        Check that a file's size and mtime are unchanged since the previous pass.
+
+        Args:
+            file_path: Path to the file to check
+            stat_result: Current stat result for the file
+
+        Returns:
+            bool: True if the file looked the same on the previous pass
+        """
+        snapshot = (stat_result.st_size, stat_result.st_mtime)
+        previous = self._file_snapshots.get(file_path)
+        self._file_snapshots[file_path] = snapshot
+        return previous == snapshot
+
+    def _link_or_copy(self, source: Path, dest_path: Path) -> str:
+        """
+        Hard-link a file into place, copying only when a link is not possible.
+
+        A hard link shares the data blocks, so distributing a file costs no
+        extra disk writes. The processors replace files rather than editing
+        them in place, so each incoming copy still diverges once processed.
+
+        Args:
+            source: File in Both_Incoming
+            dest_path: Destination path in an incoming directory
+
+        Returns:
+            str: "Linked" or "Copied", describing what was done
+        """
+        try:
+            try:
+                os.link(source, dest_path)
+            except FileExistsError:
+                # Only a leftover from an interrupted pass costs the extra unlink
+                dest_path.unlink()
+                os.link(source, dest_path)
+            return "Linked"
+        except OSError as e:
+            # EXDEV (other volume), or a filesystem without hard link support
+            self.logger.debug(f"Hard link failed for {dest_path} ({e}), copying instead")
+            # copyfile takes the kernel copy fast path (fcopyfile/sendfile); copystat
+            # keeps the source mtime so copies look the same as linked files
+            shutil.copyfile(source, dest_path)
+            shutil.copystat(source, dest_path)
+            return "Copied"
+
+
+class WorkerPoolMixin:
+    """
+    Runs a module-level worker over the files found in a sweep, in a process pool.
+
+    The host class sets self.max_workers, self._executor = None,
+    self._exiftool = None and self.logger in its __init__ and provides
+    _get_next_sequence().
+    """
+
+    # Files per exiftool command in _bulk_read_metadata
+    metadata_batch_size = 200
+    # Writes the pool workers' log records to this process's handlers
+    _log_listener = None
+
+    def _get_executor(self) -> ProcessPoolExecutor:
+        """Return the worker pool, creating it on first use."""
+        if self._executor is None:
+            # Spawned workers (the macOS default) start without the logging set up
+            # by the entry point, so their records are queued back to this process
+            root = logging.getLogger()
+            log_queue = multiprocessing.Queue()
+            self._log_listener = QueueListener(log_queue, *root.handlers, respect_handler_level=True)
+            self._log_listener.start()
+            self._executor = ProcessPoolExecutor(
+                max_workers=self.max_workers,
+                initializer=_forward_worker_logs,
+                initargs=(log_queue, root.level),
+            )
+        return self._executor
+
+    def shutdown(self) -> None:
+        """Shut down the worker pool if one was started."""
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+            self._executor = None
+        if self._log_listener is not None:
+            # Stopping drains whatever the workers logged before they exited
+            self._log_listener.stop()
+            self._log_listener = None
+
+    def _process_in_parallel(self, worker, file_paths, metadata: dict = None) -> list:
+        """
+        Run a module-level worker over several files in the process pool.
+
+        Sequence numbers are assigned here, in the parent, so they stay unique
+        across workers. Each worker process opens its own exiftool session.
+        A single file, or a pool limited to one worker, runs in this process
+        instead, since there is nothing to overlap.
+
+        Args:
+            worker: Picklable callable taking (file_path, sequence), plus the
+                file's metadata when metadata is given
+            file_paths: Files to process
+            metadata: Optional metadata keyed by Path, e.g. from _bulk_read_metadata
+
+        Returns:
+            list: Worker results for the files that succeeded
+        """
+        jobs = [
+            (file_path, (str(file_path), self._get_next_sequence())
+             + ((metadata.get(file_path),) if metadata is not None else ()))
+            for file_path in file_paths
+        ]
+        if self.max_workers <= 1 or len(jobs) < 2:
+            futures = {self._run_inline(worker, args): file_path for file_path, args in jobs}
+        else:
+            executor = self._get_executor()
+            futures = {executor.submit(worker, *args): file_path for file_path, args in jobs}
+
+        results = []
+        for future in as_completed(futures):
+            file_path = futures[future]
+            try:
+                result = future.result()
+            except Exception as e:
+                self.logger.error(f"Error processing {file_path}: {e}")
+                continue
+            self.logger.info("Processed %s: %s", file_path.name, result)
+            results.append(result)
+        return results
+
+    def _bulk_read_metadata(self, file_paths, tags=None) -> dict:
+        """
+        Read metadata for many files with one exiftool command per batch.
+
+        Args:
+            file_paths: Files to read
+            tags: Optional tag names to restrict the read to
+
+        Returns:
+            dict: Metadata keyed by Path; files exiftool could not read are missing
+        """
+        file_paths = list(file_paths)
+        if not file_paths:
+            return {}
+        if self._exiftool is None:
+            self._exiftool = ExifTool()
+
+        metadata = {}
+        for start in range(0, len(file_paths), self.metadata_batch_size):
+            batch = file_paths[start:start + self.metadata_batch_size]
+            by_name = self._exiftool.read_metadata_batch(batch, tags=tags)
+            for file_path in batch:
+                if str(file_path) in by_name:
+                    metadata[file_path] = by_name[str(file_path)]
+        return metadata
+
+    @staticmethod
+    def _run_inline(worker, args) -> Future:
+        """Run a worker in this process, returning its outcome as a completed Future."""
+        future = Future()
+        try:
+            future.set_result(worker(*args))
+        except Exception as e:
+            future.set_exception(e)
+        return future
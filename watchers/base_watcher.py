@@ -3,20 +3,36 @@
 from abc import ABC, abstractmethod
 from pathlib import Path
 import logging
+import os
+import threading
 
-from config import WATCH_DIRS, SLEEP_TIME
+from config import WATCH_DIRS, SLEEP_TIME, WATCHER_MAX_WORKERS
+from utils.watcher_mixins import DirectorySweepMixin, WorkerPoolMixin
 
-class BaseWatcher(ABC):
+logger = logging.getLogger(__name__)
+
+class BaseWatcher(WorkerPoolMixin, DirectorySweepMixin, ABC):
     """Base class for watching directories for media files."""
     
-    # Class-level sequence counter (1-9999)
+    # Class-level sequence counter (1-9999), guarded by _sequence_lock
     _sequence = 0
+    _sequence_lock = threading.Lock()
+    
+    # Lowercase file suffixes picked up by the default check_directory
+    file_suffixes = ('.jpg', '.jpeg', '.mp4', '.mov', '.m4v', '.mpg', '.mpeg')
     
     @classmethod
     def _get_next_sequence(cls) -> str:
-        """Get next sequence number as 4-digit string."""
-        cls._sequence = (cls._sequence % 9999) + 1  # Roll over to 1 after 9999
-        return f"{cls._sequence:04d}"  # Format as 4 digits with leading zeros
+        """
+        Get next sequence number as 4-digit string.
+        
+        Numbers are handed out in the watcher's own process before work is
+        submitted to the pool, so only threads sharing the class need the lock.
+        """
+        with cls._sequence_lock:
+            cls._sequence = (cls._sequence % 9999) + 1  # Roll over to 1 after 9999
+            sequence = cls._sequence
+        return f"{sequence:04d}"  # Format as 4 digits with leading zeros
     
     def __init__(self, directories=None):
         """
@@ -28,9 +44,43 @@ class BaseWatcher(ABC):
         self.directories = [Path(d) for d in (directories or WATCH_DIRS)]
         self.running = False
         self.sleep_time = SLEEP_TIME
-        self.logger = logging.getLogger(__name__)
+        self.max_workers = WATCHER_MAX_WORKERS
+        self.logger = logger
+        self._executor = None
+        self._exiftool = None
+        self._dir_mtimes = {}  # directory -> st_mtime_ns recorded by _directory_unchanged
     
     @abstractmethod
     def process_file(self, file_path: Path):
         """Process a single media file. Must be implemented by subclasses."""
         pass
+
+    def check_directory(self, directory: Path):
+        """
+        Scan a directory once and process every media file in it.
+
+        Uses os.scandir so the name and file-type filtering reuse the data
+        returned with each directory entry instead of a stat per file.
+        Subclasses override this to apply their own file filtering.
+        Directories whose mtime has not changed since a sweep that found
+        nothing are skipped.
+
+        Args:
+            directory: Directory to scan
+        """
+        if self._directory_unchanged(directory):
+            return
+        try:
+            entries = os.scandir(directory)
+        except FileNotFoundError:
+            return
+        found = False
+        with entries:
+            for entry in entries:
+                if (entry.name.lower().endswith(self.file_suffixes)
+                        and entry.is_file(follow_symlinks=False)):
+                    found = True
+                    self.process_file(Path(entry.path))
+        if found:
+            # Files that were not ready yet need a retry even if nothing else changes
+            self._forget_directory(directory)
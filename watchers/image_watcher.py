@@ -2,19 +2,25 @@
 
 from pathlib import Path
 import logging
+import os
 import time
-import shutil
 
 from config import (
     WATCH_DIRS, BOTH_INCOMING, APPLE_PHOTOS_PATHS,
-    JPEG_PATTERN, ALL_PATTERN, ENABLE_APPLE_PHOTOS, APPLE_PHOTOS_WATCHING,
+    ALL_PATTERN, ENABLE_APPLE_PHOTOS, APPLE_PHOTOS_WATCHING,
     WATCHER_QUEUE_SIZE
 )
 from .base_watcher import BaseWatcher
+from utils.watcher_mixins import BothIncomingMixin
 from transfers.transfer import Transfer
-from processors.jpeg_processor import JPEGExifProcessor
+from processors.jpeg_processor import JPEGExifProcessor, JPEG_EXTENSIONS
 
-class ImageWatcher(BaseWatcher):
+# Extension matched case-insensitively by check_directory (same files as JPEG_PATTERN)
+JPEG_EXTENSION = '.jpg'
+
+logger = logging.getLogger(__name__)
+
+class ImageWatcher(BothIncomingMixin, BaseWatcher):
     """
     A class to watch directories for new image files (JPEGs) and process them.
     """
@@ -24,9 +30,10 @@ class ImageWatcher(BaseWatcher):
         super().__init__(directories=watch_dirs)
         self.both_incoming = Path(both_incoming_dir) if both_incoming_dir else None
         self.transfer = Transfer()
-        self.logger = logging.getLogger(__name__)  # Override base logger
+        self.logger = logger  # Override base logger
         self.queue_size = WATCHER_QUEUE_SIZE
         self.processed_count = 0  # Track files processed in current cycle
+        self._file_snapshots = {}  # (size, mtime) of Both_Incoming files from the previous pass
     
     def reset_queue_counter(self):
         """Reset the processed count for a new cycle."""
@@ -55,82 +62,105 @@ class ImageWatcher(BaseWatcher):
         """Check Both_Incoming directory and copy files to individual incoming directories."""
         if not self.both_incoming:
             return False
+        if self._directory_unchanged(self.both_incoming):
+            return False
             
         print(f"🔍 BOTH_INCOMING: Checking {self.both_incoming} for files to distribute...")
         found_files = False
         file_count = 0
+        seen_files = set()
         try:
-            # Iterate through all files in the Both_Incoming directory
-            for file in self.both_incoming.glob("*"):
-                found_files = True  # Mark as found even if locked
+            # List regular files once; the entries' stat results feed the stability check
+            with os.scandir(self.both_incoming) as entries:
+                files = [entry for entry in entries if entry.is_file(follow_symlinks=False)]
+            for entry in files:
+                file = Path(entry.path)
+                found_files = True  # Mark as found even if still being written
                 file_count += 1
-                # Check if the file is open
-                try:
-                    with open(file, 'r+'):
-                        # File is not open, proceed to copy
-                        print(f"   📤 Distributing: {file.name}")
-                        # Copy the file to all incoming directories
-                        for incoming_dir in self.directories:
-                            shutil.copy(file, incoming_dir / file.name)
-                            self.logger.info(f"Copied {file.name} to {incoming_dir.name} directory.")
-                            print(f"      → Copied to {incoming_dir.name}")
-                        
-                        # Delete the original file
-                        file.unlink()
-                        self.logger.info(f"Deleted {file.name} from Both_Incoming.")
-                        print(f"      ✓ Deleted from Both_Incoming")
-                except IOError:
-                    self.logger.warning(f"File {file.name} is currently open. Skipping copy.")
-                    print(f"   ⏳ File {file.name} is locked - will retry later")
+                seen_files.add(file)
+                # Only distribute once size and mtime have held steady across two passes
+                if not self._is_file_stable(file, entry.stat(follow_symlinks=False)):
+                    self.logger.warning(f"File {file.name} is still being written. Skipping copy.")
+                    print(f"   ⏳ File {file.name} is still changing - will retry later")
                     continue  # Skip to the next file
+                    
+                print(f"   📤 Distributing: {file.name}")
+                # Link (or copy) the file into all incoming directories
+                for incoming_dir in self.directories:
+                    action = self._link_or_copy(file, incoming_dir / file.name)
+                    self.logger.info("%s %s to %s directory.", action, file.name, incoming_dir.name)
+                    print(f"      → {action} to {incoming_dir.name}")
+                
+                # Delete the original file
+                file.unlink()
+                self._file_snapshots.pop(file, None)
+                self.logger.info("Deleted %s from Both_Incoming.", file.name)
+                print(f"      ✓ Deleted from Both_Incoming")
         
         except Exception as e:
             self.logger.error(f"Error processing Both_Incoming: {e}")
+            self._forget_directory(self.both_incoming)
             found_files = False
         
+        # Forget snapshots of files that have disappeared since the last pass
+        for stale in set(self._file_snapshots) - seen_files:
+            del self._file_snapshots[stale]
+        
         if file_count == 0:
             print(f"   ✅ No files to distribute from Both_Incoming")
+        else:
+            # Files still being written are rechecked next pass even without new arrivals
+            self._forget_directory(self.both_incoming)
         
         return found_files
     
-    def process_file(self, file_path: Path):
-        """Process a single file."""
-        if not file_path.is_file():
-            return
+    def process_file(self, file_path: Path, exif_data: dict = None, stat_result=None):
+        """
+        Process a single file.
+        
+        Args:
+            file_path: File to process
+            exif_data: Optional metadata already read by check_directory's batched read
+            stat_result: Optional stat result from check_directory's directory entry
+        """
+        if stat_result is None:
+            if not file_path.is_file():
+                return
+            stat_result = file_path.stat()
             
         # Check for zero-byte files
-        if file_path.stat().st_size == 0:
+        if stat_result.st_size == 0:
             self.logger.warning(f"Skipping zero-byte file: {str(file_path)}")
             return
             
         try:
             # Skip Apple Photos directories - let TransferWatcher handle them
             if any(Path(str(file_path)).parent == photos_path for photos_path in APPLE_PHOTOS_PATHS):
-                self.logger.debug(f"Skipping Apple Photos directory file - TransferWatcher will handle: {file_path}")
+                self.logger.debug("Skipping Apple Photos directory file - TransferWatcher will handle: %s", file_path)
                 return
                 
             # For files in regular directories, skip if already processed
             if "__LRE" in file_path.name:
-                self.logger.debug(f"Skipping already processed file: {file_path}")
+                self.logger.debug("Skipping already processed file: %s", file_path)
                 return
                 
             # For files in regular directories, process and transfer
-            self.logger.info(f"Processing file: {file_path}")
+            self.logger.info("Processing file: %s", file_path)
             print(f"      🎨 PROCESSING: {file_path.name}")
             
             # Process the file based on type
-            if file_path.suffix.lower() in ['.jpg', '.jpeg']:
+            if file_path.suffix.lower() in JPEG_EXTENSIONS:
                 sequence = self._get_next_sequence()
                 try:
-                    processor = JPEGExifProcessor(str(file_path), sequence=sequence)
+                    processor = JPEGExifProcessor(str(file_path), sequence=sequence, exif_data=exif_data)
                     new_path = processor.process_image()
-                    self.logger.info(f"Image processed successfully: {new_path}")
+                    self.logger.info("Image processed successfully: %s", new_path)
                     print(f"         ✓ Processed to: {Path(new_path).name}")
                     
-                    # Extract title to check for category format
-                    post_processor = JPEGExifProcessor(str(new_path))
-                    _, title, _, _, _, _ = post_processor.get_metadata_components()
-                    self.logger.info(f"Extracted title: '{title}'")
+                    # Extract title to check for category format; the rename left the
+                    # metadata untouched, so reuse what was read instead of reading again
+                    title = processor.get_exif_title()
+                    self.logger.info("Extracted title: '%s'", title)
                 except ValueError as e:
                     if "not ready for processing" in str(e):
                         self.logger.warning(f"File not ready, skipping: {file_path} - {e}")
@@ -145,39 +175,58 @@ class ImageWatcher(BaseWatcher):
                 return
                 
             # No transfer - let TransferWatcher handle the __LRE files
-            self.logger.info(f"Image processed - TransferWatcher will handle transfer: {new_path}")
+            self.logger.info("Image processed - TransferWatcher will handle transfer: %s", new_path)
                 
         except Exception as e:
             self.logger.error(f"Error processing file {file_path}: {e}")
     
-    def check_directory(self, directory):
+    def check_directory(self, directory: Path):
         """Check a directory for new JPEG files."""
-        directory = Path(directory)
-        if not directory.exists():
-            return
-            
         # Check if we've hit the queue limit
         if self.processed_count >= self.queue_size:
             print(f"   ⚠️  Queue limit reached ({self.queue_size} files) - yielding to other watchers")
             return
             
+        if self._directory_unchanged(directory):
+            return
+            
         # Don't log for Apple Photos directories since check_apple_photos_dirs already does
-        if not any(Path(directory) == photos_path for photos_path in APPLE_PHOTOS_PATHS):
-            self.logger.info(f"Checking {directory} for new JPEG files...")
-            print(f"🔍 IMAGE WATCHER: Checking {directory} for new JPEG files... (Queue: {self.processed_count}/{self.queue_size})")
-            # Regular directory - only process JPG files
-            found_count = 0
-            for file in directory.glob(JPEG_PATTERN):
-                if self.processed_count >= self.queue_size:
-                    print(f"   ⚠️  Queue limit reached ({self.queue_size} files) - {found_count} files processed, more files pending")
-                    break
-                found_count += 1
-                print(f"   📷 [{self.processed_count + 1}/{self.queue_size}] Found JPEG: {file.name}")
-                self.process_file(file)
-                self.processed_count += 1
-            if found_count == 0:
-                print(f"   ✅ No new JPEGs to process in {directory.name}")
-        else:
+        if directory in APPLE_PHOTOS_PATHS:
             # Apple Photos directory - skip, let TransferWatcher handle
             self.logger.debug(f"Skipping Apple Photos directory {directory} - TransferWatcher will handle")
+            return
+            
+        # Opening the listing doubles as the existence check
+        try:
+            entries = os.scandir(directory)
+        except FileNotFoundError:
+            return
+            
+        self.logger.info(f"Checking {directory} for new JPEG files...")
+        print(f"🔍 IMAGE WATCHER: Checking {directory} for new JPEG files... (Queue: {self.processed_count}/{self.queue_size})")
+        # Regular directory - only process JPG files
+        found_count = 0
+        # One listing, matching the extension case-insensitively on the entry name
+        with entries:
+            files = [(directory / entry.name, entry) for entry in entries
+                     if entry.name.lower().endswith(JPEG_EXTENSION)
+                     and entry.is_file(follow_symlinks=False)]
+        # Read this pass's unprocessed JPEGs in one exiftool call instead of one per file
+        pending = [f for f, _ in files if "__LRE" not in f.name][:self.queue_size - self.processed_count]
+        metadata = self._bulk_read_metadata(pending, tags=JPEGExifProcessor.exif_tags)
+        for file, entry in files:
+            if self.processed_count >= self.queue_size:
+                print(f"   ⚠️  Queue limit reached ({self.queue_size} files) - {found_count} files processed, more files pending")
+                break
+            found_count += 1
+            print(f"   📷 [{self.processed_count + 1}/{self.queue_size}] Found JPEG: {file.name}")
+            # The entry's stat covers the zero-byte check without another lookup by path
+            self.process_file(file, exif_data=metadata.get(file),
+                              stat_result=entry.stat(follow_symlinks=False))
+            self.processed_count += 1
+        if found_count == 0:
+            print(f"   ✅ No new JPEGs to process in {directory.name}")
+        if pending:
+            # Files left over by the queue limit or not ready yet need a retry
+            self._forget_directory(directory)
     
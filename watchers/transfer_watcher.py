@@ -2,10 +2,13 @@
 
 from pathlib import Path
 import logging
+import os
 
 from config import WATCH_DIRS, SLEEP_TIME, APPLE_PHOTOS_PATHS, ENABLE_APPLE_PHOTOS, WATCHER_QUEUE_SIZE, TRANSFER_BATCH_SIZE
 from transfers import Transfer
 
+logger = logging.getLogger(__name__)
+
 class TransferWatcher:
     """Watches for _LRE files and transfers them to their destination directories, including Apple Photos imports."""
     
@@ -13,7 +16,7 @@ class TransferWatcher:
         self.directories = [Path(d) for d in (directories or WATCH_DIRS)]
         self.running = False
         self.sleep_time = SLEEP_TIME
-        self.logger = logging.getLogger(__name__)
+        self.logger = logger
         self.transfer = Transfer()
         self.queue_size = WATCHER_QUEUE_SIZE
         self.processed_count = 0  # Track files processed in current cycle
@@ -188,9 +191,17 @@ class TransferWatcher:
         Args:
             directory: Directory to check
         """
-        if not directory.exists():
+        try:
+            # One directory read; names and file types come from the listing itself
+            with os.scandir(directory) as entries:
+                lre_files = [Path(entry.path) for entry in entries
+                             if '__LRE.' in entry.name and entry.is_file()]
+        except FileNotFoundError:
             self.logger.warning(f"Directory does not exist: {directory}")
             return
+        except OSError as e:
+            self.logger.error(f"Error checking directory {directory}: {e}")
+            return
             
         try:
             # Check for __LRE files only (both regular and Apple Photos directories)
@@ -199,7 +210,7 @@ class TransferWatcher:
             batch = []
             total_found = 0
             
-            for file_path in directory.glob('*__LRE.*'):
+            for file_path in lre_files:
                 if self.processed_count >= self.queue_size:
                     # Process remaining batch before hitting queue limit
                     if batch:
@@ -4,17 +4,33 @@ import os
 import logging
 from pathlib import Path
 
-from config import WATCH_DIRS, SLEEP_TIME, VIDEO_PATTERN
-from processors.video_processor import VideoProcessor
+from config import WATCH_DIRS, SLEEP_TIME, LRE_SUFFIX
+from processors.video_processor import VideoProcessor, VIDEO_EXTENSIONS
 from watchers.base_watcher import BaseWatcher
 
+def _process_video_worker(file_path: str, sequence: str):
+    """Process one video in a worker process; must be module-level to pickle."""
+    processor = VideoProcessor(file_path, sequence=sequence)
+    return processor.process_video()
+
 class VideoWatcher(BaseWatcher):
     """
     A class to watch directories for video files.
     """
     
-    def _has_xmp_file(self, file_path: Path) -> bool:
-        """Check if a video file has an associated XMP file."""
+    def _has_xmp_file(self, file_path: Path, xmp_names: set = None) -> bool:
+        """
+        Check if a video file has an associated XMP file.
+        
+        Args:
+            file_path: Video file to check
+            xmp_names: Sidecar names listed by check_directory's scan; when given,
+                the check is a set lookup instead of up to two stat calls
+        """
+        if xmp_names is not None:
+            return (file_path.stem + '.xmp' in xmp_names
+                    or file_path.name + '.xmp' in xmp_names)
+            
         # Check for .xmp extension
         xmp_path = file_path.with_suffix('.xmp')
         if xmp_path.exists():
@@ -28,11 +44,13 @@ class VideoWatcher(BaseWatcher):
         """Process a single video file."""
         try:
             file_path = Path(file_path)
+            if file_path.stem.endswith(LRE_SUFFIX):
+                return  # Already processed
             if not self._has_xmp_file(file_path):
                 return  # Skip if no XMP file
             
             # Process video
-            self.logger.info(f"Found new video: {file_path.name}")
+            self.logger.info("Found new video: %s", file_path.name)
             sequence = self._get_next_sequence()
             processor = VideoProcessor(str(file_path), sequence=sequence)
             processor.process_video()
@@ -40,28 +58,42 @@ class VideoWatcher(BaseWatcher):
         except Exception as e:
             self.logger.error(f"Error processing {file_path}: {e}")
     
-    def check_directory(self, directory):
+    def check_directory(self, directory: Path):
         """Check a directory for new video files."""
-        directory = Path(directory)
-        if not directory.exists():
+        if self._directory_unchanged(directory):
+            return
+        # Opening the listing doubles as the existence check
+        try:
+            entries = os.scandir(directory)
+        except FileNotFoundError:
             return
             
         self.logger.info(f"\nChecking {directory} for new video files...")
         video_files = []
-        # Handle both upper and lower case extensions
-        for pattern in VIDEO_PATTERN:
-            video_files.extend(directory.glob(pattern.lower()))
-            video_files.extend(directory.glob(pattern.upper()))
+        xmp_names = set()
+        # One listing, matching extensions case-insensitively on the entry name;
+        # already-processed __LRE videos are dropped before any Path is built, and
+        # sidecar names are collected so the XMP check needs no further syscalls
+        with entries:
+            for entry in entries:
+                stem, ext = os.path.splitext(entry.name)
+                ext = ext.lower()
+                if ext == '.xmp':
+                    xmp_names.add(stem + ext)
+                elif (ext in VIDEO_EXTENSIONS and not stem.endswith(LRE_SUFFIX)
+                        and entry.is_file(follow_symlinks=False)):
+                    video_files.append(directory / entry.name)
         
-        if video_files:
-            self.logger.info(f"Found files: {[str(f) for f in video_files]}")
+        if video_files and self.logger.isEnabledFor(logging.INFO):
+            self.logger.info("Found files: %s", [str(f) for f in video_files])
             
-        for file_path in video_files:
-            # Skip if no XMP file
-            if not self._has_xmp_file(file_path):
-                continue
-                
-            self.logger.info(f"Found new video: {file_path.name}")
-            sequence = self._get_next_sequence()
-            processor = VideoProcessor(str(file_path), sequence=sequence)
-            processor.process_video()
+        # Skip videos without an XMP file
+        ready_files = [f for f in video_files if self._has_xmp_file(f, xmp_names)]
+        for file_path in ready_files:
+            self.logger.info("Found new video: %s", file_path.name)
+        
+        if ready_files:
+            self._process_in_parallel(_process_video_worker, ready_files)
+            # Retry failures next pass; a video still waiting for its XMP is
+            # picked up when the sidecar's arrival changes the directory
+            self._forget_directory(directory)